@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import Optional
 
 try:
@@ -12,11 +13,18 @@ except ImportError:  # pragma: no cover - optional dependency in some envs
     Client = object  # type: ignore
 
 
+@lru_cache(maxsize=4)
+def _cached_client(url: str, key: str) -> "Client":
+    """One shared client (and HTTP connection pool) per URL/key pair."""
+    return create_client(url, key)
+
+
 def get_supabase_client() -> Optional["Client"]:
     """Return a Supabase client if environment variables are configured.
 
     Uses service role key if available (server-side secure), else anon key.
-    Returns None if supabase lib or env vars are not present.
+    Returns None if supabase lib or env vars are not present. The client is
+    created once and reused across calls.
     """
     if create_client is None:
         return None
@@ -24,7 +32,7 @@ def get_supabase_client() -> Optional["Client"]:
     key = os.getenv("SUPABASE_SERVICE_ROLE_KEY") or os.getenv("SUPABASE_ANON_KEY")
     if not url or not key:
         return None
-    return create_client(url, key)
+    return _cached_client(url, key)
 
 
 __all__ = ["get_supabase_client"]
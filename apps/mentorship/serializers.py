@@ -7,9 +7,24 @@ from rest_framework import serializers
 from django.utils import timezone
 from datetime import datetime, timedelta
 from typing import Dict, List
+import time
 import uuid
 
 
+# Booking window bounds, refreshed at most once per minute
+_BOOKING_WINDOW_TTL = 60
+_booking_window = [0.0, None, None]
+
+
+def _booking_window_bounds():
+    """Return (today, today + 90 days), recomputed at most once per minute."""
+    now = time.monotonic()
+    if _booking_window[1] is None or now - _booking_window[0] > _BOOKING_WINDOW_TTL:
+        today = timezone.now().date()
+        _booking_window[:] = [now, today, today + timedelta(days=90)]
+    return _booking_window[1], _booking_window[2]
+
+
 class ExpertiseSerializer(serializers.Serializer):
     """Nested serializer for expertise categories"""
     category = serializers.CharField(max_length=100)
@@ -155,11 +170,11 @@ class BookingSerializer(serializers.Serializer):
     
     def validate_session_date(self, value):
         """Validate session date is in the future"""
-        if value < timezone.now().date():
+        today, three_months = _booking_window_bounds()
+        if value < today:
             raise serializers.ValidationError("Session date must be in the future")
         
         # Cannot book more than 3 months in advance
-        three_months = timezone.now().date() + timedelta(days=90)
         if value > three_months:
             raise serializers.ValidationError("Cannot book more than 3 months in advance")
         
@@ -4,54 +4,669 @@ Supabase Client for Mentorship App
 Official supabase-py client with connection pooling, retry logic, and circuit breaker pattern.
 """
 import os
+import base64
+import copy
+import json
 import logging
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any
+import math
+import threading
+from contextlib import contextmanager
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, List, Any, Tuple
 from functools import wraps
+import random
 import time
+import uuid
+from pathlib import Path
+from types import MappingProxyType
 
 try:
+    import httpx
+    from postgrest.utils import SyncClient as PostgrestSession
+    from storage3.utils import SyncClient as StorageSession
     from supabase import create_client, Client
 except ImportError:
     # Supabase not installed yet
+    httpx = None
     Client = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
+# HTTP connection pools for PostgREST and Storage requests (keep-alive reuse across calls)
+POOL_MAX_CONNECTIONS = int(os.getenv('SUPABASE_POOL_MAX', 50))
+POOL_MAX_KEEPALIVE = int(os.getenv('SUPABASE_POOL_KEEPALIVE', 20))
+POOL_KEEPALIVE_EXPIRY = 30
+POOL_CONNECT_TIMEOUT = 2.0
+POOL_READ_TIMEOUT = 10.0
+
+# Worker pool for issuing independent Supabase requests concurrently
+IO_MAX_WORKERS = int(os.getenv('SUPABASE_IO_WORKERS', 8))
+_io_executor = ThreadPoolExecutor(max_workers=IO_MAX_WORKERS, thread_name_prefix='supabase-io')
+
+# Bulkheads: concurrent Supabase requests allowed per operation class, so a
+# burst of writes or mentor syncs cannot take every worker away from reads
+BULKHEAD_LIMITS = {
+    'read': int(os.getenv('SUPABASE_BULKHEAD_READ', 20)),
+    'write': int(os.getenv('SUPABASE_BULKHEAD_WRITE', 5)),
+    'sync': int(os.getenv('SUPABASE_BULKHEAD_SYNC', 3)),
+}
+BULKHEAD_WAIT_TIMEOUT = 2.0
+_bulkheads = {kind: threading.BoundedSemaphore(limit) for kind, limit in BULKHEAD_LIMITS.items()}
+
+# Faster JSON decoding for PostgREST payloads; stdlib json when orjson is unavailable
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _fast_json_response(response):
+    """httpx response hook: decode this response's body with _json_loads.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so postgrest's
+    empty-body handling keeps working.
+    """
+    response.json = lambda **kwargs: _json_loads(response.content)
+
+
+def run_concurrently(*calls):
+    """Run independent blocking Supabase calls in parallel; results keep call order"""
+    futures = [_io_executor.submit(call) for call in calls]
+    return [future.result() for future in futures]
+
+
+# Member columns flattened onto mentor payloads
+_MEMBER_FIELDS = (
+    'name', 'email', 'phone', 'country', 'city', 'linkedin', 'experience',
+    'areaofexpertise', 'school', 'occupation', 'jobtitle', 'skills', 'location',
+)
+_SEARCH_MEMBER_FIELDS = (
+    'name', 'email', 'phone', 'country', 'city', 'linkedin', 'experience',
+    'areaofexpertise', 'occupation', 'jobtitle', 'skills',
+)
+_RECOMMENDED_MEMBER_FIELDS = ('name', 'email', 'occupation', 'jobtitle', 'areaofexpertise')
+
+# Explicit projections: members is a wide table, only fetch what gets flattened
+_MEMBER_COLUMNS = ','.join(('id',) + _MEMBER_FIELDS)
+_MENTOR_WITH_MEMBER = f'*, member:member_id({_MEMBER_COLUMNS})'
+_MENTOR_WITH_MEMBER_INNER = f'*, member:member_id!inner({_MEMBER_COLUMNS})'
+# Mentor columns shown on list / recommendation cards
+MENTOR_CARD_FIELDS = (
+    'id', 'user_id', 'member_id', 'bio', 'photo_url', 'expertise', 'rating', 'total_sessions',
+    'availability_timezone',
+)
+_RECOMMENDED_MENTOR_COLUMNS = (
+    f"{','.join(MENTOR_CARD_FIELDS)},"
+    f"member:member_id({','.join(_RECOMMENDED_MEMBER_FIELDS)})"
+)
+# Mentor summary embedded in booking payloads
+_BOOKING_MENTOR_COLUMNS = (
+    'id,user_id,photo_url,rating,member:member_id(name,email,jobtitle,occupation)'
+)
+# Expertise entries derived from a member: area of expertise, industry, 3 skills
+MAX_SYNCED_EXPERTISE = 5
+# Columns read when building a mentor profile from a member row
+_MEMBER_SYNC_COLUMNS = 'id,areaofexpertise,industry,skills,experience,occupation,jobtitle'
+# Booking columns returned by the listings; leaves out the reminder/notification
+# flags, metadata jsonb and audit user IDs that only the background tasks read
+_BOOKING_COLUMNS = (
+    'id,mentor_id,mentee_id,session_date,duration_minutes,session_type,status,booking_status,'
+    'topic,notes,mentee_goals,mentor_feedback,rating,meeting_url,meeting_platform,location,'
+    'cancellation_reason,cancelled_by,cancelled_at,created_at,updated_at'
+)
+# Stats payloads returned when the aggregates cannot be read
+_EMPTY_MENTOR_STATS = MappingProxyType({
+    'total_bookings': 0,
+    'completed_sessions': 0,
+    'pending_sessions': 0,
+    'confirmed_sessions': 0,
+    'cancelled_sessions': 0,
+    'upcoming_sessions': 0,
+    'total_reviews': 0,
+    'average_rating': 0,
+    'status_breakdown': MappingProxyType({}),
+})
+_EMPTY_MENTEE_STATS = MappingProxyType({
+    'total_bookings': 0,
+    'completed_sessions': 0,
+    'pending_sessions': 0,
+    'confirmed_sessions': 0,
+    'cancelled_sessions': 0,
+    'upcoming_sessions': 0,
+    'unique_mentors_count': 0,
+    'status_breakdown': MappingProxyType({}),
+})
+# Booking statuses that still hold a mentor's time slot
+_ACTIVE_BOOKING_STATUSES = ('pending', 'confirmed')
+
+
+def _mentor_columns(fields=None, member_fields=None, embed_member=False) -> str:
+    """
+    PostgREST select for mentors: the given columns or every column,
+    optionally with the member embed restricted to `member_fields`. id and
+    rating are always kept (listings order and page by them), and so is
+    member_id, which the embed and the get_members_by_ids fallback join on.
+    """
+    columns = (
+        ','.join(dict.fromkeys(('id', 'rating', 'member_id') + tuple(fields))) if fields else '*'
+    )
+    if not embed_member:
+        return columns
+    return (
+        f"{columns}, member:member_id({','.join(('id',) + tuple(member_fields or _MEMBER_FIELDS))})"
+    )
+
+
+def _copy_rows(rows) -> List[Dict]:
+    """Per-row copies, so callers can't mutate rows held in a cache"""
+    return [dict(row) for row in rows or ()]
+
+
+def _merge_member_fields(mentor: Dict, fields=_MEMBER_FIELDS, keep_member_data=True) -> Dict:
+    """Flatten the embedded `member` row onto a mentor dict"""
+    member_data = mentor.pop('member', None) or {}
+    # One copy of the mentor, filled in place (no intermediate per-row dict)
+    enriched = dict(mentor)
+    get = member_data.get
+    for field in fields:
+        enriched[field] = get(field, '')
+    if keep_member_data:
+        enriched['member_data'] = member_data
+    return enriched
+
+
+_now_iso_cache = (0, '')  # (epoch second, ISO string)
+
+
+def _now_iso() -> str:
+    """UTC ISO-8601 timestamp at one-second resolution, built once per second"""
+    global _now_iso_cache
+    now = int(time.time())
+    second, iso = _now_iso_cache
+    if second != now:
+        iso = datetime.fromtimestamp(now, tz=timezone.utc).isoformat()
+        _now_iso_cache = (now, iso)
+    return iso
+
+
+def _today_iso() -> str:
+    """Current UTC date as YYYY-MM-DD, sliced from the per-second _now_iso string"""
+    return _now_iso()[:10]
+
+
+def _empty_stats(template) -> Dict:
+    """Fresh, mutable copy of an empty stats template"""
+    return {**template, 'status_breakdown': {}}
+
+
+def _log_read_failure(message: str, exc: Exception):
+    """An open circuit is an expected, already-reported outage: warn instead of error"""
+    if isinstance(exc, CircuitOpenError):
+        logger.warning(f"{message}: {exc}")
+    else:
+        logger.error(f"{message}: {exc}")
+
+
+def _count_upcoming(bookings: List[Dict], today: str) -> int:
+    """Active bookings whose session_date (ISO string) falls on or after `today`"""
+    return sum(
+        1 for booking in bookings
+        if booking.get('status') in _ACTIVE_BOOKING_STATUSES
+        and (booking.get('session_date') or '')[:10] >= today
+    )
+
+
+def encode_cursor(*values) -> str:
+    """Opaque, URL-safe keyset pagination cursor for the last row of a page"""
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Optional[list]:
+    """Inverse of encode_cursor; None for a missing or malformed cursor"""
+    if not cursor:
+        return None
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        return None
+
+
+def _is_timestamp(value) -> bool:
+    """An ISO date or timestamp string, as PostgREST returns date/timestamptz columns"""
+    if not isinstance(value, str):
+        return False
+    try:
+        datetime.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _keyset_position(cursor: str, is_valid_key) -> Optional[Tuple[Any, str]]:
+    """
+    (sort key, row id) from a keyset cursor, or None for a missing or
+    malformed one. Both values are interpolated into PostgREST `or` filters,
+    so the key must pass `is_valid_key` and the id must be a UUID.
+    """
+    position = decode_cursor(cursor)
+    if not isinstance(position, list) or len(position) != 2:
+        return None
+    key, row_id = position
+    if not is_valid_key(key) or not isinstance(row_id, str):
+        return None
+    try:
+        return key, str(uuid.UUID(row_id))
+    except ValueError:
+        return None
+
+
+def _is_rating(value) -> bool:
+    """A finite number; bools are ints in Python but not ratings"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+def mentor_cursor_position(cursor: str) -> Optional[Tuple[float, str]]:
+    """(rating, id) of a mentor page cursor, or None if missing or malformed"""
+    return _keyset_position(cursor, _is_rating)
+
+
+def review_cursor_position(cursor: str) -> Optional[Tuple[str, str]]:
+    """(created_at, id) of a mentor review page cursor, or None if missing or malformed"""
+    return _keyset_position(cursor, _is_timestamp)
+
+
+def booking_cursor_position(cursor: str) -> Optional[Tuple[str, str]]:
+    """(session_date, id) of a booking page cursor, or None if missing or malformed"""
+    return _keyset_position(cursor, _is_timestamp)
+
+
+def _listing_count(precise: bool = False, pagination: Dict = None) -> Optional[str]:
+    """
+    PostgREST count mode for paginated listings. 'estimated' counts exactly
+    up to the server's max-rows limit and uses the planner estimate above it,
+    avoiding a second full COUNT(*) over large tables. Keyset pages after the
+    first (a valid cursor) skip counting altogether; the first page had it.
+    """
+    if pagination and mentor_cursor_position(pagination.get('cursor')):
+        return None
+    return 'exact' if precise else 'estimated'
+
+
+# Retry policy for transient Supabase errors (applied inside the circuit breaker)
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.1
+RETRY_MAX_DELAY = 2.0
+RETRYABLE_STATUS_CODES = {'429', '502', '503', '504'}
+# PostgREST could not connect to / lost the database, or timed out waiting for a pool connection
+RETRYABLE_POSTGREST_CODES = {'PGRST000', 'PGRST001', 'PGRST003'}
+# Failures before the request left this process, so no statement can have run
+PRE_SEND_EXCEPTIONS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) if httpx else ()
+# Failures after the request may have reached the database; only safe to repeat reads
+RETRYABLE_EXCEPTIONS = (httpx.TimeoutException, httpx.RemoteProtocolError) if httpx else ()
+
+
+def _is_retryable(exc: Exception, idempotent: bool = False) -> bool:
+    """
+    Errors raised before the statement ran (connect failures, pool timeouts,
+    PostgREST pool errors) are always worth retrying. Read timeouts, dropped
+    connections and 429/5xx gateway responses are retried only for idempotent
+    calls: a write may already have been applied.
+    """
+    if PRE_SEND_EXCEPTIONS and isinstance(exc, PRE_SEND_EXCEPTIONS):
+        return True
+    if getattr(exc, 'code', None) in RETRYABLE_POSTGREST_CODES:
+        return True
+    if not idempotent:
+        return False
+    if RETRYABLE_EXCEPTIONS and isinstance(exc, RETRYABLE_EXCEPTIONS):
+        return True
+    response = getattr(exc, 'response', None)
+    status_code = getattr(exc, 'status_code', None) or getattr(response, 'status_code', None)
+    # postgrest APIError carries the HTTP status in `code` for non-JSON error bodies
+    status_code = status_code or getattr(exc, 'code', None)
+    return str(status_code) in RETRYABLE_STATUS_CODES
+
+
+# SQLSTATE classes caused by the request itself: data exceptions, integrity
+# constraint violations, syntax / undefined object / insufficient privilege
+CLIENT_SQLSTATE_CLASSES = ('22', '23', '42')
+
+
+def _is_client_error(exc: Exception) -> bool:
+    """
+    The request was rejected on its merits (4xx other than 429, constraint
+    violations, bad filters, missing RPCs): Supabase answered, so the circuit
+    breaker should not count it as an outage.
+    """
+    code = str(getattr(exc, 'code', None) or '')
+    if code.startswith(('PGRST1', 'PGRST2')) or (
+        len(code) == 5 and code[:2] in CLIENT_SQLSTATE_CLASSES
+    ):
+        return True
+    response = getattr(exc, 'response', None)
+    status_code = (
+        getattr(exc, 'status_code', None) or getattr(response, 'status_code', None) or code
+    )
+    try:
+        status_code = int(status_code)
+    except (TypeError, ValueError):
+        return False
+    return 400 <= status_code < 500 and status_code != 429
+
+
+def _retry_delay(exc: Exception, attempt: int) -> float:
+    """Exponential backoff with jitter, honouring Retry-After when present"""
+    response = getattr(exc, 'response', None)
+    retry_after = (
+        getattr(response, 'headers', {}).get('retry-after') if response is not None else None
+    )
+    if retry_after:
+        try:
+            return min(float(retry_after), RETRY_MAX_DELAY)
+        except ValueError:
+            pass
+    return min(RETRY_BASE_DELAY * 2 ** attempt, RETRY_MAX_DELAY) * (0.5 + random.random())
+
+
+class StaleWriteError(Exception):
+    """Optimistic-lock conflict: the row changed since the caller read it"""
+
+    def __init__(self, message="Version mismatch - profile was updated by another process"):
+        super().__init__(message)
+
+
+class RpcNotInstalled(Exception):
+    """A database function is not deployed (PostgREST PGRST202); use the client-side path"""
+
+
+class CircuitOpenError(Exception):
+    """A circuit breaker rejected the call without contacting Supabase"""
+
+
+class BulkheadFullError(Exception):
+    """Too many concurrent Supabase requests of one operation class"""
+
+
+@contextmanager
+def _bulkhead(kind: str):
+    """Hold a slot in the `kind` bulkhead, failing fast once the wait times out"""
+    semaphore = _bulkheads[kind]
+    if not semaphore.acquire(timeout=BULKHEAD_WAIT_TIMEOUT):
+        logger.warning(f"Supabase {kind} bulkhead saturated ({BULKHEAD_LIMITS[kind]} in flight)")
+        raise BulkheadFullError(f"Too many concurrent Supabase {kind} requests")
+    try:
+        yield
+    finally:
+        semaphore.release()
+
+
+def _query_kind(query) -> str:
+    """Bulkhead class for a PostgREST builder: GET/HEAD read, anything else writes"""
+    return 'read' if getattr(query, 'http_method', None) in ('GET', 'HEAD') else 'write'
+
 
 class CircuitBreaker:
-    """Simple circuit breaker pattern to prevent cascading failures"""
-    def __init__(self, failure_threshold=3, timeout=30):
+    """
+    Simple circuit breaker pattern to prevent cascading failures.
+    After `timeout` seconds OPEN, up to `half_open_max` concurrent probe calls
+    are admitted; `success_threshold` probe successes close the circuit and
+    any probe failure reopens it.
+    """
+    def __init__(
+        self,
+        failure_threshold=3,
+        timeout=30,
+        max_attempts=RETRY_ATTEMPTS,
+        name='supabase',
+        half_open_max=3,
+        success_threshold=2,
+    ):
         self.failure_threshold = failure_threshold
         self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.name = name
+        self.half_open_max = half_open_max
+        self.success_threshold = success_threshold
         self.failures = 0
         self.last_failure_time = None
+        self.last_success_time = None  # monotonic time of the latest successful call
         self.state = 'CLOSED'  # CLOSED, OPEN, HALF_OPEN
+        self._half_open_in_flight = 0  # probe calls currently running
+        self._half_open_successes = 0
+        self._lock = threading.Lock()
+    
+    def _call_with_retry(self, func, args, kwargs, idempotent):
+        """Retry transient errors with backoff; only the final error escapes"""
+        for attempt in range(self.max_attempts):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if attempt == self.max_attempts - 1 or not _is_retryable(e, idempotent):
+                    raise
+                delay = _retry_delay(e, attempt)
+                logger.warning(
+                    f"Transient Supabase error on {self.name}, retrying in {delay:.2f}s: {e}"
+                )
+                time.sleep(delay)
     
-    def call(self, func, *args, **kwargs):
-        if self.state == 'OPEN':
-            if time.time() - self.last_failure_time > self.timeout:
+    def _before_call(self) -> bool:
+        """
+        Admit a call: CLOSED lets everything through, HALF_OPEN up to
+        half_open_max probes. Returns True if the call is a probe.
+        """
+        with self._lock:
+            if self.state == 'CLOSED':
+                return False
+            if self.state == 'OPEN':
+                if time.monotonic() - self.last_failure_time <= self.timeout:
+                    raise CircuitOpenError(
+                        f"Circuit breaker is OPEN - Supabase {self.name} unavailable"
+                    )
                 self.state = 'HALF_OPEN'
-                logger.info("Circuit breaker entering HALF_OPEN state")
-            else:
-                raise Exception("Circuit breaker is OPEN - Supabase unavailable")
-        
+                self._half_open_in_flight = 0
+                self._half_open_successes = 0
+                logger.info(f"Circuit breaker [{self.name}] entering HALF_OPEN state")
+            elif self._half_open_in_flight >= self.half_open_max:
+                raise CircuitOpenError(
+                    f"Circuit breaker is HALF_OPEN - Supabase {self.name} "
+                    "recovery probes in progress"
+                )
+            self._half_open_in_flight += 1
+            return True
+
+    def call(self, func, *args, idempotent=False, **kwargs):
+        """
+        Run `func` through the breaker. Pass idempotent=True for reads so
+        timeouts and gateway errors are retried; writes are only retried when
+        the request never reached Supabase.
+        """
+        probe = self._before_call()
+
+        # The lock is not held while the request runs, so concurrent calls don't serialize
         try:
-            result = func(*args, **kwargs)
-            if self.state == 'HALF_OPEN':
+            result = self._call_with_retry(func, args, kwargs, idempotent)
+        except Exception as e:
+            if _is_client_error(e):
+                # Supabase is reachable; only give back the probe slot
+                if probe:
+                    with self._lock:
+                        self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                raise
+            with self._lock:
+                self.failures += 1
+                self.last_failure_time = time.monotonic()
+                if probe:
+                    self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                if self.state == 'HALF_OPEN' or (
+                    self.failures >= self.failure_threshold and self.state != 'OPEN'
+                ):
+                    self.state = 'OPEN'
+                    logger.error(
+                        f"Circuit breaker [{self.name}] opened after {self.failures} failures"
+                    )
+            raise
+
+        self.last_success_time = time.monotonic()
+        # Unlocked read first: the common CLOSED-with-no-failures path takes no lock
+        if self.failures or self.state != 'CLOSED':
+            with self._lock:
+                if self.state == 'OPEN':
+                    return result  # another probe failed meanwhile
+                if self.state == 'HALF_OPEN':
+                    if not probe:
+                        # admitted before the circuit opened; not evidence of recovery
+                        return result
+                    self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                    self._half_open_successes += 1
+                    if self._half_open_successes < self.success_threshold:
+                        return result
+                    logger.info(f"Circuit breaker [{self.name}] reset to CLOSED state")
                 self.state = 'CLOSED'
                 self.failures = 0
-                logger.info("Circuit breaker reset to CLOSED state")
-            return result
-        except Exception as e:
-            self.failures += 1
-            self.last_failure_time = time.time()
-            if self.failures >= self.failure_threshold:
-                self.state = 'OPEN'
-                logger.error(f"Circuit breaker opened after {self.failures} failures")
-            raise e
+                self._half_open_in_flight = 0
+                self._half_open_successes = 0
+        return result
+
+    def call_execute(self, query, kind: str = None):
+        """
+        Execute a prebuilt PostgREST query through the breaker (no per-call closure),
+        inside the read or write bulkhead (`kind` overrides the HTTP-method guess).
+        Only reads are retried after the request was sent.
+        """
+        kind = kind or _query_kind(query)
+        with _bulkhead(kind):
+            return self.call(query.execute, idempotent=kind == 'read')
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after `ttl` seconds"""
+    _MISSING = object()
+
+    def __init__(self, maxsize=1024, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key, self._MISSING)
+            if entry is self._MISSING:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def discard_where(self, predicate):
+        """Drop every entry whose (key, value) matches `predicate`"""
+        with self._lock:
+            for key in [k for k, (_, v) in self._data.items() if predicate(k, v)]:
+                del self._data[key]
+
+    def update_where(self, predicate, update):
+        """Replace every matching value with `update(value)`, keeping its expiry"""
+        with self._lock:
+            for key, (expires_at, value) in list(self._data.items()):
+                if predicate(key, value):
+                    self._data[key] = (expires_at, update(value))
+
+    def find(self, predicate):
+        """Return the first unexpired value whose (key, value) matches `predicate`"""
+        now = time.monotonic()
+        with self._lock:
+            for key, (expires_at, value) in self._data.items():
+                if expires_at >= now and predicate(key, value):
+                    return value
+        return None
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class _InFlightCall:
+    """Result slot shared by every caller waiting on one in-flight read"""
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+_inflight: Dict[tuple, _InFlightCall] = {}
+_inflight_lock = threading.Lock()
+
+
+def _freeze(value):
+    """Hashable form of call arguments (filter/pagination dicts, lists)"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+def singleflight(func):
+    """
+    Collapse identical concurrent reads into one Supabase request.
+    The first caller runs the query; callers arriving while it is in flight
+    wait for it and get a deep copy of its result (or its exception).
+    Only for read methods - writes must always execute.
+    """
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        key = (func.__name__, _freeze(args), _freeze(kwargs))
+        try:
+            hash(key)
+        except TypeError:
+            return func(self, *args, **kwargs)
+
+        with _inflight_lock:
+            call = _inflight.get(key)
+            leader = call is None
+            if leader:
+                call = _inflight[key] = _InFlightCall()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = func(self, *args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+            call.event.set()
+    return wrapper
 
 
 class SupabaseMentorshipClient:
@@ -60,18 +675,65 @@ class SupabaseMentorshipClient:
     Implements connection pooling, retry logic, and circuit breaker pattern.
     """
     _instance = None
+    _instance_lock = threading.Lock()
     _client: Optional[Client] = None
-    _circuit_breaker = CircuitBreaker()
+    _circuit_breakers: Dict[str, CircuitBreaker] = {}  # one breaker per table / service
+    _circuit_breakers_lock = threading.Lock()
+    _missing_rpcs = set()  # database functions PostgREST reported as not installed
+    _member_cache = TTLCache(maxsize=2048, ttl=60)  # email -> member UUID
+    _mentor_cache = TTLCache(maxsize=2048, ttl=30)  # (user_id, email) -> mentor
+    _mentor_id_cache = TTLCache(maxsize=4096, ttl=300)  # (user_id, email) -> mentor UUID
+    _expertise_cache = TTLCache(maxsize=1, ttl=600)  # 'all' -> expertise categories
+    _recommended_cache = TTLCache(maxsize=64, ttl=60)  # limit -> recommended mentors
+    _search_count_cache = TTLCache(maxsize=512, ttl=30)  # search filters -> total matches
+    _stats_cache = TTLCache(maxsize=4096, ttl=30)  # ('mentor'|'mentee', id) -> dashboard stats
+    # (method, filters, pagination, precise) -> mentors page
+    _listing_cache = TTLCache(maxsize=512, ttl=30)
+    _availability_cache = TTLCache(maxsize=2048, ttl=30)  # (mentor_id, date_range) -> active slots
+    # read cache key -> last good result, served while a circuit is open
+    _stale_cache = TTLCache(maxsize=1024, ttl=24 * 3600)
+    HEALTH_CHECK_TTL = 5  # seconds a health probe result is reused
+    HEALTH_PASSIVE_WINDOW = 10  # seconds a successful real call vouches for connectivity
+    _health_cache = (0.0, False)  # (monotonic timestamp, healthy)
     
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+        # The instance is published only once initialized, so the hot path is a
+        # single attribute read and there is no per-call __init__ work
+        instance = cls._instance
+        if instance is None:
+            with cls._instance_lock:
+                instance = cls._instance
+                if instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialize_client()
+                    cls._instance = instance
+        return instance
     
-    def __init__(self):
-        if self._client is None:
-            self._initialize_client()
+    def _cb(self, name: str) -> CircuitBreaker:
+        """Get the circuit breaker guarding a single table or service"""
+        breaker = self._circuit_breakers.get(name)
+        if breaker is None:
+            with self._circuit_breakers_lock:
+                breaker = self._circuit_breakers.setdefault(name, CircuitBreaker(name=name))
+        return breaker
     
+    def _call_rpc(self, name: str, params: Dict, table: str, kind: str = 'write'):
+        """
+        Call a database function through the breaker for `table`.
+        RPCs are POSTs, so read-only functions must pass kind='read' for the bulkhead.
+        Raises RpcNotInstalled (and remembers it) if the function is not deployed.
+        """
+        if name in self._missing_rpcs:
+            raise RpcNotInstalled(name)
+        try:
+            return self._cb(table).call_execute(self._client.rpc(name, params), kind=kind)
+        except Exception as e:
+            if getattr(e, 'code', None) != 'PGRST202':
+                raise
+            logger.warning(f"{name} RPC not installed, falling back to client-side queries")
+            self._missing_rpcs.add(name)
+            raise RpcNotInstalled(name) from e
+
     def _initialize_client(self):
         """Initialize Supabase client with credentials from settings"""
         supabase_url = getattr(settings, 'SUPABASE_URL', os.getenv('SUPABASE_URL'))
@@ -93,103 +755,314 @@ class SupabaseMentorshipClient:
             
         try:
             self._client = create_client(supabase_url, supabase_key)
+            self._configure_http_pool()
             logger.info("Supabase client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Supabase client: {e}")
+
+    @staticmethod
+    def _pool_limits():
+        return httpx.Limits(
+            max_connections=POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=POOL_MAX_KEEPALIVE,
+            keepalive_expiry=POOL_KEEPALIVE_EXPIRY,
+        )
+
+    def _configure_http_pool(self):
+        """Swap the PostgREST and Storage sessions for pooled keep-alive HTTP/2 httpx clients"""
+        postgrest = self._client.postgrest
+        old_session = postgrest.session
+        postgrest.session = PostgrestSession(
+            base_url=old_session.base_url,
+            headers=old_session.headers,
+            limits=self._pool_limits(),
+            timeout=httpx.Timeout(POOL_READ_TIMEOUT, connect=POOL_CONNECT_TIMEOUT),
+            follow_redirects=True,
+            http2=True,
+            event_hooks={'response': [_fast_json_response]},
+        )
+        old_session.close()
+
+        # Storage keeps its own (longer) timeout for uploads; only the pool changes
+        storage = self._client.storage
+        old_storage_session = storage.session
+        storage.session = storage._client = StorageSession(
+            base_url=old_storage_session.base_url,
+            headers=old_storage_session.headers,
+            limits=self._pool_limits(),
+            timeout=old_storage_session.timeout,
+            follow_redirects=True,
+            http2=True,
+        )
+        old_storage_session.close()
+        logger.info(
+            f"Supabase HTTP pool configured (max_connections={POOL_MAX_CONNECTIONS}, "
+            f"keepalive={POOL_MAX_KEEPALIVE}, expiry={POOL_KEEPALIVE_EXPIRY}s)"
+        )
+
+    def disconnect(self):
+        """Close pooled HTTP connections held by the Supabase client"""
+        if self._client is None:
+            return
+        try:
+            self._client.postgrest.session.close()
+            self._client.storage.session.close()
+        except Exception as e:
+            logger.warning(f"Error closing Supabase HTTP pool: {e}")
     
     def get_member_id_by_email(self, email: str) -> Optional[str]:
         """Get member UUID from the members table by email."""
+        cache_key = (email or '').strip().lower()
+        cached = self._member_cache.get(cache_key)
+        if cached is not None:
+            return cached
         try:
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('members')
+            response = self._cb('members').call_execute(
+                self._client.table('members')
                 .select('id')
-                .ilike('email', email)
+                .eq('email', cache_key)  # emails are stored lowercase (migration 009)
                 .limit(1)
-                .execute()
             )
             if response.data and len(response.data) > 0:
-                return response.data[0]['id']
+                member_id = response.data[0]['id']
+                self._member_cache.set(cache_key, member_id)
+                return member_id
             return None
         except Exception as e:
             logger.error(f"Error fetching member by email {email}: {e}")
             return None
 
+    def invalidate_mentor(self, mentor_id: str = None, user_id: int = None):
+        """Evict cached mentor lookups for a mentor ID and/or Django user ID"""
+        self._mentor_cache.discard_where(
+            lambda key, mentor: (user_id is not None and key[0] == user_id)
+            or (mentor_id is not None and str(mentor.get('id')) == str(mentor_id))
+        )
+        self._mentor_id_cache.discard_where(
+            lambda key, cached_id: (user_id is not None and key[0] == user_id)
+            or (mentor_id is not None and cached_id == str(mentor_id))
+        )
+        self._listing_cache.clear()
+
+    def invalidate_availability(self, mentor_id: str = None):
+        """Evict cached availability for one mentor, or for everyone if unknown"""
+        if mentor_id is None:
+            self._availability_cache.clear()
+        else:
+            self._availability_cache.discard_where(lambda key, slots: key[0] == str(mentor_id))
+
+    def _stale_result(self, cache_key, exc: Exception):
+        """Last known good result for `cache_key` if `exc` is an open circuit, else None"""
+        if not isinstance(exc, CircuitOpenError):
+            return None
+        stale = self._stale_cache.get(cache_key)
+        if stale is not None:
+            logger.warning(
+                f"Serving stale {cache_key[0]} data while Supabase is unavailable: {exc}"
+            )
+        return stale
+
+    def invalidate_booking_stats(self, booking: Optional[Dict]):
+        """Evict cached dashboard stats for the mentor and mentee of a booking row"""
+        if not booking:
+            return
+        if booking.get('mentor_id'):
+            self._stats_cache.pop(('mentor', str(booking['mentor_id'])))
+        if booking.get('mentee_id'):
+            self._stats_cache.pop(('mentee', str(booking['mentee_id'])))
+
     def is_healthy(self) -> bool:
-        """Health check - test Supabase connectivity"""
-        try:
-            # Simple query to test connection
-            self._client.table('mentorship_expertise').select('count').limit(1).execute()
-            return True
-        except Exception as e:
-            logger.error(f"Supabase health check failed: {e}")
-            return False
+        """
+        Health check - test Supabase connectivity.
+        Probe results are reused for HEALTH_CHECK_TTL seconds. An open circuit
+        breaker reports unhealthy, and any successful request in the last
+        HEALTH_PASSIVE_WINDOW seconds reports healthy, without a round-trip.
+        """
+        now = time.monotonic()
+        checked_at, healthy = self._health_cache
+        if now - checked_at < self.HEALTH_CHECK_TTL:
+            return healthy
+        breakers = list(self._circuit_breakers.values())
+        if self._client is None or any(breaker.state == 'OPEN' for breaker in breakers):
+            healthy = False
+        elif any(
+            breaker.last_success_time is not None
+            and now - breaker.last_success_time < self.HEALTH_PASSIVE_WINDOW
+            for breaker in breakers
+        ):
+            healthy = True
+        else:
+            try:
+                self._ping()
+                healthy = True
+            except Exception as e:
+                logger.error(f"Supabase health check failed: {e}")
+                healthy = False
+        SupabaseMentorshipClient._health_cache = (time.monotonic(), healthy)
+        return healthy
     
+    def _ping(self):
+        """
+        Cheapest round-trip through PostgREST to Postgres: the `ping` RPC
+        (database/migrations/022_ping_rpc.sql), or a HEAD table probe when it
+        is not installed. Not routed through a breaker, so probes never trip one.
+        """
+        if 'ping' not in self._missing_rpcs:
+            try:
+                self._client.rpc('ping', {}).execute()
+                return
+            except Exception as e:
+                if getattr(e, 'code', None) != 'PGRST202':
+                    raise
+                logger.warning("ping RPC not installed, health checks fall back to a table probe")
+                self._missing_rpcs.add('ping')
+        # HEAD request: PostgREST runs the query but sends no body
+        self._client.table('mentorship_expertise').select('id', head=True).limit(1).execute()
+
     # ========== MENTOR OPERATIONS ==========
     
-    def get_mentor_by_user_id(self, user_id: int) -> Optional[Dict]:
-        """Get mentor profile by Django user ID"""
+    def _fetch_mentor_raw(self, user_id: int, email: str = None) -> Optional[Dict]:
+        """
+        Fetch the raw mentor row (with embedded `member`) by Django user ID,
+        falling back to an email lookup through the members table.
+        """
+        response = self._cb('mentors').call_execute(
+            self._client.table('mentors')
+            .select(_MENTOR_WITH_MEMBER)
+            .eq('user_id', user_id)
+            .limit(1)
+            .maybe_single()
+        )
+        if response is not None:
+            return response.data
+
+        if not email:
+            logger.info(f"No mentor profile found for user_id {user_id}")
+            return None
+
+        logger.info(f"No mentor found by user_id {user_id}, trying email lookup: {email}")
+        # Filter on the embedded member so email -> member -> mentor is one request
+        mentor_response = self._cb('mentors').call_execute(
+            self._client.table('mentors')
+            .select(_MENTOR_WITH_MEMBER_INNER)
+            .eq('member.email', email.strip().lower())
+            .limit(1)
+            .maybe_single()
+        )
+        if mentor_response is None:
+            logger.info(f"No mentor profile found for email {email}")
+            return None
+
+        return mentor_response.data
+
+    @singleflight
+    def get_mentor_by_user_id(self, user_id: int, email: str = None) -> Optional[Dict]:
+        """
+        Get mentor profile by user_id or email.
+        If user_id lookup fails and email is provided, lookup through members table.
+        Returns mentor data with member information or None if not found.
+        While the mentors circuit is open the last known profile is returned.
+        """
+        cache_key = (user_id, (email or '').lower())
+        cached = self._mentor_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
         try:
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentors')
-                .select('*')
+            mentor = self._fetch_mentor_raw(user_id, email)
+            if not mentor:
+                return None
+            
+            enriched_mentor = _merge_member_fields(mentor)
+            
+            self._mentor_cache.set(cache_key, enriched_mentor)
+            self._stale_cache.set(('mentor', *cache_key), enriched_mentor)
+            return dict(enriched_mentor)
+            
+        except Exception as e:
+            stale = self._stale_result(('mentor', *cache_key), e)
+            if stale is not None:
+                return dict(stale)
+            _log_read_failure(f"Error fetching mentor by user_id {user_id}", e)
+            return None
+    
+    def get_mentors_by_user_ids(self, user_ids) -> Dict[int, Dict]:
+        """
+        Batch form of get_mentor_by_user_id for lists of users: cached profiles
+        are reused and the rest are fetched with one `user_id IN (...)` query.
+        Users without a mentor profile are left out.
+        Returns: {user_id: mentor_with_member_fields}
+        """
+        mentors = {}
+        missing = []
+        for user_id in dict.fromkeys(user_id for user_id in user_ids if user_id is not None):
+            cached = self._mentor_cache.get((user_id, ''))
+            if cached is not None:
+                mentors[user_id] = dict(cached)
+            else:
+                missing.append(user_id)
+        if not missing:
+            return mentors
+        try:
+            response = self._cb('mentors').call_execute(
+                self._client.table('mentors')
+                .select(_MENTOR_WITH_MEMBER)
+                .in_('user_id', missing)
+            )
+        except Exception as e:
+            _log_read_failure(f"Error batch fetching mentors for users {missing}", e)
+            return mentors
+        for mentor in response.data or []:
+            enriched_mentor = _merge_member_fields(mentor)
+            self._mentor_cache.set((enriched_mentor['user_id'], ''), enriched_mentor)
+            mentors[enriched_mentor['user_id']] = dict(enriched_mentor)
+        return mentors
+
+    def get_mentor_id_by_user_id(self, user_id: int, email: str = None) -> Optional[str]:
+        """
+        Mentor UUID for a Django user (or member email), for ownership checks
+        that don't need the profile. Reads only `id`, and the mapping is cached
+        longer than full profiles since it does not change once created.
+        """
+        cache_key = (user_id, (email or '').lower())
+        mentor_id = self._mentor_id_cache.get(cache_key)
+        if mentor_id is not None:
+            return mentor_id
+        cached = self._mentor_cache.get(cache_key)
+        if cached is not None:
+            return str(cached['id'])
+        try:
+            response = self._cb('mentors').call_execute(
+                self._client.table('mentors')
+                .select('id')
                 .eq('user_id', user_id)
-                .execute()
+                .limit(1)
+                .maybe_single()
             )
-            # Return first result if exists, otherwise None
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            return None
+            if response is None and email:
+                response = self._cb('mentors').call_execute(
+                    self._client.table('mentors')
+                    .select('id,member:member_id!inner(email)')
+                    .eq('member.email', email.strip().lower())
+                    .limit(1)
+                    .maybe_single()
+                )
+            if response is None:
+                return None
+            mentor_id = str(response.data['id'])
+            self._mentor_id_cache.set(cache_key, mentor_id)
+            return mentor_id
         except Exception as e:
-            logger.error(f"Error fetching mentor by user_id {user_id}: {e}")
+            logger.error(f"Error fetching mentor ID for user_id {user_id}: {e}")
             return None
-    
+
     def get_mentor_with_member_data(self, user_id: int, email: str = None) -> Optional[Dict]:
         """
         Get mentor profile with related member data by Django user ID or email.
         If user_id lookup fails and email is provided, lookup through members table.
         """
         try:
-            # First try to query by user_id
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentors')
-                .select('*, member:member_id(*)')
-                .eq('user_id', user_id)
-                .execute()
-            )
-            
-            mentor = None
-            if response.data and len(response.data) > 0:
-                mentor = response.data[0]
-            elif email:
-                logger.info(f"No mentor found by user_id {user_id}, trying email lookup: {email}")
-                # Get member by email first
-                member_response = self._circuit_breaker.call(
-                    lambda: self._client.table('members')
-                    .select('id')
-                    .eq('email', email)
-                    .execute()
-                )
-                
-                if not member_response.data or len(member_response.data) == 0:
-                    logger.info(f"No member found with email {email}")
-                    return None
-                
-                member_id = member_response.data[0]['id']
-                
-                # Now get mentor by member_id
-                mentor_response = self._circuit_breaker.call(
-                    lambda: self._client.table('mentors')
-                    .select('*, member:member_id(*)')
-                    .eq('member_id', member_id)
-                    .execute()
-                )
-                
-                if not mentor_response.data or len(mentor_response.data) == 0:
-                    logger.info(f"No mentor profile found for member_id {member_id}")
-                    return None
-                
-                mentor = mentor_response.data[0]
-            else:
+            mentor = self._fetch_mentor_raw(user_id, email)
+            if not mentor:
                 return None
             
             # Map member fields to mentor profile fields
@@ -210,17 +1083,16 @@ class SupabaseMentorshipClient:
             return mentor
         except Exception as e:
             logger.error(f"Error fetching mentor with member data for user_id {user_id}: {e}")
-            # Fallback to get_mentor_by_user_id with email
-            return self.get_mentor_by_user_id(user_id, email)
+            return None
 
     def create_mentor_profile(self, data: Dict) -> Optional[Dict]:
         """Create new mentor profile"""
         try:
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentors')
+            response = self._cb('mentors').call_execute(
+                self._client.table('mentors')
                 .insert(data)
-                .execute()
             )
+            self.invalidate_mentor(user_id=data.get('user_id'))
             return response.data[0] if response.data else None
         except Exception as e:
             logger.error(f"Error creating mentor profile: {e}")
@@ -229,221 +1101,295 @@ class SupabaseMentorshipClient:
     def update_mentor_profile(self, mentor_id: str, data: Dict, expected_version: int) -> Optional[Dict]:
         """
         Update mentor profile with optimistic locking.
-        Raises exception if version mismatch (concurrent update detected).
+        The version check and the write are one conditional UPDATE ... RETURNING,
+        so callers need no pre-read beyond the version they already hold, and
+        the returned row (with its new `version`) is the read-your-writes copy.
+        Raises StaleWriteError if version mismatch (concurrent update detected).
         """
+        # Versions only grow, so a cached row newer than expected_version proves
+        # the write is stale without a round-trip
+        cached = self._mentor_cache.find(
+            lambda key, mentor: str(mentor.get('id')) == str(mentor_id)
+        )
+        if cached is not None and (cached.get('version') or 0) > expected_version:
+            logger.warning(
+                f"Stale update rejected for mentor {mentor_id} (version {expected_version})"
+            )
+            raise StaleWriteError()
         try:
             # Include version check and increment
             data['version'] = expected_version + 1
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentors')
+            response = self._cb('mentors').call_execute(
+                self._client.table('mentors')
                 .update(data)
                 .eq('id', mentor_id)
                 .eq('version', expected_version)  # Optimistic lock
-                .execute()
             )
             
             if not response.data:
-                raise Exception("Version mismatch - profile was updated by another process")
-            
-            return response.data[0]
+                raise StaleWriteError()
+
+            # Fold the returned row into cached profiles (their flattened member
+            # fields are unchanged) instead of forcing the next lookup to re-read
+            row = response.data[0]
+            self._mentor_cache.update_where(
+                lambda key, mentor: str(mentor.get('id')) == str(mentor_id),
+                lambda mentor: {**mentor, **row},
+            )
+            self._listing_cache.clear()
+            return row
         except Exception as e:
             logger.error(f"Error updating mentor profile {mentor_id}: {e}")
+            self.invalidate_mentor(mentor_id=mentor_id)
             raise
     
-    def get_all_mentors(self, filters: Dict = None, pagination: Dict = None) -> Dict:
+    @staticmethod
+    def _apply_mentor_filters(query, filters: Dict = None):
+        """Apply the id / expertise / min_rating mentor list filters"""
+        if not filters:
+            return query
+        if 'id' in filters:
+            query = query.eq('id', filters['id'])
+        if filters.get('expertise'):
+            # JSONB contains query
+            query = query.contains('expertise', filters['expertise'])
+        if 'min_rating' in filters:
+            query = query.gte('rating', filters['min_rating'])
+        return query
+
+    @staticmethod
+    def _apply_pagination(query, pagination: Dict = None):
+        """Apply page / page_size pagination as a PostgREST range"""
+        if not pagination:
+            return query
+        page, page_size = pagination.get('page', 1), pagination.get('page_size', 12)
+        start = (page - 1) * page_size
+        return query.range(start, start + page_size - 1)
+
+    @staticmethod
+    def _apply_mentor_page(query, pagination: Dict = None):
+        """
+        Order mentors by rating (id breaks ties, so pages are stable) and page
+        them: by (rating, id) keyset after pagination['cursor'] when given,
+        otherwise by page / page_size range.
+        """
+        pagination = pagination or {}
+        position = mentor_cursor_position(pagination.get('cursor'))
+        if position:
+            rating, mentor_id = position
+            query = query.or_(
+                f'rating.lt.{rating},and(rating.eq.{rating},id.lt.{mentor_id})'
+            ).limit(pagination.get('page_size', 12))
+        else:
+            query = SupabaseMentorshipClient._apply_pagination(query, pagination)
+        return query.order('rating', desc=True).order('id', desc=True)
+
+    @staticmethod
+    def mentor_page_cursor(mentors: List[Dict], page_size: int = None) -> Optional[str]:
+        """
+        Cursor for the mentor page after `mentors`, or None when it was the
+        last page. Unrated rows (the column defaults to 0) can't be keyset
+        positions, so a page ending on one has no cursor either.
+        """
+        if not page_size or len(mentors) < page_size or not _is_rating(mentors[-1].get('rating')):
+            return None
+        return encode_cursor(mentors[-1]['rating'], mentors[-1]['id'])
+
+    @singleflight
+    def get_all_mentors(
+        self,
+        filters: Dict = None,
+        pagination: Dict = None,
+        precise_count: bool = False,
+        fields=None,
+    ) -> Dict:
         """
         Get all approved mentors with optional filters and pagination.
+        `fields` narrows the mentor columns returned (default: all).
+        The total is a planner estimate for large results unless precise_count is set.
+        While the mentors circuit is open the last known page is returned.
         Returns: {'data': [...], 'count': total_count}
         """
+        cache_key = ('all', _freeze(filters), _freeze(pagination), precise_count, _freeze(fields))
+        cached = self._listing_cache.get(cache_key)
+        if cached is not None:
+            return {'data': _copy_rows(cached['data']), 'count': cached['count']}
         try:
-            query = self._client.table('mentors').select('*', count='exact').eq('is_approved', True)
-            
-            # Apply filters
-            if filters:
-                if 'expertise' in filters and filters['expertise']:
-                    # JSONB contains query
-                    query = query.contains('expertise', filters['expertise'])
-                if 'min_rating' in filters:
-                    query = query.gte('rating', filters['min_rating'])
-            
-            # Apply pagination
-            if pagination:
-                page = pagination.get('page', 1)
-                page_size = pagination.get('page_size', 12)
-                start = (page - 1) * page_size
-                end = start + page_size - 1
-                query = query.range(start, end)
+            query = (
+                self._client.table('mentors')
+                .select(_mentor_columns(fields), count=_listing_count(precise_count, pagination))
+                .eq('is_approved', True)
+            )
+            query = self._apply_mentor_page(self._apply_mentor_filters(query, filters), pagination)
             
-            response = self._circuit_breaker.call(lambda: query.execute())
+            response = self._cb('mentors').call_execute(query)
             
-            return {
-                'data': response.data,
+            result = {
+                'data': _copy_rows(response.data),
                 'count': response.count
             }
+            self._listing_cache.set(cache_key, result)
+            self._stale_cache.set(cache_key, result)
+            return {'data': _copy_rows(result['data']), 'count': result['count']}
         except Exception as e:
+            stale = self._stale_result(cache_key, e)
+            if stale is not None:
+                return {'data': _copy_rows(stale['data']), 'count': stale['count']}
             logger.error(f"Error fetching mentors: {e}")
             raise
     
-    def get_mentors_with_member_data(self, filters: Dict = None, pagination: Dict = None) -> Dict:
+    @singleflight
+    def get_mentors_with_member_data(
+        self, filters: Dict = None, pagination: Dict = None, precise_count: bool = False,
+        fields=None, member_fields=None
+    ) -> Dict:
         """
         Get all approved mentors enriched with member data.
         Uses member_id foreign key for direct joining.
+        `fields` / `member_fields` narrow the mentor and member columns (default: all).
+        The total is a planner estimate for large results unless precise_count is set.
+        Results are cached briefly and dropped on any mentor write; while the
+        mentors circuit is open the last known page is returned.
         Returns: {'data': [...], 'count': total_count}
         """
+        cache_key = (
+            'with_member', _freeze(filters), _freeze(pagination), precise_count,
+            _freeze(fields), _freeze(member_fields),
+        )
+        cached = self._listing_cache.get(cache_key)
+        if cached is not None:
+            return {'data': _copy_rows(cached['data']), 'count': cached['count']}
         try:
             # Build the query with member data join
             # Note: Supabase allows foreign key expansion
             query = (
                 self._client.table('mentors')
-                .select('*, member:member_id(*)', count='exact')
+                .select(
+                    _mentor_columns(fields, member_fields, embed_member=True),
+                    count=_listing_count(precise_count, pagination),
+                )
                 .eq('is_approved', True)
             )
             
-            # Apply filters
-            if filters:
-                if 'id' in filters:
-                    query = query.eq('id', filters['id'])
-                if 'expertise' in filters and filters['expertise']:
-                    # JSONB contains query
-                    query = query.contains('expertise', filters['expertise'])
-                if 'min_rating' in filters:
-                    query = query.gte('rating', filters['min_rating'])
-            
-            # Apply pagination
-            if pagination:
-                page = pagination.get('page', 1)
-                page_size = pagination.get('page_size', 12)
-                start = (page - 1) * page_size
-                end = start + page_size - 1
-                query = query.range(start, end)
-            
-            response = self._circuit_breaker.call(lambda: query.execute())
-            
-            # Enrich the data structure
-            enriched_data = []
-            for mentor in response.data:
-                member_data = mentor.pop('member', {}) if mentor.get('member') else {}
-                
-                enriched_mentor = {
-                    **mentor,
-                    'name': member_data.get('name', ''),
-                    'email': member_data.get('email', ''),
-                    'phone': member_data.get('phone', ''),
-                    'country': member_data.get('country', ''),
-                    'city': member_data.get('city', ''),
-                    'linkedin': member_data.get('linkedin', ''),
-                    'experience': member_data.get('experience', ''),
-                    'areaofexpertise': member_data.get('areaofexpertise', ''),
-                    'school': member_data.get('school', ''),
-                    'occupation': member_data.get('occupation', ''),
-                    'jobtitle': member_data.get('jobtitle', ''),
-                    'skills': member_data.get('skills', ''),
-                    'location': member_data.get('location', ''),
-                    'member_data': member_data  # Keep full member data for reference
-                }
-                enriched_data.append(enriched_mentor)
+            query = self._apply_mentor_page(self._apply_mentor_filters(query, filters), pagination)
             
-            return {
-                'data': enriched_data,
-                'count': response.count
-            }
+            response = self._cb('mentors').call_execute(query)
+            mentors, count = response.data, response.count
         except Exception as e:
+            stale = self._stale_result(cache_key, e)
+            if stale is not None:
+                return {'data': _copy_rows(stale['data']), 'count': stale['count']}
             logger.error(f"Error fetching mentors with member data: {e}")
-            # Fallback to old method if new approach fails
-            return self.get_all_mentors(filters, pagination)
+            # Fallback: plain mentor query plus one batched members lookup
+            result = self.get_all_mentors(
+                filters, pagination, precise_count=precise_count, fields=fields
+            )
+            members_by_id = self.get_members_by_ids(m.get('member_id') for m in result['data'])
+            mentors = [
+                {**mentor, 'member': members_by_id.get(mentor.get('member_id'))}
+                for mentor in result['data']
+            ]
+            count = result['count']
+
+        enriched_data = [
+            _merge_member_fields(mentor, member_fields or _MEMBER_FIELDS) for mentor in mentors
+        ]
+        
+        result = {'data': enriched_data, 'count': count}
+        self._listing_cache.set(cache_key, result)
+        self._stale_cache.set(cache_key, result)
+        return {
+            'data': _copy_rows(enriched_data),
+            'count': count
+        }
+
+    def get_members_by_ids(self, member_ids) -> Dict[str, Dict]:
+        """
+        Batch-fetch members by UUID in a single round-trip.
+        Returns: {member_id: member_row}
+        """
+        ids = list(dict.fromkeys(member_id for member_id in member_ids if member_id))
+        if not ids:
+            return {}
+        try:
+            response = self._cb('members').call_execute(
+                self._client.table('members')
+                .select(_MEMBER_COLUMNS)
+                .in_('id', ids)
+            )
+            return {member['id']: member for member in (response.data or [])}
+        except Exception as e:
+            logger.error(f"Error batch fetching members {ids}: {e}")
+            return {}
+
+    def get_members_by_emails(
+        self, emails, columns: str = _MEMBER_COLUMNS, mentors_only: bool = False
+    ) -> Dict[str, Dict]:
+        """
+        Batch-fetch members by email in a single round-trip (emails are stored
+        lowercase, see migration 009). `mentors_only` keeps members whose
+        membershiptype contains 'mentor'. `columns` must include email.
+        Returns: {email: member_row}
+        """
+        try:
+            return self._fetch_members_by_emails(emails, columns, mentors_only)
+        except Exception as e:
+            logger.error(f"Error batch fetching members by email: {e}")
+            return {}
+
+    def _fetch_members_by_emails(self, emails, columns: str, mentors_only: bool) -> Dict[str, Dict]:
+        """get_members_by_emails, but errors propagate instead of reading as no match"""
+        normalized = list(dict.fromkeys(email.strip().lower() for email in emails if email))
+        if not normalized:
+            return {}
+        query = self._client.table('members').select(columns).in_('email', normalized)
+        if mentors_only:
+            query = query.ilike('membershiptype', '%mentor%')
+        response = self._cb('members').call_execute(query)
+        return {member['email']: member for member in (response.data or [])}
     
     def sync_mentor_from_member(self, member_email: str, user_id: int) -> Optional[Dict]:
         """
         Create or update mentor profile based on member data.
         Used for automatic sync when membershiptype contains 'mentor'.
+        Runs as a single `sync_mentor_from_member` RPC (see
+        database/migrations/008_sync_mentor_from_member_rpc.sql) when installed.
+        Concurrent syncs are bounded by the 'sync' bulkhead.
         """
         try:
-            # Check if mentor already exists by user_id
-            existing_mentor = self.get_mentor_by_user_id(user_id)
-            if existing_mentor:
-                logger.info(f"Mentor profile already exists for user_id {user_id}")
-                return existing_mentor
-
-            # Get member data - use ilike for case-insensitive match on membershiptype
-            member_response = self._circuit_breaker.call(
-                lambda: self._client.table('members')
-                .select('*')
-                .ilike('email', member_email)
-                .execute()
-            )
-
-            if not member_response.data:
-                logger.warning(f"No member found with email {member_email}")
-                return None
-
-            # Find the member with mentor in membershiptype (case-insensitive)
-            member = None
-            for m in member_response.data:
-                membershiptype = (m.get('membershiptype') or '').lower()
-                if 'mentor' in membershiptype:
-                    member = m
-                    break
-
-            if not member:
-                logger.warning(f"Member {member_email} is not a mentor (membershiptype doesn't contain 'mentor')")
-                return None
+            with _bulkhead('sync'):
+                try:
+                    response = self._call_rpc(
+                        'sync_mentor_from_member',
+                        {'p_email': member_email, 'p_user_id': user_id},
+                        table='mentors'
+                    )
+                except RpcNotInstalled:
+                    return self._sync_mentor_from_member_client_side(member_email, user_id)
+        except Exception as e:
+            logger.error(f"Error syncing mentor from member {member_email}: {e}")
+            raise
 
-            # Get member_id (UUID) for linking
-            member_id = member.get('id')
-            
-            # Check if mentor already exists by member_id to prevent duplicates
-            existing_by_member = self._circuit_breaker.call(
-                lambda: self._client.table('mentors')
-                .select('*')
-                .eq('member_id', member_id)
-                .execute()
-            )
-            
-            if existing_by_member.data and len(existing_by_member.data) > 0:
-                logger.info(f"Mentor profile already exists for member_id {member_id}")
-                return existing_by_member.data[0]
-
-            # Prepare mentor profile data
-            expertise = []
-            # Handle both camelCase and lowercase field names
-            area_of_expertise = member.get('areaOfExpertise') or member.get('areaofexpertise') or ''
-            if area_of_expertise:
-                expertise.append(area_of_expertise)
-            if member.get('industry'):
-                expertise.append(member['industry'])
-            if member.get('skills'):
-                skills_list = [s.strip() for s in member['skills'].split(',') if s.strip()]
-                expertise.extend(skills_list[:3])
-
-            expertise = list(set(filter(None, expertise)))  # Remove duplicates and empty strings
-
-            # Create bio
-            bio_parts = []
-            if member.get('experience'):
-                bio_parts.append(f"Experience: {member['experience']}")
-            if member.get('occupation'):
-                bio_parts.append(f"Occupation: {member['occupation']}")
-            if member.get('jobtitle'):
-                bio_parts.append(f"Job Title: {member['jobtitle']}")
-
-            bio = " | ".join(bio_parts) if bio_parts else "Experienced mentor ready to help you grow."
-
-            # Create mentor profile with member_id link
-            mentor_data = {
-                'user_id': user_id,
-                'member_id': member_id,  # Link to members table
-                'bio': bio,
-                'expertise': expertise if expertise else ['General Mentorship'],
-                'is_approved': True,  # Auto-approve mentors from members table
-                'rating': 0.00,
-                'total_sessions': 0,
-                'version': 1
-            }
+        mentor = response.data
+        if isinstance(mentor, list):
+            mentor = mentor[0] if mentor else None
+        if not mentor or not mentor.get('id'):
+            logger.warning(f"Member {member_email} is not a mentor (membershiptype doesn't contain 'mentor')")
+            return None
 
-            created_mentor = self.create_mentor_profile(mentor_data)
-            logger.info(f"Created mentor profile for user_id {user_id} linked to member_id {member_id}")
-            return created_mentor
+        self.invalidate_mentor(user_id=user_id)
+        logger.info(
+            f"Synced mentor profile for user_id {user_id} "
+            f"linked to member_id {mentor.get('member_id')}"
+        )
+        return mentor
 
+    def _sync_mentor_from_member_client_side(
+        self, member_email: str, user_id: int
+    ) -> Optional[Dict]:
+        """Fallback for sync_mentor_from_member when the RPC is unavailable"""
+        try:
+            mentor = self.sync_mentors_from_members([(member_email, user_id)]).get(user_id)
         except Exception as e:
             # Check if it's a duplicate key error
             error_str = str(e).lower()
@@ -451,94 +1397,159 @@ class SupabaseMentorshipClient:
                 logger.warning(f"Mentor profile already exists for {member_email}, fetching existing profile")
                 # Try to fetch the existing mentor
                 return self.get_mentor_by_user_id(user_id)
-            logger.error(f"Error syncing mentor from member {member_email}: {e}")
             raise
-    
-    def get_mentor_by_user_id(self, user_id: int, email: str = None) -> Optional[Dict]:
+        if mentor is None:
+            logger.warning(f"Member {member_email} is not a mentor (membershiptype doesn't contain 'mentor')")
+        return mentor
+
+    @staticmethod
+    def _build_mentor_payload(member: Dict, user_id: int) -> Dict:
+        """New mentor profile row, with expertise and bio derived from the member record"""
+        expertise = []
+        # Handle both camelCase and lowercase field names
+        area_of_expertise = member.get('areaOfExpertise') or member.get('areaofexpertise') or ''
+        if area_of_expertise:
+            expertise.append(area_of_expertise)
+        if member.get('industry'):
+            expertise.append(member['industry'])
+        if member.get('skills'):
+            skills_list = [s.strip() for s in member['skills'].split(',') if s.strip()]
+            expertise.extend(skills_list[:3])
+
+        # Remove duplicates and empty strings, keeping the primary area first
+        expertise = list(dict.fromkeys(item for item in expertise if item))[:MAX_SYNCED_EXPERTISE]
+
+        # Create bio
+        bio_parts = []
+        if member.get('experience'):
+            bio_parts.append(f"Experience: {member['experience']}")
+        if member.get('occupation'):
+            bio_parts.append(f"Occupation: {member['occupation']}")
+        if member.get('jobtitle'):
+            bio_parts.append(f"Job Title: {member['jobtitle']}")
+
+        bio = " | ".join(bio_parts) if bio_parts else "Experienced mentor ready to help you grow."
+
+        return {
+            'user_id': user_id,
+            'member_id': member.get('id'),  # Link to members table
+            'bio': bio,
+            'expertise': expertise or ['General Mentorship'],
+            'is_approved': True,  # Auto-approve mentors from members table
+            'rating': 0.00,
+            'total_sessions': 0,
+            'version': 1
+        }
+
+    def sync_mentors_from_members(self, pairs: List[Tuple[str, int]]) -> Dict[int, Dict]:
         """
-        Get mentor profile by user_id or email.
-        If user_id lookup fails and email is provided, lookup through members table.
-        Returns mentor data with member information or None if not found.
+        Create mentor profiles for many (member_email, user_id) pairs, in the
+        same order as the sync_mentor_from_member RPC: a profile already linked
+        to the user wins, otherwise the mentor member's profile is created or,
+        if one exists for that member, reused and linked to the user when it
+        has none (ON CONFLICT ... SET user_id = COALESCE(user_id, ...) in the
+        RPC). Takes one mentors read, one members read and one bulk upsert;
+        conflicts add one re-select plus one update per unlinked profile.
+        Returns {user_id: mentor_row} for each pair that resolves to a mentor.
+        Errors propagate rather than reading as "not a mentor".
         """
-        try:
-            # First try to query by user_id
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentors')
-                .select('*, member:member_id(*)')
-                .eq('user_id', user_id)
-                .execute()
+        pairs = [(email.strip().lower(), user_id) for email, user_id in pairs if email]
+        if not pairs:
+            return {}
+
+        user_ids = list(dict.fromkeys(user_id for _, user_id in pairs))
+        existing_response = self._cb('mentors').call_execute(
+            self._client.table('mentors').select('*').in_('user_id', user_ids)
+        )
+        synced = {mentor['user_id']: mentor for mentor in (existing_response.data or [])}
+
+        pending = [(email, user_id) for email, user_id in pairs if user_id not in synced]
+        # No request when every user already has a profile
+        members_by_email = self._fetch_members_by_emails(
+            (email for email, _ in pending), f'{_MEMBER_SYNC_COLUMNS},email', mentors_only=True
+        )
+
+        rows_by_member = {}
+        for email, user_id in pending:
+            member = members_by_email.get(email)
+            if member is not None and member['id'] not in rows_by_member:
+                # one profile per member, even if listed twice
+                rows_by_member[member['id']] = self._build_mentor_payload(member, user_id)
+
+        if rows_by_member:
+            response = self._cb('mentors').call_execute(
+                self._client.table('mentors').upsert(
+                    list(rows_by_member.values()), on_conflict='member_id', ignore_duplicates=True
+                )
             )
-            
-            # If found by user_id, return it
-            if response.data and len(response.data) > 0:
-                mentor = response.data[0]
-            # If not found by user_id and email is provided, try email lookup
-            elif email:
-                logger.info(f"No mentor found by user_id {user_id}, trying email lookup: {email}")
-                # Get member by email first
-                member_response = self._circuit_breaker.call(
-                    lambda: self._client.table('members')
-                    .select('id')
-                    .eq('email', email)
-                    .execute()
+            created = {mentor['member_id']: mentor for mentor in (response.data or [])}
+            logger.info(
+                f"Created {len(created)} mentor profiles from {len(rows_by_member)} members"
+            )
+
+            # Rows skipped on conflict already have a profile for that member
+            conflicted = [member_id for member_id in rows_by_member if member_id not in created]
+            if conflicted:
+                existing_response = self._cb('mentors').call_execute(
+                    self._client.table('mentors').select('*').in_('member_id', conflicted)
                 )
-                
-                if not member_response.data or len(member_response.data) == 0:
-                    logger.info(f"No member found with email {email}")
-                    return None
-                
-                member_id = member_response.data[0]['id']
-                
-                # Now get mentor by member_id
-                mentor_response = self._circuit_breaker.call(
-                    lambda: self._client.table('mentors')
-                    .select('*, member:member_id(*)')
-                    .eq('member_id', member_id)
-                    .execute()
+                created.update(
+                    (mentor['member_id'], mentor) for mentor in (existing_response.data or [])
                 )
-                
-                if not mentor_response.data or len(mentor_response.data) == 0:
-                    logger.info(f"No mentor profile found for member_id {member_id}")
-                    return None
-                
-                mentor = mentor_response.data[0]
-            else:
-                logger.info(f"No mentor profile found for user_id {user_id}")
-                return None
-            
-            # Enrich with member data
-            member_data = mentor.pop('member', {}) if mentor.get('member') else {}
-            
-            enriched_mentor = {
-                **mentor,
-                'name': member_data.get('name', ''),
-                'email': member_data.get('email', ''),
-                'phone': member_data.get('phone', ''),
-                'country': member_data.get('country', ''),
-                'city': member_data.get('city', ''),
-                'linkedin': member_data.get('linkedin', ''),
-                'experience': member_data.get('experience', ''),
-                'areaofexpertise': member_data.get('areaofexpertise', ''),
-                'school': member_data.get('school', ''),
-                'occupation': member_data.get('occupation', ''),
-                'jobtitle': member_data.get('jobtitle', ''),
-                'skills': member_data.get('skills', ''),
-                'location': member_data.get('location', ''),
-                'member_data': member_data
-            }
-            
-            return enriched_mentor
-            
-        except Exception as e:
-            logger.error(f"Error fetching mentor by user_id {user_id}: {e}")
-            return None
+                # Profiles created by the members trigger (migration 007) have no user yet
+                for member_id in conflicted:
+                    mentor = created.get(member_id)
+                    if mentor is not None and mentor.get('user_id') is None:
+                        created[member_id] = self._link_mentor_user(
+                            mentor, rows_by_member[member_id]['user_id']
+                        )
+
+            for email, user_id in pending:
+                member = members_by_email.get(email)
+                if member is not None and member['id'] in created:
+                    synced[user_id] = created[member['id']]
+
+        for user_id in synced:
+            self.invalidate_mentor(user_id=user_id)
+        return synced
     
+    def _link_mentor_user(self, mentor: Dict, user_id: int) -> Dict:
+        """
+        Set user_id on a mentor profile that has none. The is.null guard
+        keeps a link made concurrently; the row is then returned as read.
+        """
+        response = self._cb('mentors').call_execute(
+            self._client.table('mentors')
+            .update({'user_id': user_id, 'updated_at': _now_iso()})
+            .eq('id', mentor['id'])
+            .is_('user_id', 'null')
+        )
+        if not response.data:
+            return mentor
+        logger.info(f"Linked mentor profile {mentor['id']} to user_id {user_id}")
+        return response.data[0]
+
     # ========== AVAILABILITY OPERATIONS ==========
 
-    def get_availability_slots(self, mentor_id: str, date_range: Dict = None) -> List[Dict]:
-        """Get availability slots for a mentor"""
+    @singleflight
+    def get_availability_slots(
+        self, mentor_id: str, date_range: Dict = None, fields=None
+    ) -> List[Dict]:
+        """
+        Get availability slots for a mentor (cached briefly, dropped on slot writes).
+        `fields` narrows the columns returned (default: all).
+        """
+        cache_key = (str(mentor_id), _freeze(date_range), _freeze(fields))
+        cached = self._availability_cache.get(cache_key)
+        if cached is not None:
+            return _copy_rows(cached)
         try:
-            query = self._client.table('mentor_availability').select('*').eq('mentor_id', mentor_id).eq('is_active', True)
+            query = (
+                self._client.table('mentor_availability')
+                .select(','.join(fields) if fields else '*')
+                .eq('mentor_id', mentor_id)
+                .eq('is_active', True)
+            )
 
             if date_range:
                 # Filter by date range if provided
@@ -547,8 +1558,9 @@ class SupabaseMentorshipClient:
                 if 'end_date' in date_range:
                     query = query.lte('specific_date', date_range['end_date'])
 
-            response = self._circuit_breaker.call(lambda: query.execute())
-            return response.data
+            response = self._cb('mentor_availability').call_execute(query)
+            self._availability_cache.set(cache_key, _copy_rows(response.data))
+            return _copy_rows(response.data)
         except Exception as e:
             logger.error(f"Error fetching availability for mentor {mentor_id}: {e}")
             return []
@@ -556,45 +1568,71 @@ class SupabaseMentorshipClient:
     def get_availability_slot(self, slot_id: str) -> Optional[Dict]:
         """Get a single availability slot by ID"""
         try:
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentor_availability')
+            response = self._cb('mentor_availability').call_execute(
+                self._client.table('mentor_availability')
                 .select('*')
                 .eq('id', slot_id)
-                .execute()
+                .limit(1)
+                .maybe_single()
             )
-            return response.data[0] if response.data and len(response.data) > 0 else None
+            return response.data if response is not None else None
         except Exception as e:
             logger.error(f"Error fetching availability slot {slot_id}: {e}")
             return None
 
-    def create_availability_slot(self, data: Dict) -> Optional[Dict]:
-        """Create a new availability slot"""
-        try:
-            # Ensure required fields
-            slot_data = {
-                'mentor_id': data['mentor_id'],
-                'start_time': data.get('start_time'),
-                'end_time': data.get('end_time'),
-                'is_recurring': data.get('is_recurring', False),
-                'is_active': data.get('is_active', True),
-            }
+    @staticmethod
+    def _normalize_slot(data: Dict) -> Dict:
+        """Build the mentor_availability row for an incoming slot payload"""
+        # Ensure required fields
+        slot_data = {
+            'mentor_id': data['mentor_id'],
+            'start_time': data.get('start_time'),
+            'end_time': data.get('end_time'),
+            'is_recurring': data.get('is_recurring', False),
+            'is_active': data.get('is_active', True),
+        }
+
+        # Add day_of_week for recurring slots
+        if slot_data['is_recurring'] and 'day_of_week' in data:
+            slot_data['day_of_week'] = data['day_of_week']
 
-            # Add day_of_week for recurring slots
-            if slot_data['is_recurring'] and 'day_of_week' in data:
-                slot_data['day_of_week'] = data['day_of_week']
+        # Add specific_date for non-recurring slots
+        if not slot_data['is_recurring'] and 'specific_date' in data:
+            slot_data['specific_date'] = data['specific_date']
 
-            # Add specific_date for non-recurring slots
-            if not slot_data['is_recurring'] and 'specific_date' in data:
-                slot_data['specific_date'] = data['specific_date']
+        return slot_data
 
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentor_availability')
-                .insert(slot_data)
-                .execute()
+    def create_availability_slot(self, data: Dict) -> Optional[Dict]:
+        """Create a new availability slot"""
+        try:
+            response = self._cb('mentor_availability').call_execute(
+                self._client.table('mentor_availability')
+                .insert(self._normalize_slot(data))
             )
+            self.invalidate_availability(data.get('mentor_id'))
             return response.data[0] if response.data else None
         except Exception as e:
-            logger.error(f"Error creating availability slot: {e}")
+            logger.error(f"Error creating availability slot: {e}")
+            raise
+
+    def bulk_create_availability_slots(self, slots: List[Dict]) -> List[Dict]:
+        """Create several availability slots with a single insert request"""
+        now_iso = _now_iso()
+        rows = [{**self._normalize_slot(slot), 'created_at': now_iso} for slot in slots]
+        if not rows:
+            return []
+        try:
+            response = self._cb('mentor_availability').call_execute(
+                self._client.table('mentor_availability')
+                # Columns a row omits keep their DB default, as with single inserts
+                .insert(rows, default_to_null=False)
+            )
+            logger.info(f"Created {len(response.data or [])} availability slots")
+            for mentor_id in {str(row['mentor_id']) for row in rows if row.get('mentor_id')}:
+                self.invalidate_availability(mentor_id)
+            return response.data or []
+        except Exception as e:
+            logger.error(f"Error bulk creating {len(rows)} availability slots: {e}")
             raise
 
     def update_availability_slot(self, slot_id: str, data: Dict) -> Optional[Dict]:
@@ -615,15 +1653,16 @@ class SupabaseMentorshipClient:
             if 'is_recurring' in data:
                 update_data['is_recurring'] = data['is_recurring']
 
-            update_data['updated_at'] = datetime.utcnow().isoformat()
+            update_data['updated_at'] = _now_iso()
 
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentor_availability')
+            response = self._cb('mentor_availability').call_execute(
+                self._client.table('mentor_availability')
                 .update(update_data)
                 .eq('id', slot_id)
-                .execute()
             )
-            return response.data[0] if response.data else None
+            slot = response.data[0] if response.data else None
+            self.invalidate_availability(slot.get('mentor_id') if slot else None)
+            return slot
         except Exception as e:
             logger.error(f"Error updating availability slot {slot_id}: {e}")
             raise
@@ -631,11 +1670,13 @@ class SupabaseMentorshipClient:
     def delete_availability_slot(self, slot_id: str) -> bool:
         """Delete an availability slot (soft delete by setting is_active=False)"""
         try:
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentor_availability')
-                .update({'is_active': False, 'updated_at': datetime.utcnow().isoformat()})
+            response = self._cb('mentor_availability').call_execute(
+                self._client.table('mentor_availability')
+                .update({'is_active': False, 'updated_at': _now_iso()})
                 .eq('id', slot_id)
-                .execute()
+            )
+            self.invalidate_availability(
+                response.data[0].get('mentor_id') if response.data else None
             )
             return bool(response.data)
         except Exception as e:
@@ -650,12 +1691,13 @@ class SupabaseMentorshipClient:
         Note: PostgreSQL advisory locks are handled at the Django view level.
         """
         try:
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentorship_bookings')
+            response = self._cb('mentorship_bookings').call_execute(
+                self._client.table('mentorship_bookings')
                 .insert(data)
-                .execute()
             )
-            return response.data[0] if response.data else None
+            booking = response.data[0] if response.data else None
+            self.invalidate_booking_stats(booking)
+            return booking
         except Exception as e:
             logger.error(f"Error creating booking: {e}")
             raise
@@ -665,88 +1707,149 @@ class SupabaseMentorshipClient:
         try:
             data = {
                 'status': status,
-                'updated_at': datetime.utcnow().isoformat()
+                'updated_at': _now_iso()
             }
 
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentorship_bookings')
+            response = self._cb('mentorship_bookings').call_execute(
+                self._client.table('mentorship_bookings')
                 .update(data)
                 .eq('id', booking_id)
-                .execute()
             )
 
             if not response.data:
                 raise Exception("Booking not found or update failed")
 
+            self.invalidate_booking_stats(response.data[0])
             return response.data[0]
         except Exception as e:
             logger.error(f"Error updating booking {booking_id}: {e}")
             raise
+
+    def bulk_update_booking_status(
+        self, booking_ids: List[str], status: str, from_statuses=None
+    ) -> List[Dict]:
+        """
+        Set `status` on many bookings with one UPDATE ... WHERE id IN (...).
+        `from_statuses` restricts the update to bookings still in one of those
+        statuses, so a booking changed concurrently is left alone.
+        Returns the updated rows; ids not among them were not updated.
+        """
+        ids = list(dict.fromkeys(booking_id for booking_id in booking_ids if booking_id))
+        if not ids:
+            return []
+        try:
+            query = (
+                self._client.table('mentorship_bookings')
+                .update({'status': status, 'updated_at': _now_iso()})
+                .in_('id', ids)
+            )
+            if from_statuses:
+                query = query.in_('status', list(from_statuses))
+            response = self._cb('mentorship_bookings').call_execute(query)
+        except Exception as e:
+            logger.error(f"Error bulk updating {len(ids)} bookings to {status}: {e}")
+            raise
+
+        updated = response.data or []
+        for booking in updated:
+            self.invalidate_booking_stats(booking)
+        logger.info(f"Updated {len(updated)} of {len(ids)} bookings to {status}")
+        return updated
     
-    def get_mentee_bookings(self, user_id_or_member_id, status_filter: str = None, limit: int = None, email: str = None) -> List[Dict]:
-        """Get all bookings for a mentee. Accepts member UUID or Django user ID + email."""
+    @staticmethod
+    def _apply_booking_page(query, limit: int = None, cursor: str = None):
+        """
+        Newest-first booking order with an optional (session_date, id) keyset
+        cursor, as produced by booking_page_cursor for the previous page.
+        """
+        position = booking_cursor_position(cursor)
+        if position:
+            session_date, booking_id = position
+            query = query.or_(
+                f'session_date.lt."{session_date}",'
+                f'and(session_date.eq."{session_date}",id.lt.{booking_id})'
+            )
+        query = query.order('session_date', desc=True).order('id', desc=True)
+        if limit:
+            query = query.limit(limit)
+        return query
+
+    @staticmethod
+    def booking_page_cursor(bookings: List[Dict], limit: int = None) -> Optional[str]:
+        """Cursor for the page after `bookings`, or None when it was the last page"""
+        if not limit or len(bookings) < limit:
+            return None
+        return encode_cursor(bookings[-1]['session_date'], bookings[-1]['id'])
+
+    @singleflight
+    def get_mentee_bookings(
+        self,
+        user_id_or_member_id,
+        status_filter: str = None,
+        limit: int = None,
+        email: str = None,
+        cursor: str = None,
+    ) -> List[Dict]:
+        """
+        Get bookings for a mentee, newest first. Accepts member UUID or Django user ID + email.
+        With `limit`, pass booking_page_cursor() of the previous page as `cursor` to continue.
+        """
         try:
-            mentee_id = user_id_or_member_id
-            # If it looks like an integer (Django user_id), resolve to member UUID via email
-            if isinstance(user_id_or_member_id, int) and email:
-                member_id = self.get_member_id_by_email(email)
-                if member_id:
-                    mentee_id = member_id
-                else:
-                    logger.warning(f"No member found for email {email}, using user_id {user_id_or_member_id}")
-                    return []
-            query = self._client.table('mentorship_bookings').select('*').eq('mentee_id', str(mentee_id))
+            bookings = self._client.table('mentorship_bookings')
+            # A Django user ID (int) is resolved to the member through the email
+            email_key = (
+                (email or '').strip().lower() if isinstance(user_id_or_member_id, int) else ''
+            )
+            mentee_id = self._member_cache.get(email_key) if email_key else user_id_or_member_id
+            if mentee_id:
+                query = bookings.select(_BOOKING_COLUMNS).eq('mentee_id', str(mentee_id))
+            elif email_key:
+                # Filter on the embedded member so email -> member -> bookings is one request
+                query = bookings.select(f'{_BOOKING_COLUMNS},mentee:mentee_id!inner(email)').eq(
+                    'mentee.email', email_key
+                )
+            else:
+                return []
 
             if status_filter:
                 query = query.eq('status', status_filter)
 
-            query = query.order('session_date', desc=True)
+            query = self._apply_booking_page(query, limit, cursor)
 
-            if limit:
-                query = query.limit(limit)
-
-            response = self._circuit_breaker.call(lambda: query.execute())
+            response = self._cb('mentorship_bookings').call_execute(query)
+            for booking in response.data:
+                booking.pop('mentee', None)
             return response.data
         except Exception as e:
-            logger.error(f"Error fetching bookings for mentee {user_id}: {e}")
+            logger.error(f"Error fetching bookings for mentee {user_id_or_member_id}: {e}")
             return []
 
-    def get_mentor_bookings(self, mentor_id: str, status_filter: str = None, limit: int = None) -> List[Dict]:
-        """Get all bookings for a mentor"""
+    @singleflight
+    def get_mentor_bookings(
+        self, mentor_id: str, status_filter: str = None, limit: int = None, cursor: str = None
+    ) -> List[Dict]:
+        """
+        Get bookings for a mentor, newest first.
+        With `limit`, pass booking_page_cursor() of the previous page as `cursor` to continue.
+        """
         try:
-            query = self._client.table('mentorship_bookings').select('*').eq('mentor_id', mentor_id)
+            query = (
+                self._client.table('mentorship_bookings')
+                .select(_BOOKING_COLUMNS)
+                .eq('mentor_id', mentor_id)
+            )
 
             if status_filter:
                 query = query.eq('status', status_filter)
 
-            query = query.order('session_date', desc=True)
+            query = self._apply_booking_page(query, limit, cursor)
 
-            if limit:
-                query = query.limit(limit)
-
-            response = self._circuit_breaker.call(lambda: query.execute())
+            response = self._cb('mentorship_bookings').call_execute(query)
             return response.data
         except Exception as e:
             logger.error(f"Error fetching bookings for mentor {mentor_id}: {e}")
             return []
-    
-    def get_booking(self, booking_id: str) -> Optional[Dict]:
-        """Get a single booking by ID"""
-        try:
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentorship_bookings')
-                .select('*')
-                .eq('id', booking_id)
-                .execute()
-            )
-            
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            return None
-        except Exception as e:
-            logger.error(f"Error fetching booking {booking_id}: {e}")
-            return None
-    
+
     # ========== STORAGE OPERATIONS ==========
     
     def upload_mentor_photo(self, mentor_id: str, photo_file) -> str:
@@ -756,31 +1859,37 @@ class SupabaseMentorshipClient:
         """
         try:
             # Generate unique filename
-            import uuid
-            from pathlib import Path
-            
             file_ext = Path(photo_file.name).suffix
             unique_filename = f"mentor_{mentor_id}_{uuid.uuid4().hex[:8]}{file_ext}"
             file_path = f"mentors/{unique_filename}"
             
-            # Read file content
-            file_content = photo_file.read()
-            
             # Upload to Supabase storage bucket
             # Note: Using the 'mentors-profile' bucket created in Supabase dashboard
             bucket_name = 'mentors-profile'
+            file_options = {'content-type': photo_file.content_type}
+            
+            # Uploads spooled to disk are streamed from their temp file; small
+            # in-memory uploads are already in RAM
+            spooled_path = getattr(photo_file, 'temporary_file_path', None)
+            file_content = None if spooled_path else photo_file.read()
+
+            def upload():
+                bucket = self._client.storage.from_(bucket_name)
+                if file_content is not None:
+                    return bucket.upload(file_path, file_content, file_options)
+                # Opened here (not by the storage client, which never closes
+                # it) so each attempt's handle is closed when it returns
+                with open(spooled_path(), 'rb') as fh:
+                    return bucket.upload(file_path, fh, file_options)
             
             # Upload file
-            response = self._circuit_breaker.call(
-                lambda: self._client.storage.from_(bucket_name).upload(
-                    file_path,
-                    file_content,
-                    {'content-type': photo_file.content_type}
-                )
-            )
+            with _bulkhead('write'):
+                response = self._cb('storage').call(upload)
             
-            # Get public URL
-            public_url = self._client.storage.from_(bucket_name).get_public_url(file_path)
+            # Public URLs are deterministic, no need to go through the storage client
+            public_url = (
+                f"{self._client.storage_url.rstrip('/')}/object/public/{bucket_name}/{file_path}"
+            )
             
             logger.info(f"Uploaded photo for mentor {mentor_id}: {public_url}")
             return public_url
@@ -799,12 +1908,14 @@ class SupabaseMentorshipClient:
             bucket_name = 'mentors-profile'
             # URL format: https://{project}.supabase.co/storage/v1/object/public/{bucket}/{path}
             if f'/object/public/{bucket_name}/' in photo_url:
-                file_path = photo_url.split(f'/object/public/{bucket_name}/')[1]
+                # Older URLs from the storage client carry a trailing '?'
+                file_path = photo_url.split(f'/object/public/{bucket_name}/')[1].split('?')[0]
 
                 # Delete file
-                self._circuit_breaker.call(
-                    lambda: self._client.storage.from_(bucket_name).remove([file_path])
-                )
+                with _bulkhead('write'):
+                    self._cb('storage').call(
+                        lambda: self._client.storage.from_(bucket_name).remove([file_path])
+                    )
 
                 logger.info(f"Deleted photo: {file_path}")
                 return True
@@ -822,27 +1933,61 @@ class SupabaseMentorshipClient:
         """Get reviews for a mentor with pagination"""
         try:
             offset = (page - 1) * page_size
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentorship_reviews')
+            response = self._cb('mentorship_reviews').call_execute(
+                self._client.table('mentorship_reviews')
                 .select('*')
                 .eq('mentor_id', mentor_id)
                 .order('created_at', desc=True)
                 .range(offset, offset + page_size - 1)
-                .execute()
             )
             return response.data or []
         except Exception as e:
             logger.error(f"Error fetching reviews for mentor {mentor_id}: {e}")
             return []
 
+    def get_mentor_reviews_page(
+        self, mentor_id: str, cursor: str = None, page_size: int = 10
+    ) -> Dict:
+        """
+        Keyset-paginated reviews for a mentor, newest first.
+        `cursor` is the `next_cursor` of the previous page; the scan starts right
+        after it via the (mentor_id, created_at, id) index instead of an OFFSET.
+        Returns: {'data': [...], 'next_cursor': str or None}
+        """
+        try:
+            query = (
+                self._client.table('mentorship_reviews')
+                .select('*')
+                .eq('mentor_id', mentor_id)
+            )
+            position = review_cursor_position(cursor)
+            if position:
+                created_at, review_id = position
+                query = query.or_(
+                    f'created_at.lt."{created_at}",'
+                    f'and(created_at.eq."{created_at}",id.lt.{review_id})'
+                )
+            response = self._cb('mentorship_reviews').call_execute(
+                query.order('created_at', desc=True).order('id', desc=True).limit(page_size)
+            )
+            rows = response.data or []
+            next_cursor = (
+                encode_cursor(rows[-1]['created_at'], rows[-1]['id'])
+                if len(rows) == page_size else None
+            )
+            return {'data': rows, 'next_cursor': next_cursor}
+        except Exception as e:
+            logger.error(f"Error fetching reviews for mentor {mentor_id}: {e}")
+            return {'data': [], 'next_cursor': None}
+
     def get_mentor_review_count(self, mentor_id: str) -> int:
         """Get total review count for a mentor"""
         try:
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentorship_reviews')
+            response = self._cb('mentorship_reviews').call_execute(
+                self._client.table('mentorship_reviews')
                 .select('id', count='exact')
                 .eq('mentor_id', mentor_id)
-                .execute()
+                .limit(1)  # the total comes from Content-Range, not the rows
             )
             return response.count or 0
         except Exception as e:
@@ -859,193 +2004,225 @@ class SupabaseMentorshipClient:
                 'rating': data['rating'],
                 'comment': data.get('comment', ''),
                 'mentee_name': data.get('mentee_name', ''),
-                'created_at': datetime.utcnow().isoformat()
+                'created_at': _now_iso()
             }
 
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentorship_reviews')
+            response = self._cb('mentorship_reviews').call_execute(
+                self._client.table('mentorship_reviews')
                 .insert(review_data)
-                .execute()
             )
+            self._stats_cache.pop(('mentor', str(review_data['mentor_id'])))
             return response.data[0] if response.data else None
         except Exception as e:
             logger.error(f"Error creating review: {e}")
             raise
 
     def update_mentor_rating(self, mentor_id: str) -> Optional[float]:
-        """Recalculate and update mentor's average rating"""
+        """
+        Recalculate and update mentor's average rating.
+        Runs as a single `recalc_mentor_rating` RPC (see
+        database/migrations/013_recalc_mentor_rating_rpc.sql) when installed.
+        """
         try:
-            # Get all reviews for the mentor
-            reviews_response = self._circuit_breaker.call(
-                lambda: self._client.table('mentorship_reviews')
-                .select('rating')
-                .eq('mentor_id', mentor_id)
-                .execute()
-            )
+            try:
+                response = self._call_rpc(
+                    'recalc_mentor_rating', {'p_mentor_id': mentor_id}, table='mentors'
+                )
+                avg_rating = float(response.data) if response.data is not None else None
+            except RpcNotInstalled:
+                avg_rating = self._update_mentor_rating_client_side(mentor_id)
 
-            if not reviews_response.data:
+            if avg_rating is None:
                 return None
-
-            # Calculate average
-            ratings = [r['rating'] for r in reviews_response.data]
-            avg_rating = round(sum(ratings) / len(ratings), 2)
-
-            # Update mentor profile
-            self._circuit_breaker.call(
-                lambda: self._client.table('mentors')
-                .update({'rating': avg_rating, 'updated_at': datetime.utcnow().isoformat()})
-                .eq('id', mentor_id)
-                .execute()
-            )
-
+            self.invalidate_mentor(mentor_id=mentor_id)
             logger.info(f"Updated mentor {mentor_id} rating to {avg_rating}")
             return avg_rating
         except Exception as e:
             logger.error(f"Error updating mentor rating for {mentor_id}: {e}")
             return None
 
+    def _update_mentor_rating_client_side(self, mentor_id: str) -> Optional[float]:
+        """Read-average-write fallback for update_mentor_rating when the RPC is unavailable"""
+        # Get all reviews for the mentor
+        reviews_response = self._cb('mentorship_reviews').call_execute(
+            self._client.table('mentorship_reviews')
+            .select('rating')
+            .eq('mentor_id', mentor_id)
+        )
+
+        if not reviews_response.data:
+            return None
+
+        # Calculate average
+        ratings = [r['rating'] for r in reviews_response.data]
+        avg_rating = round(sum(ratings) / len(ratings), 2)
+
+        # Update mentor profile
+        self._cb('mentors').call_execute(
+            self._client.table('mentors')
+            .update({'rating': avg_rating, 'updated_at': _now_iso()})
+            .eq('id', mentor_id)
+        )
+        return avg_rating
+
     def increment_mentor_sessions(self, mentor_id: str) -> bool:
-        """Increment mentor's total session count"""
+        """
+        Increment mentor's total session count.
+        Runs as an atomic `increment_mentor_sessions` RPC (see
+        database/migrations/014_increment_mentor_sessions_rpc.sql) when installed.
+        """
         try:
-            # Get current count
-            mentor_response = self._circuit_breaker.call(
-                lambda: self._client.table('mentors')
-                .select('total_sessions')
-                .eq('id', mentor_id)
-                .execute()
-            )
-
-            current_sessions = 0
-            if mentor_response.data and len(mentor_response.data) > 0:
-                current_sessions = mentor_response.data[0].get('total_sessions', 0)
-
-            # Update count
-            self._circuit_breaker.call(
-                lambda: self._client.table('mentors')
-                .update({
-                    'total_sessions': current_sessions + 1,
-                    'updated_at': datetime.utcnow().isoformat()
-                })
-                .eq('id', mentor_id)
-                .execute()
-            )
+            try:
+                response = self._call_rpc(
+                    'increment_mentor_sessions', {'p_id': mentor_id}, table='mentors'
+                )
+                total_sessions = response.data
+            except RpcNotInstalled:
+                total_sessions = self._increment_mentor_sessions_client_side(mentor_id)
 
-            logger.info(f"Incremented sessions for mentor {mentor_id} to {current_sessions + 1}")
+            self.invalidate_mentor(mentor_id=mentor_id)
+            logger.info(f"Incremented sessions for mentor {mentor_id} to {total_sessions}")
             return True
         except Exception as e:
             logger.error(f"Error incrementing sessions for mentor {mentor_id}: {e}")
             return False
 
+    def _increment_mentor_sessions_client_side(self, mentor_id: str) -> int:
+        """Read-modify-write fallback for increment_mentor_sessions when the RPC is unavailable"""
+        # Get current count
+        mentor_response = self._cb('mentors').call_execute(
+            self._client.table('mentors')
+            .select('total_sessions')
+            .eq('id', mentor_id)
+        )
+
+        current_sessions = 0
+        if mentor_response.data and len(mentor_response.data) > 0:
+            current_sessions = mentor_response.data[0].get('total_sessions', 0)
+
+        # Update count
+        self._cb('mentors').call_execute(
+            self._client.table('mentors')
+            .update({
+                'total_sessions': current_sessions + 1,
+                'updated_at': _now_iso()
+            })
+            .eq('id', mentor_id)
+        )
+        return current_sessions + 1
+
     # ========== SEARCH OPERATIONS ==========
 
+    @staticmethod
+    def _apply_search_filters(query, filters: Dict = None):
+        """Apply the search_mentors query / expertise / min_rating filters"""
+        if filters:
+            # Search query: full-text match on bio via the GIN-indexed
+            # search_tsv column (websearch syntax tolerates free-form input)
+            if filters.get('query'):
+                query = query.filter('search_tsv', 'wfts(english)', filters['query'])
+
+            # Filter by expertise
+            if filters.get('expertise'):
+                query = query.contains('expertise', [filters['expertise']])
+
+            # Filter by minimum rating
+            if filters.get('min_rating'):
+                query = query.gte('rating', filters['min_rating'])
+
+            # Filter by availability (has any active availability slots)
+            # This would require a subquery or RPC function in Supabase
+        return query
+
+    def _search_mentor_count(self, filters: Dict = None) -> int:
+        """Total matches for a mentor search, cached briefly per filter set"""
+        cache_key = repr(sorted((filters or {}).items()))
+        cached = self._search_count_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        query = self._apply_search_filters(
+            self._client.table('mentors').select('id', count='exact').eq('is_approved', True),
+            filters
+        )
+        # limit(1): the total comes from Content-Range, no need for the rows
+        response = self._cb('mentors').call_execute(query.limit(1))
+        count = response.count or 0
+        self._search_count_cache.set(cache_key, count)
+        return count
+
     def search_mentors(self, filters: Dict = None, pagination: Dict = None) -> Dict:
         """
         Search mentors with full-text search and filters.
-        Returns: {'data': [...], 'count': total_count}
+        Pages by (rating, id) keyset when pagination carries the previous
+        page's `cursor`; the total count is only computed without a cursor,
+        as a separate cached query issued alongside the page fetch.
+        Returns: {'data': [...], 'count': total_count, 'next_cursor': str or None}
         """
+        pagination = pagination or {}
+        position = mentor_cursor_position(pagination.get('cursor'))
         try:
             # Start with approved mentors, join with member data
-            query = (
-                self._client.table('mentors')
-                .select('*, member:member_id(*)', count='exact')
-                .eq('is_approved', True)
+            query = self._apply_search_filters(
+                self._client.table('mentors').select(_MENTOR_WITH_MEMBER).eq('is_approved', True),
+                filters
             )
 
-            if filters:
-                # Search query (searches bio, expertise)
-                if filters.get('query'):
-                    search_term = filters['query']
-                    # Use ilike for case-insensitive search on bio
-                    query = query.ilike('bio', f'%{search_term}%')
-
-                # Filter by expertise
-                if filters.get('expertise'):
-                    query = query.contains('expertise', [filters['expertise']])
-
-                # Filter by minimum rating
-                if filters.get('min_rating'):
-                    query = query.gte('rating', filters['min_rating'])
-
-                # Filter by availability (has any active availability slots)
-                # This would require a subquery or RPC function in Supabase
-
-            # Apply pagination
-            if pagination:
-                page = pagination.get('page', 1)
-                page_size = pagination.get('page_size', 12)
-                start = (page - 1) * page_size
-                end = start + page_size - 1
-                query = query.range(start, end)
-
-            # Order by rating descending
-            query = query.order('rating', desc=True)
-
-            response = self._circuit_breaker.call(lambda: query.execute())
-
-            # Enrich with member data
-            enriched_data = []
-            for mentor in response.data:
-                member_data = mentor.pop('member', {}) if mentor.get('member') else {}
-
-                enriched_mentor = {
-                    **mentor,
-                    'name': member_data.get('name', ''),
-                    'email': member_data.get('email', ''),
-                    'phone': member_data.get('phone', ''),
-                    'country': member_data.get('country', ''),
-                    'city': member_data.get('city', ''),
-                    'linkedin': member_data.get('linkedin', ''),
-                    'experience': member_data.get('experience', ''),
-                    'areaofexpertise': member_data.get('areaofexpertise', ''),
-                    'occupation': member_data.get('occupation', ''),
-                    'jobtitle': member_data.get('jobtitle', ''),
-                    'skills': member_data.get('skills', ''),
-                }
-                enriched_data.append(enriched_mentor)
+            query = self._apply_mentor_page(query, pagination)
+
+            if position:
+                response, count = self._cb('mentors').call_execute(query), None
+            else:
+                response, count = run_concurrently(
+                    lambda: self._cb('mentors').call_execute(query),
+                    lambda: self._search_mentor_count(filters),
+                )
+
+            enriched_data = [
+                _merge_member_fields(mentor, _SEARCH_MEMBER_FIELDS, keep_member_data=False)
+                for mentor in response.data
+            ]
+            next_cursor = (
+                self.mentor_page_cursor(enriched_data, pagination.get('page_size', 12))
+                if pagination else None
+            )
 
             return {
                 'data': enriched_data,
-                'count': response.count
+                'count': count,
+                'next_cursor': next_cursor
             }
         except Exception as e:
             logger.error(f"Error searching mentors: {e}")
-            return {'data': [], 'count': 0}
+            return {'data': [], 'count': 0, 'next_cursor': None}
 
     def get_recommended_mentors(self, user_id: int, limit: int = 6) -> List[Dict]:
         """
         Get recommended mentors for a mentee.
-        Simple recommendation based on highest rated mentors.
+        Simple recommendation based on highest rated mentors; the ranking does
+        not depend on the user yet, so results are cached per limit.
         """
+        cached = self._recommended_cache.get(limit)
+        if cached is not None:
+            return _copy_rows(cached)
         try:
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentors')
-                .select('*, member:member_id(*)')
+            response = self._cb('mentors').call_execute(
+                self._client.table('mentors')
+                .select(_RECOMMENDED_MENTOR_COLUMNS)
                 .eq('is_approved', True)
                 .order('rating', desc=True)
                 .order('total_sessions', desc=True)
                 .limit(limit)
-                .execute()
             )
 
             if not response.data:
                 return []
 
-            # Enrich with member data
-            enriched_data = []
-            for mentor in response.data:
-                member_data = mentor.pop('member', {}) if mentor.get('member') else {}
-
-                enriched_mentor = {
-                    **mentor,
-                    'name': member_data.get('name', ''),
-                    'email': member_data.get('email', ''),
-                    'occupation': member_data.get('occupation', ''),
-                    'jobtitle': member_data.get('jobtitle', ''),
-                    'areaofexpertise': member_data.get('areaofexpertise', ''),
-                }
-                enriched_data.append(enriched_mentor)
-
-            return enriched_data
+            mentors = [
+                _merge_member_fields(mentor, _RECOMMENDED_MEMBER_FIELDS, keep_member_data=False)
+                for mentor in response.data
+            ]
+            self._recommended_cache.set(limit, mentors)
+            return _copy_rows(mentors)
         except Exception as e:
             logger.error(f"Error getting recommended mentors for user {user_id}: {e}")
             return []
@@ -1055,11 +2232,10 @@ class SupabaseMentorshipClient:
     def get_booking(self, booking_id: str) -> Optional[Dict]:
         """Get a single booking by ID"""
         try:
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentorship_bookings')
+            response = self._cb('mentorship_bookings').call_execute(
+                self._client.table('mentorship_bookings')
                 .select('*')
                 .eq('id', booking_id)
-                .execute()
             )
             return response.data[0] if response.data and len(response.data) > 0 else None
         except Exception as e:
@@ -1084,7 +2260,6 @@ class SupabaseMentorshipClient:
             # Calculate duration from start_time and end_time
             duration_minutes = data.get('duration_minutes', 60)
             if 'start_time' in data and 'end_time' in data:
-                from datetime import datetime as dt
                 st = data['start_time']
                 et = data['end_time']
                 if hasattr(st, 'hour'):
@@ -1104,15 +2279,16 @@ class SupabaseMentorshipClient:
                 'notes': data.get('description', '') or data.get('notes', ''),
                 'mentee_goals': data.get('mentee_goals', ''),
                 'status': 'pending',
-                'created_at': datetime.utcnow().isoformat()
+                'created_at': _now_iso()
             }
 
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentorship_bookings')
+            response = self._cb('mentorship_bookings').call_execute(
+                self._client.table('mentorship_bookings')
                 .insert(booking_data)
-                .execute()
             )
-            return response.data[0] if response.data else None
+            booking = response.data[0] if response.data else None
+            self.invalidate_booking_stats(booking)
+            return booking
         except Exception as e:
             logger.error(f"Error creating booking: {e}")
             raise
@@ -1134,15 +2310,16 @@ class SupabaseMentorshipClient:
                 if field in data:
                     update_data[field] = data[field]
 
-            update_data['updated_at'] = datetime.utcnow().isoformat()
+            update_data['updated_at'] = _now_iso()
 
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentorship_bookings')
+            response = self._cb('mentorship_bookings').call_execute(
+                self._client.table('mentorship_bookings')
                 .update(update_data)
                 .eq('id', booking_id)
-                .execute()
             )
-            return response.data[0] if response.data else None
+            booking = response.data[0] if response.data else None
+            self.invalidate_booking_stats(booking)
+            return booking
         except Exception as e:
             logger.error(f"Error updating booking {booking_id}: {e}")
             raise
@@ -1164,16 +2341,17 @@ class SupabaseMentorshipClient:
                 'session_date': session_date,
                 'duration_minutes': duration_minutes,
                 'status': 'pending',
-                'updated_at': datetime.utcnow().isoformat()
+                'updated_at': _now_iso()
             }
 
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentorship_bookings')
+            response = self._cb('mentorship_bookings').call_execute(
+                self._client.table('mentorship_bookings')
                 .update(update_data)
                 .eq('id', booking_id)
-                .execute()
             )
-            return response.data[0] if response.data else None
+            booking = response.data[0] if response.data else None
+            self.invalidate_booking_stats(booking)
+            return booking
         except Exception as e:
             logger.error(f"Error rescheduling booking {booking_id}: {e}")
             raise
@@ -1190,6 +2368,8 @@ class SupabaseMentorshipClient:
         Check if there are any conflicting bookings for the given time slot.
         Returns True if there's a conflict.
         The DB stores session_date as a timestamp and duration_minutes.
+        Runs as a single `has_booking_conflict` RPC (see
+        database/migrations/015_has_booking_conflict_rpc.sql) when installed.
         """
         try:
             # Build the full timestamp for the requested session
@@ -1198,96 +2378,93 @@ class SupabaseMentorshipClient:
             else:
                 requested_start = str(session_date)
 
-            # Calculate requested end time
+            # Calculate requested end time (sessions default to 60 minutes)
             if start_time and end_time:
                 requested_end = f"{session_date}T{end_time}:00+00:00"
             else:
                 requested_end = None
 
-            # Get all bookings for this mentor on the same date
-            # Filter by date range: from start of day to end of day
-            day_start = f"{str(session_date)[:10]}T00:00:00+00:00"
-            day_end = f"{str(session_date)[:10]}T23:59:59+00:00"
-
-            query = (
-                self._client.table('mentorship_bookings')
-                .select('id, session_date, duration_minutes')
-                .eq('mentor_id', mentor_id)
-                .gte('session_date', day_start)
-                .lte('session_date', day_end)
-                .in_('status', ['pending', 'confirmed'])
-            )
+            try:
+                response = self._call_rpc(
+                    'has_booking_conflict',
+                    {
+                        'p_mentor': mentor_id,
+                        'p_start': requested_start,
+                        'p_end': requested_end,
+                        'p_exclude': exclude_booking_id,
+                    },
+                    table='mentorship_bookings',
+                    kind='read',
+                )
+                conflict = bool(response.data)
+            except RpcNotInstalled:
+                conflict = self._check_booking_conflicts_client_side(
+                    mentor_id, session_date, requested_start, requested_end, exclude_booking_id
+                )
 
-            if exclude_booking_id:
-                query = query.neq('id', exclude_booking_id)
+            if conflict:
+                logger.warning(f"Booking conflict detected for mentor {mentor_id} on {session_date}")
+            return conflict
+        except Exception as e:
+            logger.error(f"Error checking booking conflicts: {e}")
+            # In case of error, assume conflict to be safe
+            return True
 
-            response = self._circuit_breaker.call(lambda: query.execute())
+    def _check_booking_conflicts_client_side(
+        self,
+        mentor_id: str,
+        session_date: str,
+        requested_start: str,
+        requested_end: Optional[str],
+        exclude_booking_id: str = None
+    ) -> bool:
+        """Same-day fetch and Python overlap check, used when the RPC is unavailable"""
+        # Get all bookings for this mentor on the same date
+        # Filter by date range: from start of day to end of day
+        day_start = f"{str(session_date)[:10]}T00:00:00+00:00"
+        day_end = f"{str(session_date)[:10]}T23:59:59+00:00"
+
+        query = (
+            self._client.table('mentorship_bookings')
+            .select('id, session_date, duration_minutes')
+            .eq('mentor_id', mentor_id)
+            .gte('session_date', day_start)
+            .lte('session_date', day_end)
+            .in_('status', list(_ACTIVE_BOOKING_STATUSES))
+        )
 
-            if not response.data:
-                return False
+        if exclude_booking_id:
+            query = query.neq('id', exclude_booking_id)
 
-            # Check for time overlap using session_date + duration_minutes
-            from datetime import datetime as dt, timedelta
-            req_start = dt.fromisoformat(requested_start.replace('+00:00', '+00:00'))
-            if requested_end:
-                req_end = dt.fromisoformat(requested_end.replace('+00:00', '+00:00'))
-            else:
-                req_end = req_start + timedelta(minutes=60)
+        response = self._cb('mentorship_bookings').call_execute(query)
 
-            for booking in response.data:
-                existing_start = dt.fromisoformat(booking['session_date'].replace('Z', '+00:00'))
-                existing_duration = booking.get('duration_minutes', 60)
-                existing_end = existing_start + timedelta(minutes=existing_duration)
+        if not response.data:
+            return False
 
-                # Check overlap
-                if req_start < existing_end and req_end > existing_start:
-                    logger.warning(f"Booking conflict detected for mentor {mentor_id} on {session_date}")
-                    return True
+        # Check for time overlap using session_date + duration_minutes,
+        # compared as POSIX timestamps (fromisoformat accepts the 'Z' suffix)
+        req_start = datetime.fromisoformat(requested_start).timestamp()
+        if requested_end:
+            req_end = datetime.fromisoformat(requested_end).timestamp()
+        else:
+            req_end = req_start + 60 * 60
 
-            return False
-        except Exception as e:
-            logger.error(f"Error checking booking conflicts: {e}")
-            # In case of error, assume conflict to be safe
-            return True
+        for booking in response.data:
+            existing_start = datetime.fromisoformat(booking['session_date']).timestamp()
+            existing_end = existing_start + (booking.get('duration_minutes') or 60) * 60
 
-    def enrich_booking(self, booking: Dict) -> Dict:
-        """Enrich a single booking with mentor and mentee details"""
-        try:
-            enriched = {**booking}
-
-            # Get mentor details
-            if booking.get('mentor_id'):
-                mentor_response = self._circuit_breaker.call(
-                    lambda: self._client.table('mentors')
-                    .select('*, member:member_id(name, email, jobtitle, occupation)')
-                    .eq('id', booking['mentor_id'])
-                    .execute()
-                )
-                if mentor_response.data and len(mentor_response.data) > 0:
-                    mentor = mentor_response.data[0]
-                    member_data = mentor.pop('member', {}) if mentor.get('member') else {}
-                    enriched['mentor'] = {
-                        'id': mentor.get('id'),
-                        'user_id': mentor.get('user_id'),
-                        'name': member_data.get('name', ''),
-                        'email': member_data.get('email', ''),
-                        'job_title': member_data.get('jobtitle', ''),
-                        'occupation': member_data.get('occupation', ''),
-                        'photo_url': mentor.get('photo_url'),
-                        'rating': mentor.get('rating'),
-                    }
+            # Check overlap
+            if req_start < existing_end and req_end > existing_start:
+                return True
 
-            # Get mentee details from Django user
-            # Note: This requires the mentee_id to be a Django user ID
-            # The view layer should handle this enrichment if needed
+        return False
 
-            return enriched
-        except Exception as e:
-            logger.error(f"Error enriching booking: {e}")
-            return booking
+    def enrich_booking(self, booking: Dict) -> Dict:
+        """Enrich a single booking with mentor details (see enrich_bookings)"""
+        return self.enrich_bookings([booking])[0]
 
     def enrich_bookings(self, bookings: List[Dict], role: str = None) -> List[Dict]:
-        """Enrich multiple bookings with mentor and mentee details"""
+        """Enrich multiple bookings with mentor details using one batched mentor query"""
         try:
             if not bookings:
                 return []
@@ -1298,11 +2475,10 @@ class SupabaseMentorshipClient:
             # Batch fetch mentor data
             mentors_map = {}
             if mentor_ids:
-                mentors_response = self._circuit_breaker.call(
-                    lambda: self._client.table('mentors')
-                    .select('*, member:member_id(name, email, jobtitle, occupation)')
+                mentors_response = self._cb('mentors').call_execute(
+                    self._client.table('mentors')
+                    .select(_BOOKING_MENTOR_COLUMNS)
                     .in_('id', mentor_ids)
-                    .execute()
                 )
 
                 for mentor in (mentors_response.data or []):
@@ -1340,24 +2516,10 @@ class SupabaseMentorshipClient:
         Returns the count of cleared slots.
         """
         try:
-            # First count the slots to be cleared
-            count_query = self._client.table('mentor_availability').select('id', count='exact').eq('mentor_id', mentor_id).eq('is_active', True)
-
-            if slot_type == 'recurring':
-                count_query = count_query.eq('is_recurring', True)
-            elif slot_type == 'specific':
-                count_query = count_query.eq('is_recurring', False)
-
-            count_response = self._circuit_breaker.call(lambda: count_query.execute())
-            count = count_response.count or 0
-
-            if count == 0:
-                return 0
-
-            # Now clear them
+            # Deactivate and return the affected rows in one UPDATE ... RETURNING
             update_query = self._client.table('mentor_availability').update({
                 'is_active': False,
-                'updated_at': datetime.utcnow().isoformat()
+                'updated_at': _now_iso()
             }).eq('mentor_id', mentor_id).eq('is_active', True)
 
             if slot_type == 'recurring':
@@ -1365,7 +2527,9 @@ class SupabaseMentorshipClient:
             elif slot_type == 'specific':
                 update_query = update_query.eq('is_recurring', False)
 
-            self._circuit_breaker.call(lambda: update_query.execute())
+            response = self._cb('mentor_availability').call_execute(update_query)
+            count = len(response.data or [])
+            self.invalidate_availability(mentor_id)
 
             logger.info(f"Cleared {count} availability slots for mentor {mentor_id} (type: {slot_type or 'all'})")
             return count
@@ -1373,56 +2537,23 @@ class SupabaseMentorshipClient:
             logger.error(f"Error clearing availability for mentor {mentor_id}: {e}")
             return 0
 
-    def bulk_create_availability_slots(self, slots: List[Dict]) -> List[Dict]:
-        """Create multiple availability slots at once"""
-        try:
-            if not slots:
-                return []
-
-            # Prepare slot data
-            prepared_slots = []
-            for slot in slots:
-                slot_data = {
-                    'mentor_id': slot['mentor_id'],
-                    'start_time': slot.get('start_time'),
-                    'end_time': slot.get('end_time'),
-                    'is_recurring': slot.get('is_recurring', False),
-                    'is_active': slot.get('is_active', True),
-                    'created_at': datetime.utcnow().isoformat()
-                }
-
-                if slot_data['is_recurring'] and 'day_of_week' in slot:
-                    slot_data['day_of_week'] = slot['day_of_week']
-
-                if not slot_data['is_recurring'] and 'specific_date' in slot:
-                    slot_data['specific_date'] = slot['specific_date']
-
-                prepared_slots.append(slot_data)
-
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentor_availability')
-                .insert(prepared_slots)
-                .execute()
-            )
-
-            logger.info(f"Created {len(response.data or [])} availability slots")
-            return response.data if response.data else []
-        except Exception as e:
-            logger.error(f"Error bulk creating availability slots: {e}")
-            raise
-
     # ========== EXPERTISE OPERATIONS ==========
 
     def get_expertise_categories(self) -> List[Dict]:
-        """Get all expertise categories"""
+        """Get all expertise categories (cached for 10 minutes)"""
+        cached = self._expertise_cache.get('all')
+        if cached is not None:
+            return _copy_rows(cached)
         try:
-            response = self._circuit_breaker.call(
-                lambda: self._client.table('mentorship_expertise')
+            response = self._cb('mentorship_expertise').call_execute(
+                self._client.table('mentorship_expertise')
                 .select('*')
                 .order('name')
-                .execute()
             )
-            return response.data if response.data else []
+            if not response.data:
+                return []
+            self._expertise_cache.set('all', _copy_rows(response.data))
+            return _copy_rows(response.data)
         except Exception as e:
             logger.error(f"Error fetching expertise categories: {e}")
             return []
@@ -1430,135 +2561,230 @@ class SupabaseMentorshipClient:
     # ========== DASHBOARD STATISTICS ==========
 
     def get_mentor_stats(self, mentor_id: str) -> Dict:
-        """Get comprehensive statistics for a mentor"""
+        """
+        Get comprehensive statistics for a mentor.
+        Aggregated in one `get_mentor_stats` RPC (see
+        database/migrations/016_get_mentor_stats_rpc.sql) when installed.
+        Results are cached briefly; booking and review writes evict them.
+        """
+        cache_key = ('mentor', str(mentor_id))
+        cached = self._stats_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
         try:
-            # Get bookings stats
-            bookings_response = self._circuit_breaker.call(
-                lambda: self._client.table('mentorship_bookings')
-                .select('status', count='exact')
-                .eq('mentor_id', mentor_id)
-                .execute()
-            )
-
-            total_bookings = bookings_response.count or 0
-
-            # Count by status
-            status_counts = {}
-            for booking in (bookings_response.data or []):
-                status = booking.get('status', 'unknown')
-                status_counts[status] = status_counts.get(status, 0) + 1
+            try:
+                response = self._call_rpc(
+                    'get_mentor_stats',
+                    {'p_id': mentor_id},
+                    table='mentorship_bookings',
+                    kind='read',
+                )
+            except RpcNotInstalled:
+                result = self._get_mentor_stats_client_side(mentor_id)
+            else:
+                result = self._mentor_stats_from_aggregate(response.data or {})
+            self._stats_cache.set(cache_key, result)
+            return dict(result)
+        except Exception as e:
+            _log_read_failure(f"Error getting stats for mentor {mentor_id}", e)
+            return _empty_stats(_EMPTY_MENTOR_STATS)
+
+    @staticmethod
+    def _mentor_stats_from_aggregate(stats: Dict) -> Dict:
+        """Map a get_mentor_stats / get_many_mentor_stats RPC aggregate to the stats payload"""
+        status_counts = stats.get('by_status') or {}
+        reviews = stats.get('reviews') or {}
+        return {
+            'total_bookings': stats.get('total') or 0,
+            'completed_sessions': status_counts.get('completed', 0),
+            'pending_sessions': status_counts.get('pending', 0),
+            'confirmed_sessions': status_counts.get('confirmed', 0),
+            'cancelled_sessions': status_counts.get('cancelled', 0),
+            'upcoming_sessions': stats.get('upcoming') or 0,
+            'total_reviews': reviews.get('count') or 0,
+            'average_rating': round(float(reviews.get('avg') or 0), 2),
+            'status_breakdown': status_counts
+        }
+
+    def get_many_mentor_stats(self, mentor_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Stats for several mentors, keyed by mentor ID.
+        Cached entries are reused; the rest come from one `get_many_mentor_stats`
+        RPC (see database/migrations/020_get_many_mentor_stats_rpc.sql) when
+        installed, otherwise from get_mentor_stats per mentor.
+        """
+        result = {}
+        missing = []
+        for mentor_id in dict.fromkeys(str(mentor_id) for mentor_id in mentor_ids):
+            cached = self._stats_cache.get(('mentor', mentor_id))
+            if cached is not None:
+                result[mentor_id] = dict(cached)
+            else:
+                missing.append(mentor_id)
+        if not missing:
+            return result
 
-            # Get review stats
-            reviews_response = self._circuit_breaker.call(
-                lambda: self._client.table('mentorship_reviews')
-                .select('rating', count='exact')
-                .eq('mentor_id', mentor_id)
-                .execute()
+        try:
+            response = self._call_rpc(
+                'get_many_mentor_stats',
+                {'p_ids': missing},
+                table='mentorship_bookings',
+                kind='read',
             )
+        except RpcNotInstalled:
+            # Sequential: the per-mentor fallback already fans out on the I/O pool
+            for mentor_id in missing:
+                result[mentor_id] = self.get_mentor_stats(mentor_id)
+            return result
+        except Exception as e:
+            _log_read_failure(f"Error getting stats for mentors {missing}", e)
+            for mentor_id in missing:
+                result[mentor_id] = _empty_stats(_EMPTY_MENTOR_STATS)
+            return result
 
-            total_reviews = reviews_response.count or 0
-            avg_rating = 0
-            if reviews_response.data:
-                ratings = [r['rating'] for r in reviews_response.data]
-                avg_rating = round(sum(ratings) / len(ratings), 2)
+        aggregates = response.data or {}
+        for mentor_id in missing:
+            stats = self._mentor_stats_from_aggregate(aggregates.get(mentor_id) or {})
+            self._stats_cache.set(('mentor', mentor_id), stats)
+            result[mentor_id] = dict(stats)
+        return result
 
-            # Get upcoming sessions count
-            today = datetime.utcnow().date().isoformat()
-            upcoming_response = self._circuit_breaker.call(
-                lambda: self._client.table('mentorship_bookings')
+    def _get_mentor_stats_client_side(self, mentor_id: str) -> Dict:
+        """
+        Row-fetching fallback for get_mentor_stats when the RPC is unavailable.
+        The queries are independent, so they are issued concurrently. The
+        average comes from mentors.rating (maintained by update_mentor_rating)
+        rather than from pulling every review row.
+        """
+        today = _today_iso()
+        bookings_response, reviews_response, mentor_response = run_concurrently(
+            # Bookings by status; session_date also yields the upcoming count
+            lambda: self._cb('mentorship_bookings').call_execute(
+                self._client.table('mentorship_bookings')
+                .select('status, session_date', count='exact')
+                .eq('mentor_id', mentor_id)
+            ),
+            # Review count only; limit(1) as the total comes from Content-Range
+            lambda: self._cb('mentorship_reviews').call_execute(
+                self._client.table('mentorship_reviews')
                 .select('id', count='exact')
                 .eq('mentor_id', mentor_id)
-                .in_('status', ['pending', 'confirmed'])
-                .gte('session_date', today)
-                .execute()
-            )
+                .limit(1)
+            ),
+            # Stored average rating
+            lambda: self._cb('mentors').call_execute(
+                self._client.table('mentors')
+                .select('rating')
+                .eq('id', mentor_id)
+                .limit(1)
+            ),
+        )
 
-            return {
-                'total_bookings': total_bookings,
-                'completed_sessions': status_counts.get('completed', 0),
-                'pending_sessions': status_counts.get('pending', 0),
-                'confirmed_sessions': status_counts.get('confirmed', 0),
-                'cancelled_sessions': status_counts.get('cancelled', 0),
-                'upcoming_sessions': upcoming_response.count or 0,
-                'total_reviews': total_reviews,
-                'average_rating': avg_rating,
-                'status_breakdown': status_counts
-            }
-        except Exception as e:
-            logger.error(f"Error getting stats for mentor {mentor_id}: {e}")
-            return {
-                'total_bookings': 0,
-                'completed_sessions': 0,
-                'pending_sessions': 0,
-                'confirmed_sessions': 0,
-                'cancelled_sessions': 0,
-                'upcoming_sessions': 0,
-                'total_reviews': 0,
-                'average_rating': 0,
-                'status_breakdown': {}
-            }
+        total_bookings = bookings_response.count or 0
+
+        # Count by status and upcoming (pending/confirmed from today on)
+        bookings = bookings_response.data or []
+        status_counts = dict(Counter(booking.get('status', 'unknown') for booking in bookings))
+        upcoming = _count_upcoming(bookings, today)
+
+        total_reviews = reviews_response.count or 0
+        avg_rating = 0
+        if total_reviews and mentor_response.data:
+            avg_rating = round(float(mentor_response.data[0].get('rating') or 0), 2)
+
+        return {
+            'total_bookings': total_bookings,
+            'completed_sessions': status_counts.get('completed', 0),
+            'pending_sessions': status_counts.get('pending', 0),
+            'confirmed_sessions': status_counts.get('confirmed', 0),
+            'cancelled_sessions': status_counts.get('cancelled', 0),
+            'upcoming_sessions': upcoming,
+            'total_reviews': total_reviews,
+            'average_rating': avg_rating,
+            'status_breakdown': status_counts
+        }
 
     def get_mentee_stats(self, mentee_id: int) -> Dict:
-        """Get comprehensive statistics for a mentee"""
+        """
+        Get comprehensive statistics for a mentee.
+        Aggregated in one `get_mentee_stats` RPC (see
+        database/migrations/019_get_mentee_stats_rpc.sql) when installed.
+        Results are cached briefly; booking writes evict them.
+        """
+        cache_key = ('mentee', str(mentee_id))
+        cached = self._stats_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
         try:
-            # Get bookings stats
-            bookings_response = self._circuit_breaker.call(
-                lambda: self._client.table('mentorship_bookings')
-                .select('status, mentor_id', count='exact')
-                .eq('mentee_id', mentee_id)
-                .execute()
-            )
-
-            total_bookings = bookings_response.count or 0
-
-            # Count by status
-            status_counts = {}
-            unique_mentors = set()
-            for booking in (bookings_response.data or []):
-                status = booking.get('status', 'unknown')
-                status_counts[status] = status_counts.get(status, 0) + 1
-                if booking.get('mentor_id'):
-                    unique_mentors.add(booking['mentor_id'])
-
-            # Get upcoming sessions
-            today = datetime.utcnow().date().isoformat()
-            upcoming_response = self._circuit_breaker.call(
-                lambda: self._client.table('mentorship_bookings')
-                .select('id', count='exact')
-                .eq('mentee_id', mentee_id)
-                .in_('status', ['pending', 'confirmed'])
-                .gte('session_date', today)
-                .execute()
-            )
-
-            return {
-                'total_bookings': total_bookings,
-                'completed_sessions': status_counts.get('completed', 0),
-                'pending_sessions': status_counts.get('pending', 0),
-                'confirmed_sessions': status_counts.get('confirmed', 0),
-                'cancelled_sessions': status_counts.get('cancelled', 0),
-                'upcoming_sessions': upcoming_response.count or 0,
-                'unique_mentors_count': len(unique_mentors),
-                'status_breakdown': status_counts
-            }
+            try:
+                response = self._call_rpc(
+                    'get_mentee_stats',
+                    {'p_id': mentee_id},
+                    table='mentorship_bookings',
+                    kind='read',
+                )
+            except RpcNotInstalled:
+                result = self._get_mentee_stats_client_side(mentee_id)
+            else:
+                stats = response.data or {}
+                status_counts = stats.get('by_status') or {}
+                result = {
+                    'total_bookings': stats.get('total') or 0,
+                    'completed_sessions': status_counts.get('completed', 0),
+                    'pending_sessions': status_counts.get('pending', 0),
+                    'confirmed_sessions': status_counts.get('confirmed', 0),
+                    'cancelled_sessions': status_counts.get('cancelled', 0),
+                    'upcoming_sessions': stats.get('upcoming') or 0,
+                    'unique_mentors_count': stats.get('unique_mentors') or 0,
+                    'status_breakdown': status_counts
+                }
+            self._stats_cache.set(cache_key, result)
+            return dict(result)
         except Exception as e:
-            logger.error(f"Error getting stats for mentee {mentee_id}: {e}")
-            return {
-                'total_bookings': 0,
-                'completed_sessions': 0,
-                'pending_sessions': 0,
-                'confirmed_sessions': 0,
-                'cancelled_sessions': 0,
-                'upcoming_sessions': 0,
-                'unique_mentors_count': 0,
-                'status_breakdown': {}
-            }
+            _log_read_failure(f"Error getting stats for mentee {mentee_id}", e)
+            return _empty_stats(_EMPTY_MENTEE_STATS)
+
+    def _get_mentee_stats_client_side(self, mentee_id: int) -> Dict:
+        """Row-fetching fallback for get_mentee_stats when the RPC is unavailable"""
+        today = _today_iso()
+        # One read covers status counts, distinct mentors and the upcoming count
+        bookings_response = self._cb('mentorship_bookings').call_execute(
+            self._client.table('mentorship_bookings')
+            .select('status, mentor_id, session_date', count='exact')
+            .eq('mentee_id', mentee_id)
+        )
 
+        total_bookings = bookings_response.count or 0
 
-# Singleton instance
-supabase_client = SupabaseMentorshipClient()
+        # Count by status, distinct mentors and upcoming (pending/confirmed from today on)
+        bookings = bookings_response.data or []
+        status_counts = dict(Counter(booking.get('status', 'unknown') for booking in bookings))
+        unique_mentors = {booking['mentor_id'] for booking in bookings if booking.get('mentor_id')}
+        upcoming = _count_upcoming(bookings, today)
+
+        return {
+            'total_bookings': total_bookings,
+            'completed_sessions': status_counts.get('completed', 0),
+            'pending_sessions': status_counts.get('pending', 0),
+            'confirmed_sessions': status_counts.get('confirmed', 0),
+            'cancelled_sessions': status_counts.get('cancelled', 0),
+            'upcoming_sessions': upcoming,
+            'unique_mentors_count': len(unique_mentors),
+            'status_breakdown': status_counts
+        }
 
 
 def get_supabase_client() -> SupabaseMentorshipClient:
-    """Get the singleton Supabase client instance"""
-    return supabase_client
+    """Get the singleton Supabase client instance, creating it on first use"""
+    return SupabaseMentorshipClient._instance or SupabaseMentorshipClient()
+
+
+class _LazySupabaseClient:
+    """Module-level handle that defers building the client until first attribute access"""
+
+    def __getattr__(self, name):
+        return getattr(get_supabase_client(), name)
+
+
+# Singleton handle; importing the module no longer connects to Supabase
+supabase_client = _LazySupabaseClient()
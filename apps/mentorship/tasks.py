@@ -24,14 +24,16 @@ def _get_users_for_booking(booking):
     Returns (mentor_user, mentee_user, mentor_data) or raises.
     """
     # Get mentor data from mentors table
-    mentor_data = supabase_client._client.table('mentors').select('*').eq(
+    response = supabase_client._client.table('mentors').select('*').eq(
         'id', booking['mentor_id']
-    ).single().execute().data
+    ).limit(1).maybe_single().execute()
+    mentor_data = response.data if response else None
 
     # Get mentee member record to find email
-    mentee_member = supabase_client._client.table('members').select('email, name').eq(
+    response = supabase_client._client.table('members').select('email, name').eq(
         'id', booking['mentee_id']
-    ).single().execute().data
+    ).limit(1).maybe_single().execute()
+    mentee_member = response.data if response else None
 
     if not mentor_data or not mentee_member:
         return None, None, None
@@ -40,11 +42,12 @@ def _get_users_for_booking(booking):
     mentor_user = None
     if mentor_data.get('user_id'):
         mentor_user = User.objects.filter(id=mentor_data['user_id']).first()
-    if not mentor_user:
+    if not mentor_user and mentor_data.get('member_id'):
         # Fallback: find by member email linked to mentor
-        mentor_member = supabase_client._client.table('members').select('email').eq(
-            'id', mentor_data.get('member_id', '')
-        ).maybeSingle().execute().data
+        response = supabase_client._client.table('members').select('email').eq(
+            'id', mentor_data['member_id']
+        ).limit(1).maybe_single().execute()
+        mentor_member = response.data if response else None
         if mentor_member:
             mentor_user = User.objects.filter(email__iexact=mentor_member['email']).first()
 
@@ -75,9 +78,10 @@ def send_booking_confirmation_email(self, booking_id: str):
     Send confirmation email to mentee after booking creation.
     """
     try:
-        booking = supabase_client._client.table('mentorship_bookings').select('*').eq(
+        response = supabase_client._client.table('mentorship_bookings').select('*').eq(
             'id', booking_id
-        ).single().execute().data
+        ).limit(1).maybe_single().execute()
+        booking = response.data if response else None
 
         if not booking:
             logger.error(f"Booking {booking_id} not found")
@@ -137,9 +141,10 @@ def send_mentor_booking_notification(self, booking_id: str):
     Notify mentor about new booking request.
     """
     try:
-        booking = supabase_client._client.table('mentorship_bookings').select('*').eq(
+        response = supabase_client._client.table('mentorship_bookings').select('*').eq(
             'id', booking_id
-        ).single().execute().data
+        ).limit(1).maybe_single().execute()
+        booking = response.data if response else None
 
         if not booking:
             logger.error(f"Booking {booking_id} not found")
@@ -393,9 +398,10 @@ def send_booking_status_update_email(booking_id: str, old_status: str, new_statu
     Sends to the appropriate party (mentee, mentor, or both) based on the status change.
     """
     try:
-        booking = supabase_client._client.table('mentorship_bookings').select('*').eq(
+        response = supabase_client._client.table('mentorship_bookings').select('*').eq(
             'id', booking_id
-        ).single().execute().data
+        ).limit(1).maybe_single().execute()
+        booking = response.data if response else None
 
         if not booking:
             logger.error(f"Booking {booking_id} not found")
@@ -27,7 +27,15 @@ from .serializers import (
     ExpertiseCategorySerializer,
     MentorStatsSerializer
 )
-from .supabase_client import supabase_client
+from .supabase_client import (
+    supabase_client,
+    run_concurrently,
+    StaleWriteError,
+    MENTOR_CARD_FIELDS,
+    booking_cursor_position,
+    mentor_cursor_position,
+    review_cursor_position,
+)
 from .tasks import (
     send_booking_confirmation_email,
     send_mentor_booking_notification,
@@ -82,7 +90,14 @@ class MentorViewSet(viewsets.ViewSet):
         - search: Search by name or expertise
         - page: Page number (default: 1)
         - page_size: Results per page (default: 12)
+        - cursor: next_cursor from the previous page (keyset paging)
         """
+        if request.GET.get('cursor') and not mentor_cursor_position(request.GET.get('cursor')):
+            return Response(
+                {'error': 'Invalid cursor'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
         cache_key = self._build_cache_key('mentor_list', request.GET.dict())
         cached_data = cache.get(cache_key)
         if cached_data:
@@ -103,17 +118,24 @@ class MentorViewSet(viewsets.ViewSet):
         # Pagination
         pagination = {
             'page': int(request.GET.get('page', 1)),
-            'page_size': int(request.GET.get('page_size', 12))
+            'page_size': int(request.GET.get('page_size', 12)),
+            'cursor': request.GET.get('cursor')
         }
 
         try:
-            result = supabase_client.get_mentors_with_member_data(filters, pagination)
+            # Cards only: the full profile comes from retrieve
+            result = supabase_client.get_mentors_with_member_data(
+                filters, pagination, fields=MENTOR_CARD_FIELDS
+            )
 
             response_data = {
                 'results': result['data'],
                 'count': result['count'],
                 'page': pagination['page'],
-                'page_size': pagination['page_size']
+                'page_size': pagination['page_size'],
+                'next_cursor': supabase_client.mentor_page_cursor(
+                    result['data'], pagination['page_size']
+                ),
             }
 
             cache.set(cache_key, response_data, 300)
@@ -211,8 +233,13 @@ class MentorViewSet(viewsets.ViewSet):
             now = timezone.now()
             today = now.date().isoformat()
 
-            # Get all bookings
-            all_bookings = supabase_client.get_mentor_bookings(mentor_id)
+            # Bookings, reviews and availability are independent - fetch them in parallel
+            all_bookings, reviews_page, total_reviews, availability = run_concurrently(
+                lambda: supabase_client.get_mentor_bookings(mentor_id),
+                lambda: supabase_client.get_mentor_reviews_page(mentor_id, page_size=5),
+                lambda: supabase_client.get_mentor_review_count(mentor_id),
+                lambda: supabase_client.get_availability_slots(mentor_id),
+            )
 
             # Categorize bookings
             pending_bookings = [b for b in all_bookings if b.get('status') == 'pending']
@@ -232,17 +259,11 @@ class MentorViewSet(viewsets.ViewSet):
                 reverse=True
             )[:5]
 
-            # Get reviews
-            reviews = supabase_client.get_mentor_reviews(mentor_id, limit=5)
-
-            # Get availability slots
-            availability = supabase_client.get_availability_slots(mentor_id)
-
             # Calculate statistics
             stats = {
                 'total_sessions': mentor_data.get('total_sessions', 0),
                 'average_rating': float(mentor_data.get('rating', 0)) if mentor_data.get('rating') else 0,
-                'total_reviews': len(supabase_client.get_mentor_reviews(mentor_id)),
+                'total_reviews': total_reviews,
                 'pending_requests': len(pending_bookings),
                 'upcoming_sessions': len([b for b in confirmed_bookings if b.get('session_date', '') >= today]),
                 'completed_sessions': len(completed_bookings),
@@ -258,7 +279,7 @@ class MentorViewSet(viewsets.ViewSet):
                 'pending_bookings': pending_bookings[:10],
                 'upcoming_sessions': upcoming_sessions,
                 'recent_completed': recent_completed,
-                'recent_reviews': reviews,
+                'recent_reviews': reviews_page['data'],
                 'availability': {
                     'recurring_slots': [s for s in availability if s.get('is_recurring')],
                     'specific_date_slots': [s for s in availability if not s.get('is_recurring')]
@@ -282,6 +303,7 @@ class MentorViewSet(viewsets.ViewSet):
         - q: Search query
         - expertise: Filter by expertise
         - page, page_size: Pagination
+        - cursor: next_cursor from the previous page (keyset paging)
         """
         query = request.GET.get('q', '').strip()
         expertise = request.GET.get('expertise', '').strip()
@@ -292,6 +314,12 @@ class MentorViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        if request.GET.get('cursor') and not mentor_cursor_position(request.GET.get('cursor')):
+            return Response(
+                {'error': 'Invalid cursor'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
         try:
             filters = {}
             if query:
@@ -301,7 +329,8 @@ class MentorViewSet(viewsets.ViewSet):
 
             pagination = {
                 'page': int(request.GET.get('page', 1)),
-                'page_size': int(request.GET.get('page_size', 12))
+                'page_size': int(request.GET.get('page_size', 12)),
+                'cursor': request.GET.get('cursor')
             }
 
             result = supabase_client.search_mentors(filters, pagination)
@@ -311,7 +340,8 @@ class MentorViewSet(viewsets.ViewSet):
                 'count': result['count'],
                 'query': query,
                 'page': pagination['page'],
-                'page_size': pagination['page_size']
+                'page_size': pagination['page_size'],
+                'next_cursor': result['next_cursor']
             })
         except Exception as e:
             logger.error(f"Error searching mentors: {e}")
@@ -391,7 +421,7 @@ class MentorViewSet(viewsets.ViewSet):
             return Response(updated)
         except Exception as e:
             logger.error(f"Error updating mentor profile: {e}")
-            if 'version mismatch' in str(e).lower():
+            if isinstance(e, StaleWriteError):
                 return Response(
                     {'error': 'Profile was updated elsewhere. Please refresh.'},
                     status=status.HTTP_409_CONFLICT
@@ -405,7 +435,15 @@ class MentorViewSet(viewsets.ViewSet):
     def update_profile(self, request, pk=None):
         """Update mentor profile by ID (must be owner)"""
         try:
-            mentor_data = supabase_client._client.table('mentors').select('*').eq('id', pk).single().execute().data
+            response = (
+                supabase_client._client.table('mentors')
+                .select('*')
+                .eq('id', pk)
+                .limit(1)
+                .maybe_single()
+                .execute()
+            )
+            mentor_data = response.data if response else None
             if not mentor_data or mentor_data['user_id'] != request.user.id:
                 return Response(
                     {'error': 'Not authorized to update this profile'},
@@ -427,7 +465,7 @@ class MentorViewSet(viewsets.ViewSet):
             return Response(updated_data)
         except Exception as e:
             logger.error(f"Error updating mentor profile {pk}: {e}")
-            if 'version mismatch' in str(e).lower():
+            if isinstance(e, StaleWriteError):
                 return Response(
                     {'error': 'Profile was updated elsewhere. Please refresh.'},
                     status=status.HTTP_409_CONFLICT
@@ -441,7 +479,15 @@ class MentorViewSet(viewsets.ViewSet):
     def upload_photo(self, request, pk=None):
         """Upload mentor profile photo"""
         try:
-            mentor_data = supabase_client._client.table('mentors').select('*').eq('id', pk).single().execute().data
+            response = (
+                supabase_client._client.table('mentors')
+                .select('*')
+                .eq('id', pk)
+                .limit(1)
+                .maybe_single()
+                .execute()
+            )
+            mentor_data = response.data if response else None
             if not mentor_data or mentor_data['user_id'] != request.user.id:
                 return Response(
                     {'error': 'Not authorized'},
@@ -498,7 +544,15 @@ class MentorViewSet(viewsets.ViewSet):
     def delete_photo(self, request, pk=None):
         """Delete mentor profile photo"""
         try:
-            mentor_data = supabase_client._client.table('mentors').select('*').eq('id', pk).single().execute().data
+            response = (
+                supabase_client._client.table('mentors')
+                .select('*')
+                .eq('id', pk)
+                .limit(1)
+                .maybe_single()
+                .execute()
+            )
+            mentor_data = response.data if response else None
             if not mentor_data or mentor_data['user_id'] != request.user.id:
                 return Response(
                     {'error': 'Not authorized'},
@@ -597,19 +651,38 @@ class MentorViewSet(viewsets.ViewSet):
 
     @action(detail=True, methods=['get'])
     def reviews(self, request, pk=None):
-        """Get reviews for a mentor"""
+        """
+        Get reviews for a mentor.
+        Pass `cursor` (the previous response's `next_cursor`) for keyset paging;
+        `page` is still accepted for older clients.
+        """
+        cursor = request.GET.get('cursor')
+        if cursor and not review_cursor_position(cursor):
+            return Response(
+                {'error': 'Invalid cursor'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
         try:
             page = int(request.GET.get('page', 1))
             page_size = int(request.GET.get('page_size', 10))
 
-            reviews = supabase_client.get_mentor_reviews(pk, page=page, page_size=page_size)
+            if page > 1 and not cursor:
+                reviews = supabase_client.get_mentor_reviews(pk, page=page, page_size=page_size)
+                next_cursor = None
+            else:
+                result = supabase_client.get_mentor_reviews_page(
+                    pk, cursor=cursor, page_size=page_size
+                )
+                reviews, next_cursor = result['data'], result['next_cursor']
             total = supabase_client.get_mentor_review_count(pk)
 
             return Response({
                 'reviews': reviews,
                 'count': total,
                 'page': page,
-                'page_size': page_size
+                'page_size': page_size,
+                'next_cursor': next_cursor
             })
         except Exception as e:
             logger.error(f"Error fetching reviews: {e}")
@@ -657,40 +730,55 @@ class BookingViewSet(viewsets.ViewSet):
         Query params:
         - role: 'mentee' or 'mentor' (default: mentee)
         - status: Filter by status (pending, confirmed, completed, cancelled, no_show)
-        - limit: Limit results
+        - limit: Limit results (page size)
+        - cursor: `next_cursor` from the previous page (requires limit)
         """
         role = request.GET.get('role', 'mentee')
         status_filter = request.GET.get('status')
         limit = request.GET.get('limit')
+        cursor = request.GET.get('cursor')
+        if cursor and not booking_cursor_position(cursor):
+            return Response(
+                {'error': 'Invalid cursor'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
         try:
+            limit = int(limit) if limit else None
             if role == 'mentor':
-                mentor_data = supabase_client.get_mentor_by_user_id(request.user.id, request.user.email)
-                if not mentor_data:
+                mentor_id = supabase_client.get_mentor_id_by_user_id(
+                    request.user.id, request.user.email
+                )
+                if not mentor_id:
                     return Response(
                         {'error': 'Mentor profile not found'},
                         status=status.HTTP_404_NOT_FOUND
                     )
                 bookings = supabase_client.get_mentor_bookings(
-                    mentor_data['id'],
+                    mentor_id,
                     status_filter,
-                    limit=int(limit) if limit else None
+                    limit=limit,
+                    cursor=cursor
                 )
             else:
                 bookings = supabase_client.get_mentee_bookings(
                     request.user.id,
                     status_filter,
-                    limit=int(limit) if limit else None,
-                    email=request.user.email
+                    limit=limit,
+                    email=request.user.email,
+                    cursor=cursor
                 )
 
+            next_cursor = supabase_client.booking_page_cursor(bookings, limit)
+
             # Enrich bookings with mentor/mentee info
             enriched_bookings = supabase_client.enrich_bookings(bookings, role)
 
             return Response({
                 'bookings': enriched_bookings,
                 'count': len(enriched_bookings),
-                'role': role
+                'role': role,
+                'next_cursor': next_cursor
             })
         except Exception as e:
             logger.error(f"Error listing bookings: {e}")
@@ -710,8 +798,10 @@ class BookingViewSet(viewsets.ViewSet):
                 )
 
             # Verify user is part of this booking
-            mentor = supabase_client.get_mentor_by_user_id(request.user.id, request.user.email)
-            is_mentor = mentor and str(mentor['id']) == str(booking.get('mentor_id'))
+            mentor_id = supabase_client.get_mentor_id_by_user_id(
+                request.user.id, request.user.email
+            )
+            is_mentor = bool(mentor_id) and mentor_id == str(booking.get('mentor_id'))
             mentee_member_id = supabase_client.get_member_id_by_email(request.user.email)
             is_mentee = str(booking.get('mentee_id', '')) == str(mentee_member_id or '')
 
@@ -722,7 +812,7 @@ class BookingViewSet(viewsets.ViewSet):
                 )
 
             # Enrich with mentor and mentee details
-            booking = supabase_client.enrich_booking(booking)
+            booking = supabase_client.enrich_bookings([booking])[0]
             booking['user_role'] = 'mentor' if is_mentor else 'mentee'
 
             return Response(booking)
@@ -826,8 +916,10 @@ class BookingViewSet(viewsets.ViewSet):
         is_mentor = self._is_mentor_for_booking(request.user.id, pk)
         # cancelled_by is UUID in DB - resolve to member/mentor UUID
         if is_mentor:
-            mentor = supabase_client.get_mentor_by_user_id(request.user.id, request.user.email)
-            cancelled_by_id = str(mentor['id']) if mentor else None
+            mentor_id = supabase_client.get_mentor_id_by_user_id(
+                request.user.id, request.user.email
+            )
+            cancelled_by_id = mentor_id
             cancel_status = 'cancelled_by_mentor'
         else:
             member_id = supabase_client.get_member_id_by_email(request.user.email)
@@ -884,8 +976,10 @@ class BookingViewSet(viewsets.ViewSet):
                 return Response({'error': 'Booking not found'}, status=status.HTTP_404_NOT_FOUND)
 
             # Verify authorization
-            mentor = supabase_client.get_mentor_by_user_id(request.user.id, request.user.email)
-            is_mentor = mentor and str(mentor['id']) == str(booking.get('mentor_id'))
+            mentor_id = supabase_client.get_mentor_id_by_user_id(
+                request.user.id, request.user.email
+            )
+            is_mentor = bool(mentor_id) and mentor_id == str(booking.get('mentor_id'))
             mentee_member_id = supabase_client.get_member_id_by_email(request.user.email)
             is_mentee = str(booking.get('mentee_id', '')) == str(mentee_member_id or '')
 
@@ -936,8 +1030,10 @@ class BookingViewSet(viewsets.ViewSet):
             if not booking:
                 return Response({'error': 'Booking not found'}, status=status.HTTP_404_NOT_FOUND)
 
-            mentor = supabase_client.get_mentor_by_user_id(request.user.id, request.user.email)
-            if not mentor or str(mentor['id']) != str(booking['mentor_id']):
+            mentor_id = supabase_client.get_mentor_id_by_user_id(
+                request.user.id, request.user.email
+            )
+            if not mentor_id or mentor_id != str(booking['mentor_id']):
                 return Response({'error': 'Not authorized'}, status=status.HTTP_403_FORBIDDEN)
 
             updated = supabase_client.update_booking(pk, {
@@ -963,8 +1059,10 @@ class BookingViewSet(viewsets.ViewSet):
             if not booking:
                 return Response({'error': 'Booking not found'}, status=status.HTTP_404_NOT_FOUND)
 
-            mentor = supabase_client.get_mentor_by_user_id(request.user.id, request.user.email)
-            if not mentor or str(mentor['id']) != str(booking['mentor_id']):
+            mentor_id = supabase_client.get_mentor_id_by_user_id(
+                request.user.id, request.user.email
+            )
+            if not mentor_id or mentor_id != str(booking['mentor_id']):
                 return Response({'error': 'Not authorized'}, status=status.HTTP_403_FORBIDDEN)
 
             updated = supabase_client.update_booking(pk, {'notes': notes})
@@ -1049,8 +1147,10 @@ class BookingViewSet(viewsets.ViewSet):
             if not booking:
                 return Response({'error': 'Booking not found'}, status=status.HTTP_404_NOT_FOUND)
 
-            mentor = supabase_client.get_mentor_by_user_id(request.user.id, request.user.email)
-            is_mentor = mentor and str(mentor['id']) == str(booking.get('mentor_id'))
+            mentor_id = supabase_client.get_mentor_id_by_user_id(
+                request.user.id, request.user.email
+            )
+            is_mentor = bool(mentor_id) and mentor_id == str(booking.get('mentor_id'))
             mentee_member_id = supabase_client.get_member_id_by_email(request.user.email)
             is_mentee = str(booking.get('mentee_id', '')) == str(mentee_member_id or '')
 
@@ -1086,8 +1186,8 @@ class BookingViewSet(viewsets.ViewSet):
         """Check if user is the mentor for a booking"""
         try:
             booking = supabase_client.get_booking(booking_id)
-            mentor = supabase_client.get_mentor_by_user_id(user_id)
-            return mentor and str(mentor['id']) == str(booking.get('mentor_id'))
+            mentor_id = supabase_client.get_mentor_id_by_user_id(user_id)
+            return bool(mentor_id) and mentor_id == str(booking.get('mentor_id'))
         except:
             return False
 
@@ -1110,14 +1210,16 @@ class AvailabilityViewSet(viewsets.ViewSet):
     def list(self, request):
         """List availability for current mentor"""
         try:
-            mentor_data = supabase_client.get_mentor_by_user_id(request.user.id, request.user.email)
-            if not mentor_data:
+            mentor_id = supabase_client.get_mentor_id_by_user_id(
+                request.user.id, request.user.email
+            )
+            if not mentor_id:
                 return Response(
                     {'error': 'Mentor profile not found'},
                     status=status.HTTP_404_NOT_FOUND
                 )
 
-            slots = supabase_client.get_availability_slots(mentor_data['id'])
+            slots = supabase_client.get_availability_slots(mentor_id)
             recurring = [s for s in slots if s.get('is_recurring')]
             specific = [s for s in slots if not s.get('is_recurring')]
 
@@ -1141,15 +1243,17 @@ class AvailabilityViewSet(viewsets.ViewSet):
     def create(self, request):
         """Create a new availability slot"""
         try:
-            mentor_data = supabase_client.get_mentor_by_user_id(request.user.id, request.user.email)
-            if not mentor_data:
+            mentor_id = supabase_client.get_mentor_id_by_user_id(
+                request.user.id, request.user.email
+            )
+            if not mentor_id:
                 return Response(
                     {'error': 'Mentor profile not found'},
                     status=status.HTTP_404_NOT_FOUND
                 )
 
             data = request.data.copy()
-            data['mentor_id'] = mentor_data['id']
+            data['mentor_id'] = mentor_id
             data['is_active'] = True
 
             slot = supabase_client.create_availability_slot(data)
@@ -1165,8 +1269,10 @@ class AvailabilityViewSet(viewsets.ViewSet):
     def bulk(self, request):
         """Create multiple availability slots at once"""
         try:
-            mentor_data = supabase_client.get_mentor_by_user_id(request.user.id, request.user.email)
-            if not mentor_data:
+            mentor_id = supabase_client.get_mentor_id_by_user_id(
+                request.user.id, request.user.email
+            )
+            if not mentor_id:
                 return Response(
                     {'error': 'Mentor profile not found'},
                     status=status.HTTP_404_NOT_FOUND
@@ -1179,13 +1285,10 @@ class AvailabilityViewSet(viewsets.ViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            created_slots = []
             for slot in slots_data:
-                slot['mentor_id'] = mentor_data['id']
+                slot['mentor_id'] = mentor_id
                 slot['is_active'] = True
-                created = supabase_client.create_availability_slot(slot)
-                if created:
-                    created_slots.append(created)
+            created_slots = supabase_client.bulk_create_availability_slots(slots_data)
 
             return Response({
                 'created': created_slots,
@@ -1201,15 +1304,17 @@ class AvailabilityViewSet(viewsets.ViewSet):
     def partial_update(self, request, pk=None):
         """Update an availability slot"""
         try:
-            mentor_data = supabase_client.get_mentor_by_user_id(request.user.id, request.user.email)
-            if not mentor_data:
+            mentor_id = supabase_client.get_mentor_id_by_user_id(
+                request.user.id, request.user.email
+            )
+            if not mentor_id:
                 return Response(
                     {'error': 'Mentor profile not found'},
                     status=status.HTTP_404_NOT_FOUND
                 )
 
             slot = supabase_client.get_availability_slot(pk)
-            if not slot or str(slot['mentor_id']) != str(mentor_data['id']):
+            if not slot or str(slot['mentor_id']) != str(mentor_id):
                 return Response(
                     {'error': 'Not authorized'},
                     status=status.HTTP_403_FORBIDDEN
@@ -1227,15 +1332,17 @@ class AvailabilityViewSet(viewsets.ViewSet):
     def destroy(self, request, pk=None):
         """Delete an availability slot"""
         try:
-            mentor_data = supabase_client.get_mentor_by_user_id(request.user.id, request.user.email)
-            if not mentor_data:
+            mentor_id = supabase_client.get_mentor_id_by_user_id(
+                request.user.id, request.user.email
+            )
+            if not mentor_id:
                 return Response(
                     {'error': 'Mentor profile not found'},
                     status=status.HTTP_404_NOT_FOUND
                 )
 
             slot = supabase_client.get_availability_slot(pk)
-            if not slot or str(slot['mentor_id']) != str(mentor_data['id']):
+            if not slot or str(slot['mentor_id']) != str(mentor_id):
                 return Response(
                     {'error': 'Not authorized'},
                     status=status.HTTP_403_FORBIDDEN
@@ -1254,15 +1361,17 @@ class AvailabilityViewSet(viewsets.ViewSet):
     def clear(self, request):
         """Clear all availability slots for current mentor"""
         try:
-            mentor_data = supabase_client.get_mentor_by_user_id(request.user.id, request.user.email)
-            if not mentor_data:
+            mentor_id = supabase_client.get_mentor_id_by_user_id(
+                request.user.id, request.user.email
+            )
+            if not mentor_id:
                 return Response(
                     {'error': 'Mentor profile not found'},
                     status=status.HTTP_404_NOT_FOUND
                 )
 
             slot_type = request.data.get('type', 'all')  # all, recurring, specific
-            count = supabase_client.clear_availability_slots(mentor_data['id'], slot_type)
+            count = supabase_client.clear_availability_slots(mentor_id, slot_type)
 
             return Response({
                 'message': f'Cleared {count} availability slots',
@@ -1295,8 +1404,11 @@ class MenteeDashboardViewSet(viewsets.ViewSet):
             user_id = request.user.id
             today = timezone.now().date().isoformat()
 
-            # Get bookings
-            all_bookings = supabase_client.get_mentee_bookings(user_id, email=request.user.email)
+            # Bookings and recommendations are independent - fetch them in parallel
+            all_bookings, recommended = run_concurrently(
+                lambda: supabase_client.get_mentee_bookings(user_id, email=request.user.email),
+                lambda: supabase_client.get_recommended_mentors(user_id, limit=4),
+            )
 
             pending = [b for b in all_bookings if b.get('status') == 'pending']
             upcoming = [
@@ -1305,12 +1417,10 @@ class MenteeDashboardViewSet(viewsets.ViewSet):
             ]
             completed = [b for b in all_bookings if b.get('status') == 'completed']
 
-            # Enrich bookings with mentor info
-            upcoming = supabase_client.enrich_bookings(upcoming[:5], 'mentee')
-            pending = supabase_client.enrich_bookings(pending[:5], 'mentee')
-
-            # Get recommended mentors
-            recommended = supabase_client.get_recommended_mentors(user_id, limit=4)
+            # Enrich both lists with mentor info in one batched lookup
+            upcoming, pending = upcoming[:5], pending[:5]
+            enriched = supabase_client.enrich_bookings(upcoming + pending, 'mentee')
+            upcoming, pending = enriched[:len(upcoming)], enriched[len(upcoming):]
 
             return Response({
                 'user': {
@@ -1420,9 +1530,12 @@ class ExpertiseViewSet(viewsets.ViewSet):
             return Response(cached)
 
         try:
-            response = supabase_client._client.table('mentorship_expertise').select('*').order('name').execute()
-            cache.set(cache_key, response.data, 3600)
-            return Response(response.data)
+            # In-process TTL cache and circuit breaker; empty means the fetch
+            # failed, so don't cache it
+            categories = supabase_client.get_expertise_categories()
+            if categories:
+                cache.set(cache_key, categories, 3600)
+            return Response(categories)
         except Exception as e:
             logger.error(f"Error fetching expertise: {e}")
             return Response(
@@ -0,0 +1,110 @@
+-- =====================================================
+-- SYNC MENTOR FROM MEMBER (RPC)
+-- =====================================================
+-- Server-side version of SupabaseMentorshipClient.sync_mentor_from_member.
+-- Looks up the mentor by user_id, otherwise finds the member by email
+-- and creates (or links) the mentor profile in a single transaction.
+-- Replaces 3-4 sequential REST round-trips with one RPC call and closes
+-- the race where two concurrent syncs both insert a profile.
+--
+-- Called via: supabase.rpc('sync_mentor_from_member', {p_email, p_user_id})
+-- Returns the mentor row, or NULL if the member is not a mentor.
+-- Depends on: 007_auto_create_mentor_profiles.sql (mentors_member_id_unique)
+--             009_members_email_lowercase.sql (lowercase emails, email index)
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION public.sync_mentor_from_member(
+    p_email TEXT,
+    p_user_id INTEGER
+)
+RETURNS public.mentors
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_mentor public.mentors%ROWTYPE;
+    v_member public.members%ROWTYPE;
+    v_expertise JSONB;
+    v_bio TEXT;
+BEGIN
+    -- Step 1: Existing mentor linked to this Django user
+    SELECT * INTO v_mentor
+    FROM public.mentors
+    WHERE user_id = p_user_id
+    LIMIT 1;
+
+    IF FOUND THEN
+        RETURN v_mentor;
+    END IF;
+
+    -- Step 2: Member with 'mentor' in membershiptype (case-insensitive)
+    SELECT * INTO v_member
+    FROM public.members
+    WHERE email = lower(btrim(p_email))
+      AND COALESCE(membershiptype, '') ILIKE '%mentor%'
+    LIMIT 1;
+
+    IF NOT FOUND THEN
+        RETURN NULL;
+    END IF;
+
+    -- Step 3: Expertise = area of expertise, industry, first 3 skills (deduplicated, ordered)
+    SELECT COALESCE(jsonb_agg(item ORDER BY first_pos), '["General Mentorship"]'::jsonb)
+    INTO v_expertise
+    FROM (
+        SELECT item, MIN(pos) AS first_pos
+        FROM (
+            SELECT v_member.areaofexpertise AS item, 0 AS pos
+            UNION ALL
+            SELECT v_member.industry, 1
+            UNION ALL
+            SELECT skill, 1 + skill_pos
+            FROM (
+                SELECT btrim(s) AS skill, ROW_NUMBER() OVER (ORDER BY n) AS skill_pos
+                FROM unnest(string_to_array(v_member.skills, ',')) WITH ORDINALITY AS t(s, n)
+                WHERE btrim(s) <> ''
+            ) skills
+            WHERE skill_pos <= 3
+        ) candidates
+        WHERE item IS NOT NULL AND item <> ''
+        GROUP BY item
+    ) deduped;
+
+    -- Step 4: Bio built from experience / occupation / job title
+    v_bio := NULLIF(concat_ws(' | ',
+        'Experience: ' || NULLIF(v_member.experience, ''),
+        'Occupation: ' || NULLIF(v_member.occupation, ''),
+        'Job Title: ' || NULLIF(v_member.jobtitle, '')
+    ), '');
+
+    -- Step 5: Create or link the mentor profile atomically
+    INSERT INTO public.mentors (
+        user_id,
+        member_id,
+        bio,
+        expertise,
+        is_approved,
+        rating,
+        total_sessions,
+        version
+    ) VALUES (
+        p_user_id,
+        v_member.id,
+        COALESCE(v_bio, 'Experienced mentor ready to help you grow.'),
+        v_expertise,
+        true, -- Auto-approve mentors from members table
+        0.00,
+        0,
+        1
+    )
+    ON CONFLICT (member_id) DO UPDATE SET
+        user_id = COALESCE(public.mentors.user_id, EXCLUDED.user_id)
+    RETURNING * INTO v_mentor;
+
+    RETURN v_mentor;
+END;
+$$;
+
+-- =====================================================
+-- Expected Result:
+-- - sync_mentor_from_member(p_email, p_user_id) callable via PostgREST RPC
+-- =====================================================
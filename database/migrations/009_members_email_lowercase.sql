@@ -0,0 +1,44 @@
+-- =====================================================
+-- NORMALIZE MEMBER EMAILS TO LOWERCASE
+-- =====================================================
+-- Member lookups by email used ILIKE, which cannot use a plain btree
+-- index and falls back to a sequential scan on members. Emails are now
+-- stored lowercase so PostgREST can match them with a plain eq, and both
+-- the raw and lower(email) forms are index-backed.
+--
+-- Used by: SupabaseMentorshipClient.get_member_id_by_email,
+--          sync_mentor_from_member (RPC and client-side fallback)
+-- Note: run outside a transaction and switch to CREATE INDEX
+--       CONCURRENTLY if members is large enough for the lock to matter.
+-- =====================================================
+
+-- Step 1: Lowercase existing emails
+UPDATE public.members
+SET email = lower(btrim(email))
+WHERE email IS DISTINCT FROM lower(btrim(email));
+
+-- Step 2: Keep new and updated emails lowercase
+CREATE OR REPLACE FUNCTION public.normalize_member_email()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.email := lower(btrim(NEW.email));
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS members_normalize_email ON public.members;
+CREATE TRIGGER members_normalize_email
+    BEFORE INSERT OR UPDATE OF email ON public.members
+    FOR EACH ROW
+    EXECUTE FUNCTION public.normalize_member_email();
+
+-- Step 3: Indexes for eq(email) from PostgREST and lower(email) from SQL
+CREATE INDEX IF NOT EXISTS members_email_idx ON public.members (email);
+CREATE INDEX IF NOT EXISTS members_email_lower_idx ON public.members (lower(email));
+
+-- =====================================================
+-- Expected Result:
+-- - All members.email values are lowercase
+-- - members_normalize_email trigger lowercases email on write
+-- - members_email_idx and members_email_lower_idx exist
+-- =====================================================
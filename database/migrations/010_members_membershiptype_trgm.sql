@@ -0,0 +1,21 @@
+-- =====================================================
+-- TRIGRAM INDEX ON MEMBERS.MEMBERSHIPTYPE
+-- =====================================================
+-- Mentor sync filters members server-side with
+-- membershiptype ILIKE '%mentor%'. A leading wildcard cannot use a btree
+-- index; a pg_trgm GIN index keeps the predicate index-backed.
+--
+-- Used by: SupabaseMentorshipClient._sync_mentor_from_member_client_side,
+--          sync_mentor_from_member RPC (008)
+-- =====================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS members_membershiptype_trgm
+    ON public.members USING gin (membershiptype gin_trgm_ops);
+
+-- =====================================================
+-- Expected Result:
+-- - pg_trgm extension enabled
+-- - members_membershiptype_trgm GIN index exists
+-- =====================================================
@@ -0,0 +1,17 @@
+-- =====================================================
+-- KEYSET PAGINATION INDEX FOR MENTOR REVIEWS
+-- =====================================================
+-- Mentor reviews are paged newest first with a (created_at, id) cursor.
+-- This index matches the filter and sort order, so each page is read
+-- directly instead of scanning and discarding OFFSET rows.
+--
+-- Used by: SupabaseMentorshipClient.get_mentor_reviews_page
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_reviews_mentor_created_id
+    ON public.mentorship_reviews (mentor_id, created_at DESC, id DESC);
+
+-- =====================================================
+-- Expected Result:
+-- - idx_reviews_mentor_created_id index exists
+-- =====================================================
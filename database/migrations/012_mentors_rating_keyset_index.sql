@@ -0,0 +1,18 @@
+-- =====================================================
+-- KEYSET PAGINATION INDEX FOR MENTOR SEARCH
+-- =====================================================
+-- Mentor search orders approved mentors by rating with id as tiebreaker
+-- and pages with a (rating, id) cursor. This partial index serves that
+-- order directly for approved mentors.
+--
+-- Used by: SupabaseMentorshipClient.search_mentors
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_mentors_approved_rating_id
+    ON public.mentors (rating DESC, id DESC)
+    WHERE is_approved = true;
+
+-- =====================================================
+-- Expected Result:
+-- - idx_mentors_approved_rating_id partial index exists
+-- =====================================================
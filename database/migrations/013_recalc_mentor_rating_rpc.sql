@@ -0,0 +1,41 @@
+-- =====================================================
+-- RECALCULATE MENTOR RATING (RPC)
+-- =====================================================
+-- Server-side version of SupabaseMentorshipClient.update_mentor_rating.
+-- Averages the mentor's reviews and stores the result in one statement,
+-- instead of shipping every review rating to the app and writing back.
+--
+-- Called via: supabase.rpc('recalc_mentor_rating', {p_mentor_id})
+-- Returns the new rating, or NULL (rating unchanged) if there are no reviews.
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION public.recalc_mentor_rating(
+    p_mentor_id UUID
+)
+RETURNS NUMERIC
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_rating NUMERIC;
+BEGIN
+    SELECT round(avg(rating)::numeric, 2) INTO v_rating
+    FROM public.mentorship_reviews
+    WHERE mentor_id = p_mentor_id;
+
+    IF v_rating IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    UPDATE public.mentors
+    SET rating = v_rating,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = p_mentor_id;
+
+    RETURN v_rating;
+END;
+$$;
+
+-- =====================================================
+-- Expected Result:
+-- - recalc_mentor_rating(p_mentor_id) callable via PostgREST RPC
+-- =====================================================
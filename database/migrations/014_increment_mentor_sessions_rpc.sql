@@ -0,0 +1,28 @@
+-- =====================================================
+-- INCREMENT MENTOR SESSIONS (RPC)
+-- =====================================================
+-- Server-side version of SupabaseMentorshipClient.increment_mentor_sessions.
+-- A single UPDATE increments the counter, so concurrent completions can no
+-- longer overwrite each other's read-modify-write.
+--
+-- Called via: supabase.rpc('increment_mentor_sessions', {p_id})
+-- Returns the new total_sessions, or NULL if the mentor does not exist.
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION public.increment_mentor_sessions(
+    p_id UUID
+)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+    UPDATE public.mentors
+    SET total_sessions = COALESCE(total_sessions, 0) + 1,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = p_id
+    RETURNING total_sessions;
+$$;
+
+-- =====================================================
+-- Expected Result:
+-- - increment_mentor_sessions(p_id) callable via PostgREST RPC
+-- =====================================================
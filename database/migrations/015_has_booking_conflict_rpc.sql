@@ -0,0 +1,45 @@
+-- =====================================================
+-- BOOKING CONFLICT CHECK (RPC)
+-- =====================================================
+-- Server-side version of SupabaseMentorshipClient.check_booking_conflicts.
+-- Returns whether any pending/confirmed booking of the mentor overlaps the
+-- requested [start, end) window, instead of shipping the day's bookings
+-- to the app and comparing them in Python. Unlike the client-side check,
+-- sessions that start on the previous day are also considered.
+--
+-- Called via: supabase.rpc('has_booking_conflict',
+--                          {p_mentor, p_start, p_end, p_exclude})
+-- p_end defaults to p_start + 60 minutes; p_exclude skips one booking.
+--
+-- The lower session_date bound (sessions are shorter than a day) lets
+-- idx_bookings_mentor_date (mentor_id, session_date) drive the scan; a GiST
+-- index on a computed tstzrange is not possible because timestamptz +
+-- interval is not IMMUTABLE.
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION public.has_booking_conflict(
+    p_mentor UUID,
+    p_start TIMESTAMPTZ,
+    p_end TIMESTAMPTZ DEFAULT NULL,
+    p_exclude UUID DEFAULT NULL
+)
+RETURNS BOOLEAN
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT EXISTS (
+        SELECT 1
+        FROM public.mentorship_bookings
+        WHERE mentor_id = p_mentor
+          AND status IN ('pending', 'confirmed')
+          AND (p_exclude IS NULL OR id <> p_exclude)
+          AND session_date < COALESCE(p_end, p_start + INTERVAL '60 minutes')
+          AND session_date > p_start - INTERVAL '1 day'
+          AND session_date + make_interval(mins => COALESCE(duration_minutes, 60)) > p_start
+    );
+$$;
+
+-- =====================================================
+-- Expected Result:
+-- - has_booking_conflict(p_mentor, p_start, p_end, p_exclude) callable via PostgREST RPC
+-- =====================================================
@@ -0,0 +1,54 @@
+-- =====================================================
+-- MENTOR DASHBOARD STATISTICS (RPC)
+-- =====================================================
+-- Server-side version of SupabaseMentorshipClient.get_mentor_stats.
+-- Aggregates booking counts per status, upcoming sessions and review
+-- count/average in one call, instead of shipping every booking status
+-- and review rating to the app to be counted in Python.
+--
+-- Called via: supabase.rpc('get_mentor_stats', {p_id})
+-- Returns: {"total": int, "by_status": {status: int}, "upcoming": int,
+--           "reviews": {"count": int, "avg": numeric}}
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION public.get_mentor_stats(
+    p_id UUID
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'total', (
+            SELECT count(*)
+            FROM public.mentorship_bookings
+            WHERE mentor_id = p_id
+        ),
+        'by_status', (
+            SELECT COALESCE(jsonb_object_agg(status, status_count), '{}'::jsonb)
+            FROM (
+                SELECT status, count(*) AS status_count
+                FROM public.mentorship_bookings
+                WHERE mentor_id = p_id
+                GROUP BY status
+            ) by_status
+        ),
+        'upcoming', (
+            SELECT count(*)
+            FROM public.mentorship_bookings
+            WHERE mentor_id = p_id
+              AND status IN ('pending', 'confirmed')
+              AND session_date >= CURRENT_DATE
+        ),
+        'reviews', (
+            SELECT jsonb_build_object('count', count(*), 'avg', round(avg(rating)::numeric, 2))
+            FROM public.mentorship_reviews
+            WHERE mentor_id = p_id
+        )
+    );
+$$;
+
+-- =====================================================
+-- Expected Result:
+-- - get_mentor_stats(p_id) callable via PostgREST RPC
+-- =====================================================
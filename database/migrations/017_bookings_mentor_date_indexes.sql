@@ -0,0 +1,32 @@
+-- =====================================================
+-- MENTOR BOOKING LISTING INDEXES
+-- =====================================================
+-- The mentor bookings listing filters on mentor_id (optionally status)
+-- and orders by session_date DESC. 005_phase_a_cleanup.sql only indexes
+-- mentor_id and (mentor_id, status), so the listing sorts every booking
+-- of the mentor. These indexes return rows already in order:
+--
+-- - mentor_id + session_date DESC, covering status for the status filter
+-- - partial index over active (pending/confirmed) bookings, used by the
+--   conflict check RPC (015) and the upcoming-session counts
+--
+-- Used by: SupabaseMentorshipClient.get_mentor_bookings,
+--          has_booking_conflict, get_mentor_stats
+-- Note: run outside a transaction and switch to CREATE INDEX
+--       CONCURRENTLY if mentorship_bookings is large enough for the lock
+--       to matter. Check the Supabase advisors / EXPLAIN afterwards.
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_bookings_mentor_session_date
+    ON public.mentorship_bookings (mentor_id, session_date DESC)
+    INCLUDE (status);
+
+CREATE INDEX IF NOT EXISTS idx_bookings_mentor_active_session_date
+    ON public.mentorship_bookings (mentor_id, session_date)
+    WHERE status IN ('pending', 'confirmed');
+
+-- =====================================================
+-- Expected Result:
+-- - idx_bookings_mentor_session_date index exists
+-- - idx_bookings_mentor_active_session_date partial index exists
+-- =====================================================
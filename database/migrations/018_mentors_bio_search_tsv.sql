@@ -0,0 +1,32 @@
+-- =====================================================
+-- FULL-TEXT SEARCH ON MENTOR BIOS
+-- =====================================================
+-- Mentor search used to filter with bio ILIKE '%term%', which cannot use
+-- a btree index and scans every approved mentor. A stored, generated
+-- tsvector column keeps the search document up to date with bio, and a
+-- GIN index over it serves the websearch-style `wfts` PostgREST filter.
+--
+-- Expertise filtering (`expertise @> '["..."]'`) is served by
+-- idx_mentors_expertise_gin from 002_mentorship_schema.sql; it is
+-- recreated here only if it is missing.
+--
+-- Used by: SupabaseMentorshipClient._apply_search_filters
+--          (search_mentors, _search_mentor_count)
+-- Note: adding a STORED generated column rewrites the mentors table.
+-- =====================================================
+
+ALTER TABLE public.mentors
+    ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (to_tsvector('english', COALESCE(bio, ''))) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_mentors_search_tsv
+    ON public.mentors USING GIN (search_tsv);
+
+CREATE INDEX IF NOT EXISTS idx_mentors_expertise_gin
+    ON public.mentors USING GIN (expertise);
+
+-- =====================================================
+-- Expected Result:
+-- - mentors.search_tsv generated column exists
+-- - idx_mentors_search_tsv and idx_mentors_expertise_gin GIN indexes exist
+-- =====================================================
@@ -0,0 +1,54 @@
+-- =====================================================
+-- MENTEE DASHBOARD STATISTICS (RPC)
+-- =====================================================
+-- Server-side version of SupabaseMentorshipClient.get_mentee_stats,
+-- the mentee counterpart of 016_get_mentor_stats_rpc.sql. Aggregates
+-- booking counts per status, upcoming sessions and distinct mentors in
+-- one call instead of shipping every booking row to the app.
+--
+-- Called via: supabase.rpc('get_mentee_stats', {p_id})
+-- Returns: {"total": int, "by_status": {status: int}, "upcoming": int,
+--           "unique_mentors": int}
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION public.get_mentee_stats(
+    p_id UUID
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'total', (
+            SELECT count(*)
+            FROM public.mentorship_bookings
+            WHERE mentee_id = p_id
+        ),
+        'by_status', (
+            SELECT COALESCE(jsonb_object_agg(status, status_count), '{}'::jsonb)
+            FROM (
+                SELECT status, count(*) AS status_count
+                FROM public.mentorship_bookings
+                WHERE mentee_id = p_id
+                GROUP BY status
+            ) by_status
+        ),
+        'upcoming', (
+            SELECT count(*)
+            FROM public.mentorship_bookings
+            WHERE mentee_id = p_id
+              AND status IN ('pending', 'confirmed')
+              AND session_date >= CURRENT_DATE
+        ),
+        'unique_mentors', (
+            SELECT count(DISTINCT mentor_id)
+            FROM public.mentorship_bookings
+            WHERE mentee_id = p_id
+        )
+    );
+$$;
+
+-- =====================================================
+-- Expected Result:
+-- - get_mentee_stats(p_id) callable via PostgREST RPC
+-- =====================================================
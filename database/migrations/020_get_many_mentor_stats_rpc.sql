@@ -0,0 +1,65 @@
+-- =====================================================
+-- BATCHED MENTOR DASHBOARD STATISTICS (RPC)
+-- =====================================================
+-- Set-based version of get_mentor_stats (016) for pages that show stats
+-- for many mentors at once. Aggregates bookings and reviews for every
+-- requested mentor in one grouped pass instead of one call per mentor.
+--
+-- Called via: supabase.rpc('get_many_mentor_stats', {p_ids})
+-- Used by: SupabaseMentorshipClient.get_many_mentor_stats
+-- Returns: {"<mentor_id>": {"total": int, "by_status": {status: int},
+--           "upcoming": int, "reviews": {"count": int, "avg": numeric}}, ...}
+--          with an entry (zeros) for every requested ID
+-- Depends on: 017_bookings_mentor_date_indexes.sql, 011_reviews_keyset_index.sql
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION public.get_many_mentor_stats(
+    p_ids UUID[]
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    WITH status_counts AS (
+        SELECT
+            mentor_id,
+            status,
+            count(*) AS status_count,
+            count(*) FILTER (
+                WHERE status IN ('pending', 'confirmed')
+                  AND session_date >= CURRENT_DATE
+            ) AS upcoming
+        FROM public.mentorship_bookings
+        WHERE mentor_id = ANY(p_ids)
+        GROUP BY mentor_id, status
+    ),
+    booking_stats AS (
+        SELECT
+            mentor_id,
+            sum(status_count) AS total,
+            jsonb_object_agg(status, status_count) AS by_status,
+            sum(upcoming) AS upcoming
+        FROM status_counts
+        GROUP BY mentor_id
+    ),
+    review_stats AS (
+        SELECT mentor_id, count(*) AS review_count, round(avg(rating)::numeric, 2) AS review_avg
+        FROM public.mentorship_reviews
+        WHERE mentor_id = ANY(p_ids)
+        GROUP BY mentor_id
+    )
+    SELECT COALESCE(jsonb_object_agg(ids.id, jsonb_build_object(
+        'total', COALESCE(b.total, 0),
+        'by_status', COALESCE(b.by_status, '{}'::jsonb),
+        'upcoming', COALESCE(b.upcoming, 0),
+        'reviews', jsonb_build_object('count', COALESCE(r.review_count, 0), 'avg', r.review_avg)
+    )), '{}'::jsonb)
+    FROM (SELECT DISTINCT unnest(p_ids) AS id) ids
+    LEFT JOIN booking_stats b ON b.mentor_id = ids.id
+    LEFT JOIN review_stats r ON r.mentor_id = ids.id;
+$$;
+
+-- =====================================================
+-- Expected Result:
+-- - get_many_mentor_stats(p_ids) callable via PostgREST RPC
+-- =====================================================
@@ -0,0 +1,22 @@
+-- =====================================================
+-- COVERING INDEX FOR MENTOR ID LOOKUPS
+-- =====================================================
+-- Most booking and availability endpoints only need the caller's mentor
+-- UUID to check ownership. SupabaseMentorshipClient.get_mentor_id_by_user_id
+-- reads just `id` by user_id; including id in the index lets Postgres
+-- answer it with an index-only scan instead of visiting the wide mentors
+-- row (bio, expertise, photo_url, ...).
+--
+-- Used by: SupabaseMentorshipClient.get_mentor_id_by_user_id
+-- Verify: EXPLAIN SELECT id FROM public.mentors WHERE user_id = 1;
+--         -> Index Only Scan using idx_mentors_user_id_covering
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_mentors_user_id_covering
+    ON public.mentors (user_id)
+    INCLUDE (id);
+
+-- =====================================================
+-- Expected Result:
+-- - idx_mentors_user_id_covering index exists
+-- =====================================================
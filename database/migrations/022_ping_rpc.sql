@@ -0,0 +1,23 @@
+-- =====================================================
+-- HEALTH CHECK PING (RPC)
+-- =====================================================
+-- Minimal function for SupabaseMentorshipClient.is_healthy. Proves that
+-- PostgREST can reach Postgres without planning a query against a table
+-- or touching its statistics.
+--
+-- Called via: supabase.rpc('ping', {})
+-- Returns: 1
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION public.ping()
+RETURNS INTEGER
+LANGUAGE sql
+IMMUTABLE
+AS $$
+    SELECT 1;
+$$;
+
+-- =====================================================
+-- Expected Result:
+-- - ping() callable via PostgREST RPC
+-- =====================================================
@@ -1,6 +1,55 @@
+import pytest
+
 from config.celery import ping
 
 
 def test_celery_ping_task_direct():
     # Direct call (not via worker) just to assert function import works
     assert ping() == "pong"
+
+
+@pytest.mark.django_db
+def test_get_users_for_booking_tolerates_missing_mentor_member(monkeypatch):
+    from apps.mentorship.supabase_client import SupabaseMentorshipClient
+    from apps.mentorship.tasks import _get_users_for_booking
+    from apps.users.models import User
+
+    User.objects.create_user(email="mentee@example.com", password="x")
+    mentor = {"id": "mentor-1", "user_id": None, "member_id": "mem-1"}
+    mentee_member = {"email": "mentee@example.com", "name": "Mentee"}
+    # maybe_single() returns None when no row matches: the mentor's member row is gone
+    responses = {
+        "mentors": [type("Response", (), {"data": mentor})()],
+        "members": [type("Response", (), {"data": mentee_member})(), None],
+    }
+
+    class Query:
+        def __init__(self, name):
+            self.name = name
+
+        def select(self, *args):
+            return self
+
+        def eq(self, *args):
+            return self
+
+        def limit(self, *args):
+            return self
+
+        def maybe_single(self):
+            return self
+
+        def execute(self):
+            return responses[self.name].pop(0)
+
+    class FakeClient:
+        def table(self, name):
+            return Query(name)
+
+    monkeypatch.setattr(SupabaseMentorshipClient(), "_client", FakeClient())
+    mentor_user, mentee_user, mentor_data = _get_users_for_booking(
+        {"mentor_id": "mentor-1", "mentee_id": "mem-2"}
+    )
+    assert mentor_user is None
+    assert mentee_user.email == "mentee@example.com"
+    assert mentor_data is mentor
@@ -0,0 +1,25 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework import serializers
+
+from apps.mentorship.serializers import BookingSerializer, _booking_window_bounds
+
+
+def test_booking_window_bounds_spans_90_days():
+    today, three_months = _booking_window_bounds()
+    assert today == timezone.now().date()
+    assert three_months - today == timedelta(days=90)
+
+
+@pytest.mark.parametrize("offset", [-1, 91])
+def test_validate_session_date_rejects_out_of_window(offset):
+    value = timezone.now().date() + timedelta(days=offset)
+    with pytest.raises(serializers.ValidationError):
+        BookingSerializer().validate_session_date(value)
+
+
+def test_validate_session_date_accepts_within_window():
+    value = timezone.now().date() + timedelta(days=7)
+    assert BookingSerializer().validate_session_date(value) == value
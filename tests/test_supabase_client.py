@@ -0,0 +1,1331 @@
+import base64
+import json
+import threading
+import time
+
+import httpx
+import pytest
+from postgrest.exceptions import APIError
+
+from apps.mentorship.supabase_client import (
+    BulkheadFullError,
+    CircuitBreaker,
+    CircuitOpenError,
+    StaleWriteError,
+    SupabaseMentorshipClient,
+    TTLCache,
+    _MEMBER_FIELDS,
+    _MENTOR_WITH_MEMBER,
+    _bulkhead,
+    _bulkheads,
+    _fast_json_response,
+    _inflight,
+    _is_client_error,
+    _listing_count,
+    _mentor_columns,
+    _merge_member_fields,
+    _now_iso,
+    _today_iso,
+    booking_cursor_position,
+    decode_cursor,
+    encode_cursor,
+    mentor_cursor_position,
+    review_cursor_position,
+    run_concurrently,
+    singleflight,
+)
+
+REVIEW_1 = "6f1c2e3a-0000-4000-8000-000000000001"
+REVIEW_2 = "6f1c2e3a-0000-4000-8000-000000000002"
+MENTOR_1 = "9a3e4c20-0000-4000-8000-000000000001"
+MENTOR_2 = "9a3e4c20-0000-4000-8000-000000000002"
+MENTOR_3 = "9a3e4c20-0000-4000-8000-000000000003"
+BOOKING_1 = "0b5d7a10-0000-4000-8000-000000000001"
+BOOKING_2 = "0b5d7a10-0000-4000-8000-000000000002"
+BOOKING_3 = "0b5d7a10-0000-4000-8000-000000000003"
+
+
+def _raw_cursor(value):
+    """A cursor encoding `value` as-is, the way a client could forge one"""
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).decode()
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("apps.mentorship.supabase_client.time.monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=10, ttl=30)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    now[0] += 31
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_discard_where():
+    cache = TTLCache()
+    cache.set((1, ""), {"id": "m1"})
+    cache.set((2, ""), {"id": "m2"})
+    cache.discard_where(lambda key, value: value["id"] == "m1")
+    assert cache.get((1, "")) is None
+    assert cache.get((2, "")) == {"id": "m2"}
+
+
+def test_mentor_list_fallback_batches_member_lookup(monkeypatch):
+    client = SupabaseMentorshipClient()
+    calls = []
+
+    class BrokenClient:
+        def table(self, name):
+            raise RuntimeError("embedding unavailable")
+
+    monkeypatch.setattr(client, "_client", BrokenClient())
+    monkeypatch.setattr(
+        client,
+        "get_all_mentors",
+        lambda filters, pagination, precise_count=False, fields=None: {
+            "data": [{"id": "a", "member_id": "m1"}, {"id": "b", "member_id": "m1"}],
+            "count": 2,
+        },
+    )
+
+    def get_members_by_ids(ids):
+        calls.append(list(ids))
+        return {"m1": {"id": "m1", "name": "Ada"}}
+
+    monkeypatch.setattr(client, "get_members_by_ids", get_members_by_ids)
+    monkeypatch.setattr(SupabaseMentorshipClient, "_listing_cache", TTLCache())
+    result = client.get_mentors_with_member_data()
+    assert len(calls) == 1
+    assert [m["name"] for m in result["data"]] == ["Ada", "Ada"]
+    assert result["count"] == 2
+
+
+def test_mentor_list_fallback_leaves_cached_rows_untouched(monkeypatch):
+    client = SupabaseMentorshipClient()
+    rows = [{"id": "a", "member_id": "m1"}]
+
+    class Client:
+        def table(self, name):
+            query = RecordingQuery()
+
+            def execute():
+                if any(call[0] == "select" and "member:" in call[1] for call in query.calls):
+                    raise RuntimeError("embedding unavailable")
+                return type("Response", (), {"data": [dict(row) for row in rows], "count": 1})()
+
+            query.execute = execute
+            return query
+
+    monkeypatch.setattr(client, "_client", Client())
+    monkeypatch.setattr(
+        client, "get_members_by_ids", lambda ids: {"m1": {"id": "m1", "name": "Ada"}}
+    )
+    monkeypatch.setattr(SupabaseMentorshipClient, "_listing_cache", TTLCache())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_stale_cache", TTLCache())
+
+    first = client.get_mentors_with_member_data(member_fields=("name",))
+    second = client.get_mentors_with_member_data(member_fields=("name", "city"))
+    assert first["data"][0]["name"] == second["data"][0]["name"] == "Ada"
+    cached = client.get_all_mentors()["data"]
+    assert cached == rows
+    cached[0]["bio"] = "edited"
+    assert "bio" not in client.get_all_mentors()["data"][0]
+
+
+def test_circuit_breaker_retries_transient_errors(monkeypatch):
+    monkeypatch.setattr("apps.mentorship.supabase_client.time.sleep", lambda s: None)
+    breaker = CircuitBreaker(failure_threshold=3)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise APIError({"message": "Bad gateway", "code": 502})
+        return "ok"
+
+    assert breaker.call(flaky, idempotent=True) == "ok"
+    assert len(attempts) == 3
+    assert breaker.failures == 0
+
+
+def test_circuit_breaker_does_not_retry_sent_writes(monkeypatch):
+    monkeypatch.setattr("apps.mentorship.supabase_client.time.sleep", lambda s: None)
+    breaker = CircuitBreaker(failure_threshold=5)
+    attempts = []
+
+    def write():
+        attempts.append(1)
+        raise httpx.ReadTimeout("timed out")
+
+    with pytest.raises(httpx.ReadTimeout):
+        breaker.call(write)
+    assert len(attempts) == 1
+
+
+def test_circuit_breaker_retries_writes_that_never_connected(monkeypatch):
+    monkeypatch.setattr("apps.mentorship.supabase_client.time.sleep", lambda s: None)
+    breaker = CircuitBreaker()
+    attempts = []
+
+    def write():
+        attempts.append(1)
+        if len(attempts) < 2:
+            raise httpx.ConnectError("connection refused")
+        return "ok"
+
+    assert breaker.call(write) == "ok"
+    assert len(attempts) == 2
+
+
+def test_circuit_breaker_retries_postgrest_pool_timeouts(monkeypatch):
+    monkeypatch.setattr("apps.mentorship.supabase_client.time.sleep", lambda s: None)
+    breaker = CircuitBreaker()
+    attempts = []
+
+    def pool_timeout():
+        attempts.append(1)
+        if len(attempts) < 2:
+            raise APIError(
+                {
+                    "message": "Timed out acquiring connection from connection pool.",
+                    "code": "PGRST003",
+                }
+            )
+        return "ok"
+
+    assert breaker.call(pool_timeout) == "ok"
+    assert len(attempts) == 2
+    assert breaker.failures == 0
+
+
+def test_circuit_breaker_does_not_retry_client_errors(monkeypatch):
+    monkeypatch.setattr("apps.mentorship.supabase_client.time.sleep", lambda s: None)
+    breaker = CircuitBreaker()
+    attempts = []
+
+    def bad_request():
+        attempts.append(1)
+        raise APIError({"message": "duplicate key", "code": "23505"})
+
+    with pytest.raises(APIError):
+        breaker.call(bad_request)
+    assert len(attempts) == 1
+    assert breaker.failures == 0  # client errors are not outages
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        ({"message": "duplicate key", "code": "23505"}, True),
+        ({"message": "function not found", "code": "PGRST202"}, True),
+        ({"message": "not found", "code": 404}, True),
+        ({"message": "too many requests", "code": 429}, False),
+        ({"message": "bad gateway", "code": 502}, False),
+        ({"message": "pool timeout", "code": "PGRST003"}, False),
+        ({"message": "statement timeout", "code": "57014"}, False),
+    ],
+)
+def test_is_client_error(error, expected):
+    assert _is_client_error(APIError(error)) is expected
+
+
+def test_circuit_breaker_half_open_limits_probes(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("apps.mentorship.supabase_client.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(
+        failure_threshold=1, timeout=30, max_attempts=1, half_open_max=2, success_threshold=2
+    )
+
+    def fail():
+        raise APIError({"message": "statement timeout", "code": "57014"})
+
+    with pytest.raises(APIError):
+        breaker.call(fail)
+    assert breaker.state == "OPEN"
+
+    now[0] += 31
+    assert breaker._before_call() is True  # first two callers become probes
+    assert breaker._before_call() is True
+    assert breaker.state == "HALF_OPEN"
+    with pytest.raises(CircuitOpenError, match="HALF_OPEN"):
+        breaker.call(lambda: "ok")
+
+    breaker._half_open_in_flight = 0
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == "HALF_OPEN"  # one success is below success_threshold
+    assert breaker.call(lambda: "ok") == "ok"
+    assert (breaker.state, breaker.failures) == ("CLOSED", 0)
+
+
+def test_circuit_breaker_half_open_probe_failure_reopens(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("apps.mentorship.supabase_client.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=1, timeout=30, max_attempts=1)
+
+    def fail():
+        raise APIError({"message": "statement timeout", "code": "57014"})
+
+    with pytest.raises(APIError):
+        breaker.call(fail)
+    now[0] += 31
+    assert breaker.call(lambda: "ok") == "ok"
+    with pytest.raises(APIError):
+        breaker.call(fail)
+    assert breaker.state == "OPEN"
+
+
+def test_circuit_breakers_are_isolated_per_table():
+    client = SupabaseMentorshipClient()
+    members = client._cb("members")
+    assert client._cb("members") is members
+    assert client._cb("mentors") is not members
+    assert members.name == "members"
+
+
+def test_run_concurrently_preserves_call_order():
+    assert run_concurrently(lambda: 1, lambda: 2, lambda: 3) == [1, 2, 3]
+
+
+def test_sync_mentor_falls_back_when_rpc_missing(monkeypatch):
+    client = SupabaseMentorshipClient()
+
+    class MissingRpcClient:
+        def rpc(self, name, params):
+            raise APIError({"message": "function not found", "code": "PGRST202"})
+
+    monkeypatch.setattr(client, "_client", MissingRpcClient())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_missing_rpcs", set())
+    monkeypatch.setattr(
+        client, "_sync_mentor_from_member_client_side", lambda email, user_id: {"id": "m1"}
+    )
+    assert client.sync_mentor_from_member("a@example.com", 1) == {"id": "m1"}
+    assert "sync_mentor_from_member" in SupabaseMentorshipClient._missing_rpcs
+
+
+def test_merge_member_fields_flattens_member():
+    mentor = {"id": "a", "member": {"name": "Ada", "city": None}}
+    enriched = _merge_member_fields(mentor, ("name", "city", "school"))
+    assert enriched["name"] == "Ada"
+    assert enriched["city"] is None
+    assert enriched["school"] == ""
+    assert "member" not in enriched
+    assert enriched["member_data"] == {"name": "Ada", "city": None}
+
+
+def test_mentor_projection_embeds_only_flattened_member_fields():
+    embedded = _MENTOR_WITH_MEMBER.split("member:member_id(", 1)[1].rstrip(")")
+    assert embedded.split(",") == ["id", *_MEMBER_FIELDS]
+
+
+def test_is_healthy_reuses_recent_probe(monkeypatch):
+    client = SupabaseMentorshipClient()
+    probes = []
+
+    class Query:
+        def select(self, *columns, **kwargs):
+            return self
+
+        def limit(self, n):
+            return self
+
+        def execute(self):
+            probes.append(1)
+
+    class HealthyClient:
+        def rpc(self, name, params):
+            assert name == "ping"
+            return Query()
+
+    monkeypatch.setattr(client, "_client", HealthyClient())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_circuit_breakers", {})
+    monkeypatch.setattr(SupabaseMentorshipClient, "_health_cache", (0.0, False))
+    monkeypatch.setattr("apps.mentorship.supabase_client.time.monotonic", lambda: 1000.0)
+    assert client.is_healthy() is True
+    assert client.is_healthy() is True
+    assert len(probes) == 1
+
+
+def test_is_healthy_fails_fast_on_open_breaker(monkeypatch):
+    client = SupabaseMentorshipClient()
+    breaker = CircuitBreaker(name="mentors")
+    breaker.state = "OPEN"
+    monkeypatch.setattr(client, "_client", object())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_circuit_breakers", {"mentors": breaker})
+    monkeypatch.setattr(SupabaseMentorshipClient, "_health_cache", (0.0, True))
+    assert client.is_healthy() is False
+
+
+def test_is_healthy_trusts_recent_successful_call(monkeypatch):
+    client = SupabaseMentorshipClient()
+    breaker = CircuitBreaker(name="mentors")
+    monkeypatch.setattr("apps.mentorship.supabase_client.time.monotonic", lambda: 1000.0)
+    breaker.call(lambda: "ok")
+
+    class NoNetwork:
+        def table(self, name):
+            raise AssertionError("health check should not hit the network")
+
+    monkeypatch.setattr(client, "_client", NoNetwork())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_circuit_breakers", {"mentors": breaker})
+    monkeypatch.setattr(SupabaseMentorshipClient, "_health_cache", (0.0, False))
+    assert client.is_healthy() is True
+
+
+class RecordingQuery:
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        def record(*args, **kwargs):
+            self.calls.append((name, *args))
+            return self
+
+        return record
+
+
+def test_apply_mentor_filters_and_pagination():
+    query = RecordingQuery()
+    SupabaseMentorshipClient._apply_mentor_filters(query, {"expertise": ["AI"], "min_rating": 4})
+    SupabaseMentorshipClient._apply_pagination(query, {"page": 3, "page_size": 10})
+    assert query.calls == [
+        ("contains", "expertise", ["AI"]),
+        ("gte", "rating", 4),
+        ("range", 20, 29),
+    ]
+
+
+def test_apply_mentor_filters_without_filters_is_noop():
+    query = RecordingQuery()
+    SupabaseMentorshipClient._apply_mentor_filters(query, None)
+    SupabaseMentorshipClient._apply_pagination(query, None)
+    assert query.calls == []
+
+
+def test_get_member_id_by_email_matches_lowercased_email(monkeypatch):
+    client = SupabaseMentorshipClient()
+    query = RecordingQuery()
+    query.execute = lambda: type("Response", (), {"data": [{"id": "m1"}]})()
+
+    class FakeClient:
+        def table(self, name):
+            return query
+
+    monkeypatch.setattr(client, "_client", FakeClient())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_member_cache", TTLCache())
+    assert client.get_member_id_by_email(" Ada@Example.com ") == "m1"
+    assert ("eq", "email", "ada@example.com") in query.calls
+
+
+def test_call_execute_runs_prebuilt_query():
+    class Query:
+        def execute(self):
+            return "rows"
+
+    assert CircuitBreaker().call_execute(Query()) == "rows"
+
+
+def test_update_mentor_profile_rejects_stale_version_from_cache(monkeypatch):
+    client = SupabaseMentorshipClient()
+    cache = TTLCache()
+    cache.set((1, ""), {"id": "mentor-1", "version": 3})
+
+    class NoNetwork:
+        def table(self, name):
+            raise AssertionError("stale write should not reach Supabase")
+
+    monkeypatch.setattr(SupabaseMentorshipClient, "_mentor_cache", cache)
+    monkeypatch.setattr(client, "_client", NoNetwork())
+    with pytest.raises(StaleWriteError):
+        client.update_mentor_profile("mentor-1", {"bio": "hi"}, expected_version=2)
+
+
+def test_update_mentor_profile_refreshes_cached_profile(monkeypatch):
+    client = SupabaseMentorshipClient()
+    cache = TTLCache()
+    cache.set((1, ""), {"id": "mentor-1", "version": 2, "bio": "old", "name": "Ada"})
+    query = RecordingQuery()
+    query.execute = lambda: type(
+        "Response", (), {"data": [{"id": "mentor-1", "version": 3, "bio": "new"}]}
+    )()
+
+    class FakeClient:
+        def table(self, name):
+            return query
+
+    monkeypatch.setattr(SupabaseMentorshipClient, "_mentor_cache", cache)
+    monkeypatch.setattr(client, "_client", FakeClient())
+    client.update_mentor_profile("mentor-1", {"bio": "new"}, expected_version=2)
+    assert ("eq", "version", 2) in query.calls
+    assert cache.get((1, "")) == {"id": "mentor-1", "version": 3, "bio": "new", "name": "Ada"}
+
+
+def test_now_iso_is_utc_and_memoized_per_second(monkeypatch):
+    monkeypatch.setattr("apps.mentorship.supabase_client.time.time", lambda: 1700000000.7)
+    first = _now_iso()
+    assert first == "2023-11-14T22:13:20+00:00"
+    assert _now_iso() is first
+
+
+def test_today_iso_is_utc_date(monkeypatch):
+    monkeypatch.setattr("apps.mentorship.supabase_client.time.time", lambda: 1700000000.7)
+    assert _today_iso() == "2023-11-14"
+
+
+def test_bulk_create_availability_slots_uses_one_insert(monkeypatch):
+    client = SupabaseMentorshipClient()
+    inserts = []
+
+    class Table:
+        def insert(self, rows, **kwargs):
+            inserts.append(rows)
+            return self
+
+        def execute(self):
+            return type("Response", (), {"data": [{"id": i} for i, _ in enumerate(inserts[0])]})()
+
+    class FakeClient:
+        def table(self, name):
+            return Table()
+
+    monkeypatch.setattr(client, "_client", FakeClient())
+    slots = [
+        {
+            "mentor_id": "m1",
+            "start_time": "09:00",
+            "end_time": "10:00",
+            "is_recurring": True,
+            "day_of_week": 1,
+        },
+        {
+            "mentor_id": "m1",
+            "start_time": "11:00",
+            "end_time": "12:00",
+            "specific_date": "2026-01-05",
+        },
+    ]
+    assert len(client.bulk_create_availability_slots(slots)) == 2
+    assert len(inserts) == 1
+    assert inserts[0][0]["day_of_week"] == 1
+    assert inserts[0][1]["specific_date"] == "2026-01-05"
+
+
+def test_get_mentee_bookings_filters_on_embedded_email(monkeypatch):
+    client = SupabaseMentorshipClient()
+    query = RecordingQuery()
+    query.execute = lambda: type(
+        "Response", (), {"data": [{"id": "b1", "mentee": {"email": "ada@example.com"}}]}
+    )()
+
+    class FakeClient:
+        def table(self, name):
+            return query
+
+    monkeypatch.setattr(client, "_client", FakeClient())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_member_cache", TTLCache())
+    assert client.get_mentee_bookings(7, email="Ada@Example.com") == [{"id": "b1"}]
+    assert ("eq", "mentee.email", "ada@example.com") in query.calls
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor("2026-01-01T10:00:00+00:00", "r1")
+    assert decode_cursor(cursor) == ["2026-01-01T10:00:00+00:00", "r1"]
+    assert decode_cursor("not-a-cursor") is None
+    assert decode_cursor(None) is None
+
+
+def test_get_mentor_reviews_page_continues_after_cursor(monkeypatch):
+    client = SupabaseMentorshipClient()
+    query = RecordingQuery()
+    rows = [{"id": REVIEW_2, "created_at": "2026-01-01T09:00:00+00:00"}]
+    query.execute = lambda: type("Response", (), {"data": rows})()
+
+    class FakeClient:
+        def table(self, name):
+            return query
+
+    monkeypatch.setattr(client, "_client", FakeClient())
+    cursor = encode_cursor("2026-01-01T10:00:00+00:00", REVIEW_1)
+    result = client.get_mentor_reviews_page("m1", cursor, page_size=1)
+    assert (
+        "or_",
+        'created_at.lt."2026-01-01T10:00:00+00:00",'
+        f'and(created_at.eq."2026-01-01T10:00:00+00:00",id.lt.{REVIEW_1})',
+    ) in query.calls
+    assert result["data"] == rows
+    assert decode_cursor(result["next_cursor"]) == ["2026-01-01T09:00:00+00:00", REVIEW_2]
+
+
+@pytest.mark.parametrize(
+    "position",
+    [
+        ["2026-01-01T10:00:00+00:00"],
+        "2026-01-01",
+        {"a": 1},
+        [None, REVIEW_1],
+        ['2026-01-01",id.gt.(0', REVIEW_1],
+        ["2026-01-01T10:00:00+00:00", "r1) ,id.gt.(0"],
+    ],
+)
+def test_review_cursor_position_rejects_malformed_cursors(position):
+    assert review_cursor_position(_raw_cursor(position)) is None
+
+
+def test_search_mentors_pages_by_rating_cursor(monkeypatch):
+    client = SupabaseMentorshipClient()
+    query = RecordingQuery()
+    rows = [{"id": MENTOR_2, "rating": 4.5, "member": {}}]
+    query.execute = lambda: type("Response", (), {"data": rows, "count": None})()
+
+    class FakeClient:
+        def table(self, name):
+            return query
+
+    monkeypatch.setattr(client, "_client", FakeClient())
+    pagination = {"page_size": 1, "cursor": encode_cursor(4.8, MENTOR_1)}
+    result = client.search_mentors({"query": "data"}, pagination)
+    assert ("filter", "search_tsv", "wfts(english)", "data") in query.calls
+    assert ("or_", f"rating.lt.4.8,and(rating.eq.4.8,id.lt.{MENTOR_1})") in query.calls
+    assert ("limit", 1) in query.calls
+    assert decode_cursor(result["next_cursor"]) == [4.5, MENTOR_2]
+
+
+def test_update_mentor_rating_uses_rpc_result(monkeypatch):
+    client = SupabaseMentorshipClient()
+    calls = []
+
+    class RpcClient:
+        def rpc(self, name, params):
+            calls.append((name, params))
+            query = RecordingQuery()
+            query.execute = lambda: type("Response", (), {"data": 4.25})()
+            return query
+
+    monkeypatch.setattr(client, "_client", RpcClient())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_missing_rpcs", set())
+    assert client.update_mentor_rating("mentor-1") == 4.25
+    assert calls == [("recalc_mentor_rating", {"p_mentor_id": "mentor-1"})]
+
+
+def test_get_expertise_categories_is_cached(monkeypatch):
+    client = SupabaseMentorshipClient()
+    requests = []
+
+    class FakeClient:
+        def table(self, name):
+            requests.append(name)
+            query = RecordingQuery()
+            query.execute = lambda: type("Response", (), {"data": [{"name": "AI"}]})()
+            return query
+
+    monkeypatch.setattr(client, "_client", FakeClient())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_expertise_cache", TTLCache(maxsize=1, ttl=600))
+    assert client.get_expertise_categories() == [{"name": "AI"}]
+    assert client.get_expertise_categories() == [{"name": "AI"}]
+    assert requests == ["mentorship_expertise"]
+
+
+def test_enrich_bookings_fetches_mentors_once(monkeypatch):
+    client = SupabaseMentorshipClient()
+    queries = []
+
+    class FakeClient:
+        def table(self, name):
+            query = RecordingQuery()
+            query.execute = lambda: type(
+                "Response", (), {"data": [{"id": "m1", "rating": 5, "member": {"name": "Ada"}}]}
+            )()
+            queries.append(query)
+            return query
+
+    monkeypatch.setattr(client, "_client", FakeClient())
+    enriched = client.enrich_bookings(
+        [{"id": "b1", "mentor_id": "m1"}, {"id": "b2", "mentor_id": "m1"}]
+    )
+    assert len(queries) == 1
+    assert [b["mentor"]["name"] for b in enriched] == ["Ada", "Ada"]
+
+
+def test_check_booking_conflicts_falls_back_to_overlap_check(monkeypatch):
+    client = SupabaseMentorshipClient()
+    query = RecordingQuery()
+    query.execute = lambda: type(
+        "Response",
+        (),
+        {"data": [{"id": "b1", "session_date": "2026-03-02T10:30:00Z", "duration_minutes": 60}]},
+    )()
+
+    class FakeClient:
+        def rpc(self, name, params):
+            raise APIError({"message": "function not found", "code": "PGRST202"})
+
+        def table(self, name):
+            return query
+
+    monkeypatch.setattr(client, "_client", FakeClient())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_missing_rpcs", set())
+    assert client.check_booking_conflicts("m1", "2026-03-02", "10:00", "11:00") is True
+    assert client.check_booking_conflicts("m1", "2026-03-02", "11:30", "12:30") is False
+
+
+def test_upload_mentor_photo_streams_spooled_uploads(monkeypatch):
+    from django.core.files.uploadedfile import TemporaryUploadedFile
+
+    client = SupabaseMentorshipClient()
+    uploaded = []
+
+    class Bucket:
+        def upload(self, path, file, options):
+            assert not file.closed
+            uploaded.append(file)
+
+    class Storage:
+        def from_(self, bucket):
+            return Bucket()
+
+    fake_client = type(
+        "FakeClient", (), {"storage": Storage(), "storage_url": "https://x.supabase.co/storage/v1"}
+    )
+    monkeypatch.setattr(client, "_client", fake_client())
+    photo = TemporaryUploadedFile("me.png", "image/png", 3, None)
+    photo.write(b"png")
+    photo.seek(0)
+    url = client.upload_mentor_photo("m1", photo)
+    assert [file.name for file in uploaded] == [photo.temporary_file_path()]
+    assert uploaded[0].closed
+    assert url.startswith(
+        "https://x.supabase.co/storage/v1/object/public/mentors-profile/mentors/mentor_m1_"
+    )
+    assert url.endswith(".png")
+
+
+def test_get_mentor_stats_maps_rpc_aggregate(monkeypatch):
+    client = SupabaseMentorshipClient()
+    payload = {
+        "total": 5,
+        "by_status": {"completed": 3, "pending": 2},
+        "upcoming": 2,
+        "reviews": {"count": 3, "avg": 4.667},
+    }
+
+    class RpcClient:
+        def rpc(self, name, params):
+            query = RecordingQuery()
+            query.execute = lambda: type("Response", (), {"data": payload})()
+            return query
+
+    monkeypatch.setattr(client, "_client", RpcClient())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_missing_rpcs", set())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_stats_cache", TTLCache())
+    stats = client.get_mentor_stats("m1")
+    assert stats["total_bookings"] == 5
+    assert stats["completed_sessions"] == 3
+    assert stats["cancelled_sessions"] == 0
+    assert stats["upcoming_sessions"] == 2
+    assert stats["total_reviews"] == 3
+    assert stats["average_rating"] == 4.67
+
+
+def test_get_mentee_stats_maps_rpc_aggregate(monkeypatch):
+    client = SupabaseMentorshipClient()
+    payload = {
+        "total": 4,
+        "by_status": {"confirmed": 1, "completed": 3},
+        "upcoming": 1,
+        "unique_mentors": 2,
+    }
+
+    class RpcClient:
+        def rpc(self, name, params):
+            assert (name, params) == ("get_mentee_stats", {"p_id": "me1"})
+            query = RecordingQuery()
+            query.execute = lambda: type("Response", (), {"data": payload})()
+            return query
+
+    monkeypatch.setattr(client, "_client", RpcClient())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_missing_rpcs", set())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_stats_cache", TTLCache())
+    stats = client.get_mentee_stats("me1")
+    assert stats["total_bookings"] == 4
+    assert stats["confirmed_sessions"] == 1
+    assert stats["upcoming_sessions"] == 1
+    assert stats["unique_mentors_count"] == 2
+
+
+def test_search_mentor_count_is_cached_per_filters(monkeypatch):
+    client = SupabaseMentorshipClient()
+    queries = []
+
+    class FakeClient:
+        def table(self, name):
+            query = RecordingQuery()
+            query.execute = lambda: type("Response", (), {"data": [], "count": 42})()
+            queries.append(query)
+            return query
+
+    monkeypatch.setattr(client, "_client", FakeClient())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_search_count_cache", TTLCache())
+    assert client._search_mentor_count({"query": "data"}) == 42
+    assert client._search_mentor_count({"query": "data"}) == 42
+    assert len(queries) == 1
+
+
+def test_core_supabase_client_is_reused(monkeypatch):
+    import apps.core as core
+
+    created = []
+    monkeypatch.setattr(core, "create_client", lambda url, key: created.append(url) or object())
+    core._cached_client.cache_clear()
+    monkeypatch.setenv("SUPABASE_URL", "https://x.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "key")
+    assert core.get_supabase_client() is core.get_supabase_client()
+    assert created == ["https://x.supabase.co"]
+    core._cached_client.cache_clear()
+
+
+def test_mentor_stats_fallback_combines_concurrent_queries(monkeypatch):
+    client = SupabaseMentorshipClient()
+    responses = {
+        "mentorship_bookings": type("Response", (), {"data": [
+            {"status": "completed", "session_date": "2020-01-01T09:00:00+00:00"},
+            {"status": "pending", "session_date": "2999-01-01T09:00:00+00:00"},
+            {"status": "confirmed", "session_date": "2020-01-02T09:00:00+00:00"},
+        ], "count": 3}),
+        "mentorship_reviews": type("Response", (), {"data": [{"id": "r1"}], "count": 2}),
+        "mentors": type("Response", (), {"data": [{"rating": "4.50"}], "count": None}),
+    }
+
+    class FakeClient:
+        def table(self, name):
+            query = RecordingQuery()
+            query.execute = lambda: responses[name]()
+            return query
+
+    monkeypatch.setattr(client, "_client", FakeClient())
+    stats = client._get_mentor_stats_client_side("m1")
+    assert stats["total_bookings"] == 3
+    assert stats["pending_sessions"] == 1
+    assert stats["upcoming_sessions"] == 1
+    assert stats["average_rating"] == 4.5
+
+
+def test_mentor_stats_cached_until_booking_write(monkeypatch):
+    client = SupabaseMentorshipClient()
+    rpc_calls = []
+
+    class FakeClient:
+        def rpc(self, name, params):
+            rpc_calls.append(name)
+            query = RecordingQuery()
+            query.execute = lambda: type("Response", (), {"data": {"total": len(rpc_calls)}})()
+            return query
+
+        def table(self, name):
+            query = RecordingQuery()
+            query.execute = lambda: type(
+                "Response", (), {"data": [{"id": "b1", "mentor_id": "m1", "mentee_id": "me1"}]}
+            )()
+            return query
+
+    monkeypatch.setattr(client, "_client", FakeClient())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_missing_rpcs", set())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_stats_cache", TTLCache())
+    assert client.get_mentor_stats("m1")["total_bookings"] == 1
+    assert client.get_mentor_stats("m1")["total_bookings"] == 1
+    assert len(rpc_calls) == 1
+
+    client.update_booking_status("b1", "confirmed")
+    assert client.get_mentor_stats("m1")["total_bookings"] == 2
+
+
+def test_module_client_is_built_lazily_once(monkeypatch):
+    from apps.mentorship import supabase_client as module
+
+    inits = []
+    monkeypatch.setattr(SupabaseMentorshipClient, "_instance", None)
+    monkeypatch.setattr(
+        SupabaseMentorshipClient, "_initialize_client", lambda self: inits.append(self)
+    )
+    assert inits == []
+    assert module.supabase_client.HEALTH_CHECK_TTL == 5
+    assert module.get_supabase_client() is SupabaseMentorshipClient()
+    assert len(inits) == 1
+
+
+def test_mentor_bookings_page_by_session_date_cursor(monkeypatch):
+    client = SupabaseMentorshipClient()
+    query = RecordingQuery()
+    rows = [
+        {"id": BOOKING_2, "session_date": "2026-03-02T09:00:00+00:00"},
+        {"id": BOOKING_1, "session_date": "2026-03-01T09:00:00+00:00"},
+    ]
+    query.execute = lambda: type("Response", (), {"data": rows})()
+
+    class FakeClient:
+        def table(self, name):
+            return query
+
+    monkeypatch.setattr(client, "_client", FakeClient())
+    cursor = encode_cursor("2026-03-03T09:00:00+00:00", BOOKING_3)
+    bookings = client.get_mentor_bookings("m1", limit=2, cursor=cursor)
+    assert (
+        "or_",
+        'session_date.lt."2026-03-03T09:00:00+00:00",'
+        f'and(session_date.eq."2026-03-03T09:00:00+00:00",id.lt.{BOOKING_3})',
+    ) in query.calls
+    assert ("limit", 2) in query.calls
+    next_position = decode_cursor(client.booking_page_cursor(bookings, 2))
+    assert next_position == ["2026-03-01T09:00:00+00:00", BOOKING_1]
+    assert client.booking_page_cursor(bookings, 3) is None
+
+
+def test_apply_booking_page_ignores_malformed_cursor():
+    query = RecordingQuery()
+    cursor = _raw_cursor(['2026-03-03",id.gt.(0', BOOKING_3])
+    SupabaseMentorshipClient._apply_booking_page(query, limit=2, cursor=cursor)
+    assert not any(call[0] == "or_" for call in query.calls)
+    assert booking_cursor_position(_raw_cursor([1])) is None
+
+
+def test_get_many_mentor_stats_batches_uncached_ids(monkeypatch):
+    client = SupabaseMentorshipClient()
+    rpc_calls = []
+
+    class RpcClient:
+        def rpc(self, name, params):
+            rpc_calls.append((name, params))
+            query = RecordingQuery()
+            query.execute = lambda: type(
+                "Response", (), {"data": {"m2": {"total": 4, "upcoming": 1}}}
+            )()
+            return query
+
+    monkeypatch.setattr(client, "_client", RpcClient())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_missing_rpcs", set())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_stats_cache", TTLCache())
+    SupabaseMentorshipClient._stats_cache.set(("mentor", "m1"), {"total_bookings": 9})
+
+    stats = client.get_many_mentor_stats(["m1", "m2", "m3", "m2"])
+    assert rpc_calls == [("get_many_mentor_stats", {"p_ids": ["m2", "m3"]})]
+    assert stats["m1"] == {"total_bookings": 9}
+    assert stats["m2"]["total_bookings"] == 4
+    assert stats["m3"]["total_bookings"] == 0
+    assert client.get_mentor_stats("m2")["upcoming_sessions"] == 1
+
+
+def test_mentor_stats_with_open_circuit_returns_empty_stats(monkeypatch, caplog):
+    client = SupabaseMentorshipClient()
+    breaker = CircuitBreaker(name="mentorship_bookings")
+    breaker.state, breaker.last_failure_time = "OPEN", float("inf")
+    monkeypatch.setattr(client, "_cb", lambda name: breaker)
+    monkeypatch.setattr(
+        client,
+        "_client",
+        type("FakeClient", (), {"rpc": lambda self, name, params: RecordingQuery()})(),
+    )
+    monkeypatch.setattr(SupabaseMentorshipClient, "_missing_rpcs", set())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_stats_cache", TTLCache())
+
+    with caplog.at_level("WARNING"):
+        stats = client.get_mentor_stats("m1")
+    assert stats["total_bookings"] == 0
+    stats["status_breakdown"]["pending"] = 1  # callers get a mutable copy
+    assert client.get_mentor_stats("m1")["status_breakdown"] == {}
+    stats_logs = [
+        record.levelname for record in caplog.records if "getting stats" in record.getMessage()
+    ]
+    assert stats_logs == ["WARNING", "WARNING"]
+
+
+def test_get_mentor_id_by_user_id_reads_only_id_and_caches(monkeypatch):
+    client = SupabaseMentorshipClient()
+    queries = []
+
+    class FakeClient:
+        def table(self, name):
+            query = RecordingQuery()
+            query.execute = lambda: type("Response", (), {"data": {"id": "m1"}})()
+            queries.append(query)
+            return query
+
+    monkeypatch.setattr(client, "_client", FakeClient())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_mentor_cache", TTLCache())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_mentor_id_cache", TTLCache())
+    assert client.get_mentor_id_by_user_id(7, "A@x.com") == "m1"
+    assert client.get_mentor_id_by_user_id(7, "a@x.com") == "m1"
+    assert len(queries) == 1
+    assert ("select", "id") in queries[0].calls
+
+    client.invalidate_mentor(mentor_id="m1")
+    client.get_mentor_id_by_user_id(7, "a@x.com")
+    assert len(queries) == 2
+
+
+def test_fast_json_response_hook_decodes_body():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=b'[{"id": 1}]'))
+    with httpx.Client(
+        transport=transport, event_hooks={'response': [_fast_json_response]}
+    ) as client:
+        response = client.get('https://example.test/rest/v1/mentors')
+    assert response.json() == [{'id': 1}]
+
+
+def test_fast_json_response_hook_keeps_decode_error_type():
+    transport = httpx.MockTransport(lambda request: httpx.Response(204, content=b''))
+    with httpx.Client(
+        transport=transport, event_hooks={'response': [_fast_json_response]}
+    ) as client:
+        response = client.get('https://example.test/rest/v1/mentors')
+    with pytest.raises(json.JSONDecodeError):
+        response.json()
+
+
+def test_singleflight_collapses_concurrent_identical_reads():
+    release = threading.Event()
+    calls = []
+
+    class Reader:
+        @singleflight
+        def read(self, mentor_id, filters=None):
+            calls.append(mentor_id)
+            release.wait(timeout=5)
+            return [{'id': mentor_id}]
+
+    reader = Reader()
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(reader.read('m1', filters={'a': 1})))
+        for _ in range(4)
+    ]
+    threads[0].start()
+    while not calls:
+        time.sleep(0.001)
+    (call,) = _inflight.values()
+    waiting = threading.Semaphore(0)
+    done = call.event
+
+    class CountingEvent:
+        def wait(self):
+            waiting.release()
+            done.wait()
+
+        def set(self):
+            done.set()
+
+    call.event = CountingEvent()
+    for thread in threads[1:]:
+        thread.start()
+    for _ in threads[1:]:
+        assert waiting.acquire(timeout=5)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ['m1']
+    assert results == [[{'id': 'm1'}]] * 4
+    assert len({id(result) for result in results}) == 4
+    assert reader.read('m1', filters={'a': 1}) == [{'id': 'm1'}]
+    assert calls == ['m1', 'm1']
+
+
+def test_availability_slots_cached_until_slot_write(monkeypatch):
+    client = SupabaseMentorshipClient()
+    executes = []
+    query = RecordingQuery()
+
+    def execute():
+        executes.append(1)
+        return type("Response", (), {"data": [{"id": "s1", "mentor_id": "mentor-1"}]})()
+
+    query.execute = execute
+
+    class FakeClient:
+        def table(self, name):
+            return query
+
+    monkeypatch.setattr(client, "_client", FakeClient())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_availability_cache", TTLCache())
+
+    assert client.get_availability_slots("mentor-1") == [{"id": "s1", "mentor_id": "mentor-1"}]
+    client.get_availability_slots("mentor-1")
+    assert len(executes) == 1
+
+    client.create_availability_slot({"mentor_id": "mentor-1", "day_of_week": 1})
+    client.get_availability_slots("mentor-1")
+    assert len(executes) == 3
+
+
+def test_bulkhead_fails_fast_when_saturated(monkeypatch):
+    monkeypatch.setitem(_bulkheads, "write", threading.BoundedSemaphore(1))
+    monkeypatch.setattr("apps.mentorship.supabase_client.BULKHEAD_WAIT_TIMEOUT", 0.01)
+    with _bulkhead("write"):
+        with pytest.raises(BulkheadFullError):
+            with _bulkhead("write"):
+                pass
+        with _bulkhead("read"):
+            pass
+    with _bulkhead("write"):
+        pass
+
+
+def test_call_execute_classifies_queries_by_http_method(monkeypatch):
+    kinds = []
+
+    class FakeBulkhead:
+        def __init__(self, kind):
+            kinds.append(kind)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    class Query:
+        def __init__(self, http_method):
+            self.http_method = http_method
+
+        def execute(self):
+            return "ok"
+
+    monkeypatch.setattr("apps.mentorship.supabase_client._bulkhead", FakeBulkhead)
+    breaker = CircuitBreaker()
+    breaker.call_execute(Query("GET"))
+    breaker.call_execute(Query("PATCH"))
+    breaker.call_execute(Query("POST"), kind="read")
+    assert kinds == ["read", "write", "read"]
+
+
+def test_sync_mentors_from_members_resolves_every_pair(monkeypatch):
+    client = SupabaseMentorshipClient()
+    # user 2 is linked already (even though their member is no longer a mentor),
+    # member mem-4 has an unlinked profile created by the members trigger
+    mentors_by_user = [{"id": "mentor-2", "user_id": 2, "member_id": "mem-2"}]
+    mentors_by_member = [{"id": "mentor-4", "user_id": None, "member_id": "mem-4"}]
+    members = [
+        {"id": "mem-1", "email": "a@example.com", "industry": "Tech", "skills": "Python, SQL"},
+        {"id": "mem-4", "email": "d@example.com"},
+    ]
+    queries = []
+
+    class FakeClient:
+        def table(self, name):
+            query = RecordingQuery()
+            queries.append((name, query))
+
+            def execute():
+                calls = dict((call[0], call[1:]) for call in query.calls)
+                if "upsert" in calls:
+                    rows = [row for row in calls["upsert"][0] if row["member_id"] != "mem-4"]
+                    data = [{**row, "id": "mentor-new"} for row in rows]
+                elif "update" in calls:
+                    data = [{**mentors_by_member[0], **calls["update"][0]}]
+                elif name == "members":
+                    data = members
+                elif calls["in_"][0] == "user_id":
+                    data = mentors_by_user
+                else:
+                    data = mentors_by_member
+                return type("Response", (), {"data": data})()
+
+            query.execute = execute
+            return query
+
+    monkeypatch.setattr(client, "_client", FakeClient())
+    synced = client.sync_mentors_from_members(
+        [("A@example.com ", 1), ("b@example.com", 2), ("c@example.com", 3), ("d@example.com", 4)]
+    )
+
+    assert [name for name, _ in queries] == ["mentors", "members", "mentors", "mentors", "mentors"]
+    member_emails = ["a@example.com", "c@example.com", "d@example.com"]
+    assert ("in_", "email", member_emails) in queries[1][1].calls
+    assert set(synced) == {1, 2, 4}
+    assert synced[2]["id"] == "mentor-2"
+    assert synced[4]["id"] == "mentor-4"
+    assert synced[4]["user_id"] == 4
+    assert synced[1]["member_id"] == "mem-1"
+    assert synced[1]["expertise"] == ["Tech", "Python", "SQL"]
+    upsert_rows = queries[2][1].calls[0][1]
+    assert [row["user_id"] for row in upsert_rows] == [1, 4]
+    assert ("in_", "member_id", ["mem-4"]) in queries[3][1].calls
+    link = queries[4][1].calls
+    assert ("eq", "id", "mentor-4") in link and ("is_", "user_id", "null") in link
+
+
+def test_sync_mentors_from_members_skips_member_lookup_when_linked(monkeypatch):
+    client = SupabaseMentorshipClient()
+    queries = []
+
+    class FakeClient:
+        def table(self, name):
+            query = RecordingQuery()
+            queries.append(name)
+            query.execute = lambda: type("Response", (), {"data": [{"id": "m1", "user_id": 1}]})()
+            return query
+
+    monkeypatch.setattr(client, "_client", FakeClient())
+    assert client.sync_mentors_from_members([("a@example.com", 1)]) == {
+        1: {"id": "m1", "user_id": 1}
+    }
+    assert queries == ["mentors"]
+
+
+def test_get_all_mentors_serves_stale_page_while_circuit_open(monkeypatch):
+    client = SupabaseMentorshipClient()
+    query = RecordingQuery()
+    query.execute = lambda: type("Response", (), {"data": [{"id": "m1"}], "count": 1})()
+
+    class FakeClient:
+        def table(self, name):
+            return query
+
+    breaker = CircuitBreaker(name="mentors")
+    monkeypatch.setattr(client, "_client", FakeClient())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_circuit_breakers", {"mentors": breaker})
+    monkeypatch.setattr(SupabaseMentorshipClient, "_listing_cache", TTLCache())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_stale_cache", TTLCache())
+
+    assert client.get_all_mentors() == {"data": [{"id": "m1"}], "count": 1}
+    SupabaseMentorshipClient._listing_cache.clear()
+    breaker.state, breaker.last_failure_time = "OPEN", time.monotonic()
+
+    assert client.get_all_mentors() == {"data": [{"id": "m1"}], "count": 1}
+    with pytest.raises(CircuitOpenError):
+        client.get_all_mentors({"min_rating": 4})
+
+
+def test_apply_mentor_page_uses_rating_keyset_after_cursor():
+    query = RecordingQuery()
+    cursor = encode_cursor(4.5, MENTOR_3)
+    SupabaseMentorshipClient._apply_mentor_page(
+        query, {"page": 7, "page_size": 2, "cursor": cursor}
+    )
+    assert query.calls == [
+        ("or_", f"rating.lt.4.5,and(rating.eq.4.5,id.lt.{MENTOR_3})"),
+        ("limit", 2),
+        ("order", "rating"),
+        ("order", "id"),
+    ]
+    mentors = [{"id": MENTOR_2, "rating": 4.5}, {"id": MENTOR_1, "rating": 4.0}]
+    assert decode_cursor(SupabaseMentorshipClient.mentor_page_cursor(mentors, 2)) == [4.0, MENTOR_1]
+    assert SupabaseMentorshipClient.mentor_page_cursor(mentors, 3) is None
+    unrated = [{"id": MENTOR_1, "rating": None}]
+    assert SupabaseMentorshipClient.mentor_page_cursor(unrated, 1) is None
+
+
+@pytest.mark.parametrize(
+    "position",
+    [[1], 5, {"a": 1}, [None, MENTOR_1], [True, MENTOR_1], [1, "x) ,id.gt.(0"], [1, MENTOR_1, 2]],
+)
+def test_apply_mentor_page_ignores_malformed_cursor(position):
+    query = RecordingQuery()
+    SupabaseMentorshipClient._apply_mentor_page(query, {"page": 1, "cursor": _raw_cursor(position)})
+    assert mentor_cursor_position(_raw_cursor(position)) is None
+    assert query.calls == [("range", 0, 11), ("order", "rating"), ("order", "id")]
+
+
+def test_get_mentors_by_user_ids_fetches_misses_in_one_query(monkeypatch):
+    client = SupabaseMentorshipClient()
+    cache = TTLCache()
+    cache.set((1, ""), {"id": "mentor-1", "user_id": 1})
+    query = RecordingQuery()
+    query.execute = lambda: type(
+        "Response", (), {"data": [{"id": "mentor-2", "user_id": 2, "member": {"name": "Ada"}}]}
+    )()
+
+    class FakeClient:
+        def table(self, name):
+            return query
+
+    monkeypatch.setattr(client, "_client", FakeClient())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_mentor_cache", cache)
+
+    mentors = client.get_mentors_by_user_ids([1, 2, 3, 2])
+    assert set(mentors) == {1, 2}
+    assert mentors[2]["name"] == "Ada"
+    assert ("in_", "user_id", [2, 3]) in query.calls
+    assert client.get_mentor_by_user_id(2)["id"] == "mentor-2"
+
+
+def test_mentor_columns_projection():
+    assert _mentor_columns() == "*"
+    assert _mentor_columns(embed_member=True) == _MENTOR_WITH_MEMBER
+    assert _mentor_columns(("bio", "id")) == "id,rating,member_id,bio"
+    assert _mentor_columns(("bio",), ("name",), embed_member=True) == (
+        "id,rating,member_id,bio, member:member_id(id,name)"
+    )
+
+
+def test_listing_count_skipped_on_keyset_pages():
+    assert _listing_count() == "estimated"
+    assert _listing_count(precise=True) == "exact"
+    assert _listing_count(pagination={"page": 2, "cursor": None}) == "estimated"
+    assert _listing_count(pagination={"cursor": encode_cursor(4.5, MENTOR_1)}) is None
+
+
+def test_ping_falls_back_to_table_probe_without_rpc(monkeypatch):
+    client = SupabaseMentorshipClient()
+    probes = []
+
+    class MissingRpc:
+        def execute(self):
+            raise APIError({"message": "function not found", "code": "PGRST202"})
+
+    class FakeClient:
+        def rpc(self, name, params):
+            probes.append("rpc")
+            return MissingRpc()
+
+        def table(self, name):
+            probes.append(name)
+            query = RecordingQuery()
+            query.execute = lambda: None
+            return query
+
+    monkeypatch.setattr(client, "_client", FakeClient())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_missing_rpcs", set())
+    client._ping()
+    client._ping()
+    assert probes == ["rpc", "mentorship_expertise", "mentorship_expertise"]
+
+
+def test_bulk_update_booking_status_single_request(monkeypatch):
+    client = SupabaseMentorshipClient()
+    query = RecordingQuery()
+    executes = []
+
+    def execute():
+        executes.append(1)
+        return type(
+            "Response", (), {"data": [{"id": "b1", "mentor_id": "m1", "mentee_id": "e1"}]}
+        )()
+
+    query.execute = execute
+
+    class FakeClient:
+        def table(self, name):
+            return query
+
+    stats = TTLCache()
+    stats.set(("mentor", "m1"), {"total_bookings": 3})
+    monkeypatch.setattr(client, "_client", FakeClient())
+    monkeypatch.setattr(SupabaseMentorshipClient, "_stats_cache", stats)
+
+    updated = client.bulk_update_booking_status(
+        ["b1", "b2", "b1"], "cancelled", from_statuses=("pending",)
+    )
+    assert [booking["id"] for booking in updated] == ["b1"]
+    assert len(executes) == 1
+    assert ("in_", "id", ["b1", "b2"]) in query.calls
+    assert ("in_", "status", ["pending"]) in query.calls
+    assert stats.get(("mentor", "m1")) is None
+    assert client.bulk_update_booking_status([], "cancelled") == []